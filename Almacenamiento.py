@@ -0,0 +1,220 @@
+"""
+MOTORES DE ALMACENAMIENTO PARA LA PLATAFORMA DE CURSOS
+La plataforma trabaja siempre con sus objetos en memoria y notifica cada
+operación que modifica datos al motor configurado, que decide cómo persistirla.
+"""
+
+from datetime import datetime
+
+# CLASE BASE: ALMACENAMIENTO SOLO EN MEMORIA
+class Almacenamiento:
+    """
+    Motor de almacenamiento por defecto: no persiste nada.
+    Define los métodos que la plataforma invoca en cada operación ya validada,
+    antes de aplicarla en memoria: si un motor lanza una excepción la
+    operación se cancela. Los motores persistentes los sobrescriben.
+    """
+
+    def cargar(self):
+        """
+        Devuelve los datos persistidos como un diccionario de filas
+        ('usuarios', 'cursos', 'evaluaciones', 'inscripciones', 'calificaciones')
+        o None si no hay nada que cargar.
+        """
+        return None
+
+    def vincular(self, plataforma):
+        """Se invoca una vez cargados los datos con la plataforma que usa el motor"""
+        pass
+
+    def usuarios_registrados(self, usuarios):
+        """Se invoca con la lista de usuarios recién registrados"""
+        pass
+
+    def curso_creado(self, curso):
+        """Se invoca con cada curso recién creado"""
+        pass
+
+    def estudiantes_inscritos(self, curso_id, estudiante_ids):
+        """Se invoca con los IDs de estudiantes recién inscritos en un curso"""
+        pass
+
+    def evaluacion_creada(self, evaluacion):
+        """Se invoca con cada evaluación recién creada"""
+        pass
+
+    def calificaciones_registradas(self, evaluacion, estudiante_ids, calificaciones):
+        """Se invoca con las calificaciones recién registradas en una evaluación"""
+        pass
+
+    def reporte_promedios_bajos(self, curso_id, umbral):
+        """
+        Devuelve [(estudiante_id, promedio)] calculado por el motor, o None si
+        el motor no resuelve consultas y la plataforma debe usar la memoria.
+        """
+        return None
+
+    def cerrar(self):
+        """Libera los recursos del motor"""
+        pass
+
+# MOTOR SQLITE
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_normalizado TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_usuarios_email ON usuarios (email_normalizado);
+
+CREATE TABLE IF NOT EXISTS cursos (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    instructor_id INTEGER NOT NULL REFERENCES usuarios (id)
+);
+
+CREATE TABLE IF NOT EXISTS inscripciones (
+    curso_id INTEGER NOT NULL REFERENCES cursos (id),
+    estudiante_id INTEGER NOT NULL REFERENCES usuarios (id),
+    UNIQUE (curso_id, estudiante_id)
+);
+CREATE INDEX IF NOT EXISTS idx_inscripciones_estudiante ON inscripciones (estudiante_id);
+
+CREATE TABLE IF NOT EXISTS evaluaciones (
+    id INTEGER PRIMARY KEY,
+    curso_id INTEGER NOT NULL REFERENCES cursos (id),
+    tipo TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    puntaje_maximo REAL NOT NULL,
+    tiempo_limite INTEGER,
+    fecha_entrega TEXT,
+    fecha_es_datetime INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_evaluaciones_curso ON evaluaciones (curso_id);
+
+CREATE TABLE IF NOT EXISTS calificaciones (
+    evaluacion_id INTEGER NOT NULL REFERENCES evaluaciones (id),
+    estudiante_id INTEGER NOT NULL,
+    curso_id INTEGER NOT NULL,
+    calificacion REAL NOT NULL,
+    PRIMARY KEY (evaluacion_id, estudiante_id)
+);
+CREATE INDEX IF NOT EXISTS idx_calificaciones_curso ON calificaciones (curso_id, estudiante_id);
+"""
+
+# Sentencias fijas: sqlite3 las prepara una vez y las reutiliza desde su caché
+_INSERTAR_USUARIO = "INSERT INTO usuarios (id, tipo, nombre, email, email_normalizado) VALUES (?, ?, ?, ?, ?)"
+_INSERTAR_CURSO = "INSERT INTO cursos (id, nombre, instructor_id) VALUES (?, ?, ?)"
+_INSERTAR_INSCRIPCION = "INSERT INTO inscripciones (curso_id, estudiante_id) VALUES (?, ?)"
+_INSERTAR_EVALUACION = """
+INSERT INTO evaluaciones (id, curso_id, tipo, nombre, puntaje_maximo, tiempo_limite, fecha_entrega, fecha_es_datetime)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_GUARDAR_CALIFICACION = """
+INSERT INTO calificaciones (evaluacion_id, estudiante_id, curso_id, calificacion) VALUES (?, ?, ?, ?)
+ON CONFLICT (evaluacion_id, estudiante_id) DO UPDATE SET calificacion = excluded.calificacion
+"""
+# Promedio de cada inscrito (0 sin calificaciones), en orden de inscripción
+_PROMEDIOS_BAJOS = """
+SELECT i.estudiante_id, COALESCE(a.promedio, 0) AS promedio
+FROM inscripciones i
+LEFT JOIN (
+    SELECT estudiante_id, AVG(calificacion) AS promedio
+    FROM calificaciones
+    WHERE curso_id = ?
+    GROUP BY estudiante_id
+) a ON a.estudiante_id = i.estudiante_id
+WHERE i.curso_id = ? AND COALESCE(a.promedio, 0) < ?
+ORDER BY i.rowid
+"""
+
+class AlmacenamientoSQLite(Almacenamiento):
+    """
+    Motor que persiste la plataforma en un archivo SQLite local (modo WAL).
+    Con consultas_en_sql=True los reportes de promedios se resuelven con
+    agregados SQL en lugar de usar la matriz en memoria.
+    """
+
+    def __init__(self, ruta, consultas_en_sql=True):
+        import sqlite3  # Solo quien usa este motor paga la importación
+
+        self._ruta = ruta
+        self._consultas_en_sql = consultas_en_sql
+        self._conexion = sqlite3.connect(ruta, cached_statements=64)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.execute("PRAGMA foreign_keys=ON")
+        self._conexion.executescript(_ESQUEMA)
+
+    @property
+    def ruta(self):
+        return self._ruta
+
+    def cargar(self):
+        """Lee todas las tablas en el orden en que la plataforma las necesita"""
+        consulta = self._conexion.execute
+        evaluaciones = []
+        for fila in consulta("SELECT id, curso_id, tipo, nombre, puntaje_maximo, tiempo_limite, "
+                             "fecha_entrega, fecha_es_datetime FROM evaluaciones ORDER BY id"):
+            id_evaluacion, curso_id, tipo, nombre, puntaje_maximo, tiempo_limite, fecha_entrega, es_datetime = fila
+            if es_datetime:
+                fecha_entrega = datetime.fromisoformat(fecha_entrega)
+            evaluaciones.append((id_evaluacion, curso_id, tipo, nombre, puntaje_maximo,
+                                 {'tiempo_limite': tiempo_limite} if tipo == "examen" else {'fecha_entrega': fecha_entrega}))
+
+        return {
+            'usuarios': consulta("SELECT id, tipo, nombre, email FROM usuarios ORDER BY id").fetchall(),
+            'cursos': consulta("SELECT id, nombre, instructor_id FROM cursos ORDER BY id").fetchall(),
+            'evaluaciones': evaluaciones,
+            'inscripciones': consulta("SELECT curso_id, estudiante_id FROM inscripciones ORDER BY rowid").fetchall(),
+            'calificaciones': consulta("SELECT evaluacion_id, estudiante_id, calificacion FROM calificaciones "
+                                       "ORDER BY evaluacion_id").fetchall()
+        }
+
+    def usuarios_registrados(self, usuarios):
+        with self._conexion:
+            self._conexion.executemany(_INSERTAR_USUARIO, (
+                (usuario.id, usuario.obtener_tipo().lower(), usuario.nombre, usuario.email,
+                 usuario.email.strip().lower())
+                for usuario in usuarios
+            ))
+
+    def curso_creado(self, curso):
+        with self._conexion:
+            self._conexion.execute(_INSERTAR_CURSO, (curso.id, curso.nombre, curso.instructor_id))
+
+    def estudiantes_inscritos(self, curso_id, estudiante_ids):
+        with self._conexion:
+            self._conexion.executemany(_INSERTAR_INSCRIPCION,
+                                       ((curso_id, estudiante_id) for estudiante_id in estudiante_ids))
+
+    def evaluacion_creada(self, evaluacion):
+        tiempo_limite = getattr(evaluacion, 'tiempo_limite', None)
+        fecha_entrega = getattr(evaluacion, 'fecha_entrega', None)
+        es_datetime = isinstance(fecha_entrega, datetime)
+        if fecha_entrega is not None:
+            fecha_entrega = fecha_entrega.isoformat() if es_datetime else str(fecha_entrega)
+
+        with self._conexion:
+            self._conexion.execute(_INSERTAR_EVALUACION, (
+                evaluacion.id, evaluacion.curso_id, evaluacion.tipo_evaluacion().lower(), evaluacion.nombre,
+                evaluacion.puntaje_maximo, tiempo_limite, fecha_entrega, int(es_datetime)
+            ))
+
+    def calificaciones_registradas(self, evaluacion, estudiante_ids, calificaciones):
+        curso_id = evaluacion.curso_id
+        with self._conexion:
+            self._conexion.executemany(_GUARDAR_CALIFICACION, (
+                (evaluacion.id, estudiante_id, curso_id, calificacion)
+                for estudiante_id, calificacion in zip(estudiante_ids, calificaciones)
+            ))
+
+    def reporte_promedios_bajos(self, curso_id, umbral):
+        if not self._consultas_en_sql:
+            return None
+        return self._conexion.execute(_PROMEDIOS_BAJOS, (curso_id, curso_id, umbral)).fetchall()
+
+    def cerrar(self):
+        self._conexion.close()
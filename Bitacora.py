@@ -0,0 +1,235 @@
+"""
+BITÁCORA DE OPERACIONES CON SNAPSHOTS PERIÓDICOS
+Motor de almacenamiento que registra cada operación que modifica datos en una
+bitácora de solo anexado y guarda cada cierto número de operaciones un
+snapshot completo. Al reiniciar se carga el último snapshot y se reproducen
+solo los registros posteriores.
+"""
+
+import marshal
+import os
+import pickle
+import struct
+import zlib
+
+from Almacenamiento import Almacenamiento
+from Plataforma import codificar_extras_evaluacion, datos_extra_evaluacion, decodificar_extras_evaluacion
+
+# Cabecera de cada registro: longitud del contenido y CRC32 del contenido
+_CABECERA = struct.Struct('<II')
+
+# Códigos de operación de los registros
+_OP_USUARIOS = 1
+_OP_CURSO = 2
+_OP_INSCRIPCIONES = 3
+_OP_EVALUACION = 4
+_OP_CALIFICACIONES = 5
+
+_VERSION_SNAPSHOT = 1
+_ARCHIVO_SNAPSHOT = 'snapshot.pkl'
+_PREFIJO_SEGMENTO = 'bitacora-'
+_SUFIJO_SEGMENTO = '.log'
+
+def leer_registros(ruta):
+    """
+    Lee los registros válidos de un segmento de la bitácora. Devuelve
+    (registros, bytes_validos); si el último registro está truncado o dañado
+    se ignora y bytes_validos indica dónde termina la parte íntegra.
+    """
+    with open(ruta, 'rb') as archivo:
+        contenido = archivo.read()
+
+    # memoryview evita copiar cada registro al recortarlo
+    vista = memoryview(contenido)
+    total = len(contenido)
+    registros = []
+    posicion = 0
+    tamano_cabecera = _CABECERA.size
+    while posicion + tamano_cabecera <= total:
+        longitud, crc = _CABECERA.unpack_from(vista, posicion)
+        inicio = posicion + tamano_cabecera
+        fin = inicio + longitud
+        if fin > total:
+            break
+        carga = vista[inicio:fin]
+        if zlib.crc32(carga) != crc:
+            break
+        registros.append(marshal.loads(carga))
+        posicion = fin
+    return registros, posicion
+
+class AlmacenamientoBitacora(Almacenamiento):
+    """
+    Motor que da durabilidad sin base de datos mediante una bitácora de
+    operaciones y snapshots. Cada intervalo_snapshot operaciones se guarda un
+    snapshot y se empieza un segmento nuevo, así la recuperación nunca
+    reproduce más de intervalo_snapshot registros. Con sincronizar=True cada
+    registro se fuerza a disco con fsync.
+    """
+
+    def __init__(self, directorio, intervalo_snapshot=100000, sincronizar=False):
+        self._directorio = directorio
+        self._intervalo_snapshot = intervalo_snapshot
+        self._sincronizar = sincronizar
+        self._plataforma = None
+        self._archivo = None
+        self._fin_segmento = 0  # Bytes íntegros del segmento abierto
+        self._segmento = 1
+        self._operaciones_desde_snapshot = 0
+        self.segmentos_truncados = 0  # Segmentos con un final truncado o dañado
+        os.makedirs(directorio, exist_ok=True)
+
+    @property
+    def directorio(self):
+        return self._directorio
+
+    def _ruta_segmento(self, numero):
+        return os.path.join(self._directorio, f"{_PREFIJO_SEGMENTO}{numero:06d}{_SUFIJO_SEGMENTO}")
+
+    def _segmentos_existentes(self):
+        """Números de los segmentos de bitácora presentes en el directorio, ordenados"""
+        numeros = []
+        for nombre in os.listdir(self._directorio):
+            if nombre.startswith(_PREFIJO_SEGMENTO) and nombre.endswith(_SUFIJO_SEGMENTO):
+                numeros.append(int(nombre[len(_PREFIJO_SEGMENTO):-len(_SUFIJO_SEGMENTO)]))
+        return sorted(numeros)
+
+    # RECUPERACIÓN
+    def cargar(self):
+        """Carga el último snapshot y reproduce los segmentos posteriores"""
+        datos = {'usuarios': [], 'cursos': [], 'evaluaciones': [], 'inscripciones': [], 'calificaciones': []}
+        primer_segmento = 1
+
+        ruta_snapshot = os.path.join(self._directorio, _ARCHIVO_SNAPSHOT)
+        if os.path.exists(ruta_snapshot):
+            with open(ruta_snapshot, 'rb') as archivo:
+                snapshot = pickle.load(archivo)
+            if snapshot['version'] != _VERSION_SNAPSHOT:
+                raise ValueError(f"Versión de snapshot no soportada: {snapshot['version']}")
+            datos = snapshot['datos']
+            primer_segmento = snapshot['segmento']
+
+        segmentos = [numero for numero in self._segmentos_existentes() if numero >= primer_segmento]
+        for numero in segmentos:
+            ruta = self._ruta_segmento(numero)
+            registros, bytes_validos = leer_registros(ruta)
+            if bytes_validos < os.path.getsize(ruta):
+                # Registro final incompleto (p. ej. caída durante la escritura):
+                # se descarta para que los nuevos registros queden alineados
+                self.segmentos_truncados += 1
+                with open(ruta, 'r+b') as archivo:
+                    archivo.truncate(bytes_validos)
+            self._reproducir(registros, datos)
+            self._operaciones_desde_snapshot += len(registros)
+
+        self._segmento = segmentos[-1] if segmentos else primer_segmento
+        self._abrir_segmento(self._segmento)
+        return datos
+
+    @staticmethod
+    def _reproducir(registros, datos):
+        """Aplica los registros de la bitácora sobre las filas de datos"""
+        for registro in registros:
+            operacion = registro[0]
+            if operacion == _OP_CALIFICACIONES:
+                _, evaluacion_id, estudiante_ids, calificaciones = registro
+                datos['calificaciones'].extend(
+                    (evaluacion_id, estudiante_id, calificacion)
+                    for estudiante_id, calificacion in zip(estudiante_ids, calificaciones))
+            elif operacion == _OP_INSCRIPCIONES:
+                _, curso_id, estudiante_ids = registro
+                datos['inscripciones'].extend((curso_id, estudiante_id) for estudiante_id in estudiante_ids)
+            elif operacion == _OP_USUARIOS:
+                datos['usuarios'].extend(registro[1])
+            elif operacion == _OP_CURSO:
+                datos['cursos'].append(registro[1:])
+            elif operacion == _OP_EVALUACION:
+                *campos, extras = registro[1:]
+                datos['evaluaciones'].append((*campos, decodificar_extras_evaluacion(extras)))
+
+    def _abrir_segmento(self, numero):
+        # Sin búfer: cada registro va al archivo en una sola escritura, y si
+        # falla no queda nada pendiente que se escriba después
+        self._archivo = open(self._ruta_segmento(numero), 'ab', buffering=0)
+        self._fin_segmento = self._archivo.tell()
+
+    def vincular(self, plataforma):
+        self._plataforma = plataforma
+
+    # ESCRITURA
+    def _escribir(self, registro):
+        """
+        Anexa un registro a la bitácora. La plataforma lo llama antes de
+        aplicar la operación en memoria: si la escritura falla se quita lo
+        escrito a medias y la excepción cancela la operación.
+        """
+        # El snapshot se toma antes del registro nuevo, cuando la memoria
+        # contiene exactamente las operaciones ya registradas
+        if self._plataforma is not None and self._operaciones_desde_snapshot >= self._intervalo_snapshot:
+            self.tomar_snapshot()
+
+        carga = marshal.dumps(registro)
+        contenido = _CABECERA.pack(len(carga), zlib.crc32(carga)) + carga
+        try:
+            if self._archivo.write(contenido) != len(contenido):
+                raise OSError("Escritura incompleta en la bitácora")
+            if self._sincronizar:
+                os.fsync(self._archivo.fileno())
+        except OSError:
+            try:
+                os.ftruncate(self._archivo.fileno(), self._fin_segmento)
+            except OSError:
+                pass  # Al cargar se descarta igual el registro incompleto
+            raise
+        self._fin_segmento += len(contenido)
+        self._operaciones_desde_snapshot += 1
+
+    def tomar_snapshot(self):
+        """
+        Guarda el estado completo de la plataforma y empieza un segmento nuevo.
+        El snapshot se escribe en un archivo temporal y se renombra, de modo que
+        una caída a mitad de la escritura deja intacto el snapshot anterior.
+        """
+        siguiente = self._segmento + 1
+        snapshot = {'version': _VERSION_SNAPSHOT, 'segmento': siguiente, 'datos': self._plataforma.exportar_datos()}
+
+        ruta_snapshot = os.path.join(self._directorio, _ARCHIVO_SNAPSHOT)
+        ruta_temporal = ruta_snapshot + '.tmp'
+        with open(ruta_temporal, 'wb') as archivo:
+            pickle.dump(snapshot, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(ruta_temporal, ruta_snapshot)
+
+        # Los segmentos anteriores ya están incluidos en el snapshot
+        self._archivo.close()
+        for numero in self._segmentos_existentes():
+            if numero < siguiente:
+                os.remove(self._ruta_segmento(numero))
+        self._segmento = siguiente
+        self._abrir_segmento(siguiente)
+        self._operaciones_desde_snapshot = 0
+
+    def usuarios_registrados(self, usuarios):
+        self._escribir((_OP_USUARIOS, [
+            (usuario.id, usuario.obtener_tipo().lower(), usuario.nombre, usuario.email) for usuario in usuarios
+        ]))
+
+    def curso_creado(self, curso):
+        self._escribir((_OP_CURSO, curso.id, curso.nombre, curso.instructor_id))
+
+    def estudiantes_inscritos(self, curso_id, estudiante_ids):
+        self._escribir((_OP_INSCRIPCIONES, curso_id, list(estudiante_ids)))
+
+    def evaluacion_creada(self, evaluacion):
+        self._escribir((_OP_EVALUACION, evaluacion.id, evaluacion.curso_id, evaluacion.tipo_evaluacion().lower(),
+                        evaluacion.nombre, evaluacion.puntaje_maximo,
+                        codificar_extras_evaluacion(datos_extra_evaluacion(evaluacion))))
+
+    def calificaciones_registradas(self, evaluacion, estudiante_ids, calificaciones):
+        self._escribir((_OP_CALIFICACIONES, evaluacion.id, list(estudiante_ids), list(calificaciones)))
+
+    def cerrar(self):
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
@@ -0,0 +1,111 @@
+"""
+CACHÉ DE REPORTES POR CURSO
+Caché LRU con vencimiento opcional (TTL) para resultados de reportes. Las
+claves son (curso_id, tipo de reporte, parámetros) y se indexan por curso, así
+que una escritura en un curso invalida solo las entradas de ese curso.
+"""
+
+from collections import OrderedDict
+import time
+
+def _copiar(resultado):
+    """
+    Copia de un resultado para quien lo pidió: las listas, los diccionarios y
+    los diccionarios dentro de una lista son nuevos; los objetos que contienen
+    (estudiantes, etc.) y las vistas de solo lectura se comparten.
+    """
+    if isinstance(resultado, list):
+        return [dict(fila) if isinstance(fila, dict) else fila for fila in resultado]
+    if isinstance(resultado, dict):
+        return dict(resultado)
+    return resultado
+
+class CacheReportes:
+    """
+    Guarda hasta `tamano_maximo` resultados (0 desactiva la caché). Con `ttl`
+    en segundos, una entrada más vieja se recalcula aunque nadie la haya
+    invalidado. Cuenta aciertos, fallos, invalidaciones y vencimientos.
+    """
+
+    __slots__ = ('_entradas', '_claves_curso', '_tamano_maximo', '_ttl', '_reloj',
+                 '_aciertos', '_fallos', '_invalidaciones', '_vencidas')
+
+    def __init__(self, tamano_maximo=256, ttl=None, reloj=time.monotonic):
+        if tamano_maximo < 0:
+            raise ValueError("El tamaño máximo de la caché no puede ser negativo")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("El TTL de la caché debe ser positivo")
+        self._entradas = OrderedDict()  # {clave: (instante, resultado)}, la más reciente al final
+        self._claves_curso = {}  # Índice: {curso_id: set de claves}
+        self._tamano_maximo = tamano_maximo
+        self._ttl = ttl
+        self._reloj = reloj
+        self._aciertos = 0
+        self._fallos = 0
+        self._invalidaciones = 0
+        self._vencidas = 0
+
+    def obtener(self, clave, calcular):
+        """
+        Devuelve el resultado guardado para la clave (curso_id, tipo,
+        parámetros) o lo calcula con calcular() y lo guarda. Siempre se
+        entrega una copia, así modificarla no altera los aciertos siguientes.
+        """
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            if self._ttl is None or self._reloj() - entrada[0] < self._ttl:
+                self._aciertos += 1
+                self._entradas.move_to_end(clave)
+                return _copiar(entrada[1])
+            self._vencidas += 1
+            self._quitar(clave)
+
+        self._fallos += 1
+        resultado = calcular()
+        if self._tamano_maximo:
+            self._entradas[clave] = (self._reloj(), resultado)
+            self._claves_curso.setdefault(clave[0], set()).add(clave)
+            if len(self._entradas) > self._tamano_maximo:
+                self._quitar(next(iter(self._entradas)))  # La usada hace más tiempo
+        return _copiar(resultado)
+
+    def _quitar(self, clave):
+        del self._entradas[clave]
+        claves = self._claves_curso[clave[0]]
+        claves.discard(clave)
+        if not claves:
+            del self._claves_curso[clave[0]]
+
+    def invalidar_curso(self, curso_id):
+        """Descarta las entradas de un curso y devuelve cuántas había"""
+        claves = self._claves_curso.pop(curso_id, ())
+        for clave in claves:
+            del self._entradas[clave]
+        self._invalidaciones += len(claves)
+        return len(claves)
+
+    def limpiar(self):
+        """Descarta todas las entradas (los contadores se conservan)"""
+        self._invalidaciones += len(self._entradas)
+        self._entradas.clear()
+        self._claves_curso.clear()
+
+    def estadisticas(self):
+        """Contadores de uso de la caché"""
+        consultas = self._aciertos + self._fallos
+        return {
+            'aciertos': self._aciertos,
+            'fallos': self._fallos,
+            'tasa_aciertos': self._aciertos / consultas if consultas else 0.0,
+            'invalidaciones': self._invalidaciones,
+            'vencidas': self._vencidas,
+            'entradas': len(self._entradas),
+            'tamano_maximo': self._tamano_maximo,
+            'ttl': self._ttl
+        }
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __repr__(self):
+        return f"CacheReportes({len(self)}/{self._tamano_maximo} entradas)"
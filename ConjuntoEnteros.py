@@ -0,0 +1,246 @@
+"""
+CONJUNTO COMPACTO DE ENTEROS
+Conjunto de enteros de 32 bits sin signo al estilo de los roaring bitmaps: los
+valores se agrupan en bloques según sus 16 bits altos y cada bloque guarda los
+16 bits bajos como un arreglo ordenado (pocos elementos) o como un mapa de bits
+de 8 KB (bloques densos). Ocupa unos 2 bytes por elemento en lugar de las
+decenas de bytes que cuesta cada entero en un set de Python.
+"""
+
+from array import array
+from bisect import bisect_left
+
+import numpy as np
+
+_LIMITE_ARREGLO = 4096  # Con más elementos por bloque el mapa de bits ocupa menos
+_BITS_BLOQUE = 1 << 16
+_VALOR_MAXIMO = (1 << 32) - 1
+
+def _es_mapa(bloque):
+    return isinstance(bloque, bytearray)
+
+def _valores_bloque(bloque):
+    """16 bits bajos de un bloque como arreglo NumPy ordenado (uint16)"""
+    if _es_mapa(bloque):
+        bits = np.unpackbits(np.frombuffer(bloque, dtype=np.uint8), bitorder='little')
+        return np.flatnonzero(bits).astype(np.uint16)
+    return np.frombuffer(bloque, dtype=np.uint16) if len(bloque) else np.zeros(0, dtype=np.uint16)
+
+def _bloque_desde_valores(valores):
+    """Crea el bloque más compacto para un arreglo ordenado y sin repetidos"""
+    if len(valores) > _LIMITE_ARREGLO:
+        bits = np.zeros(_BITS_BLOQUE, dtype=np.uint8)
+        bits[valores] = 1
+        return bytearray(np.packbits(bits, bitorder='little').tobytes())
+    return array('H', valores.astype(np.uint16).tobytes())
+
+def _contar_mapa(mapa):
+    return int(np.unpackbits(np.frombuffer(mapa, dtype=np.uint8)).sum())
+
+# Operaciones por bloque: (sobre mapas de bits con uint64, sobre arreglos ordenados)
+_OPERACIONES = {
+    'union': (np.bitwise_or, np.union1d),
+    'interseccion': (np.bitwise_and, lambda a, b: np.intersect1d(a, b, assume_unique=True)),
+    'diferencia': (lambda a, b: a & ~b, lambda a, b: np.setdiff1d(a, b, assume_unique=True))
+}
+
+class ConjuntoEnteros:
+    """
+    Conjunto de enteros no negativos (hasta 2**32 - 1) con pertenencia rápida,
+    unión (|), intersección (&) y diferencia (-). Se itera en orden ascendente.
+    """
+
+    __slots__ = ('_bloques', '_tamano')
+
+    def __init__(self, valores=()):
+        self._bloques = {}  # Diccionario: {16 bits altos: bloque}
+        self._tamano = 0
+        self.update(valores)
+
+    @classmethod
+    def _desde_bloques(cls, bloques):
+        conjunto = cls()
+        conjunto._bloques = bloques
+        conjunto._tamano = sum(_contar_mapa(bloque) if _es_mapa(bloque) else len(bloque)
+                               for bloque in bloques.values())
+        return conjunto
+
+    @staticmethod
+    def _validar(valor):
+        if not 0 <= valor <= _VALOR_MAXIMO:
+            raise ValueError(f"Valor fuera de rango para un conjunto de enteros de 32 bits: {valor}")
+
+    # MODIFICACIÓN
+    def add(self, valor):
+        """Agrega un entero al conjunto"""
+        self._validar(valor)
+        alto, bajo = valor >> 16, valor & 0xFFFF
+        bloque = self._bloques.get(alto)
+        if bloque is None:
+            self._bloques[alto] = array('H', (bajo,))
+        elif _es_mapa(bloque):
+            mascara = 1 << (bajo & 7)
+            if bloque[bajo >> 3] & mascara:
+                return
+            bloque[bajo >> 3] |= mascara
+        else:
+            posicion = bisect_left(bloque, bajo)
+            if posicion < len(bloque) and bloque[posicion] == bajo:
+                return
+            bloque.insert(posicion, bajo)
+            if len(bloque) > _LIMITE_ARREGLO:
+                self._bloques[alto] = _bloque_desde_valores(_valores_bloque(bloque))
+        self._tamano += 1
+
+    def update(self, valores):
+        """Agrega varios enteros de una vez, agrupándolos por bloque"""
+        valores = np.unique(np.asarray(valores if isinstance(valores, np.ndarray) else list(valores),
+                                       dtype=np.int64))
+        if not len(valores):
+            return
+        self._validar(int(valores[0]))
+        self._validar(int(valores[-1]))
+
+        altos = valores >> 16
+        cortes = np.flatnonzero(np.diff(altos)) + 1
+        for grupo in np.split(valores, cortes):
+            alto = int(grupo[0]) >> 16
+            bajos = (grupo & 0xFFFF).astype(np.uint16)
+            bloque = self._bloques.get(alto)
+            if bloque is not None:
+                anteriores = _contar_mapa(bloque) if _es_mapa(bloque) else len(bloque)
+                bajos = np.union1d(_valores_bloque(bloque), bajos)
+                self._tamano -= anteriores
+            self._bloques[alto] = _bloque_desde_valores(bajos)
+            self._tamano += len(bajos)
+
+    # CONSULTAS
+    def __contains__(self, valor):
+        if not isinstance(valor, (int, np.integer)) or not 0 <= valor <= _VALOR_MAXIMO:
+            return False
+        bloque = self._bloques.get(valor >> 16)
+        if bloque is None:
+            return False
+        bajo = valor & 0xFFFF
+        if _es_mapa(bloque):
+            return bool(bloque[bajo >> 3] & (1 << (bajo & 7)))
+        posicion = bisect_left(bloque, bajo)
+        return posicion < len(bloque) and bloque[posicion] == bajo
+
+    def contiene_arreglo(self, valores):
+        """
+        Máscara booleana de pertenencia para un arreglo NumPy de enteros. Solo
+        se consultan los bloques que tocan los valores, sin desempaquetarlos.
+        """
+        valores = np.asarray(valores, dtype=np.int64)
+        resultado = np.zeros(len(valores), dtype=bool)
+        posiciones = np.flatnonzero((valores >= 0) & (valores <= _VALOR_MAXIMO))
+        if not len(posiciones) or not self._bloques:
+            return resultado
+
+        # Posiciones agrupadas por los 16 bits altos de su valor
+        posiciones = posiciones[np.argsort(valores[posiciones] >> 16, kind='stable')]
+        altos = valores[posiciones] >> 16
+        for grupo in np.split(posiciones, np.flatnonzero(np.diff(altos)) + 1):
+            bloque = self._bloques.get(int(valores[grupo[0]]) >> 16)
+            if bloque is None or not len(bloque):
+                continue
+            bajos = valores[grupo] & 0xFFFF
+            if _es_mapa(bloque):
+                bytes_mapa = np.frombuffer(bloque, dtype=np.uint8)
+                resultado[grupo] = (bytes_mapa[bajos >> 3] >> (bajos & 7)) & 1
+            else:
+                ordenados = np.frombuffer(bloque, dtype=np.uint16)
+                indices = np.minimum(ordenados.searchsorted(bajos), len(ordenados) - 1)
+                resultado[grupo] = ordenados[indices] == bajos
+        return resultado
+
+    def __len__(self):
+        return self._tamano
+
+    def siguientes(self, despues_de=None, cantidad=None):
+        """Hasta `cantidad` valores mayores que despues_de, en orden ascendente"""
+        inicio = 0 if despues_de is None else max(0, despues_de + 1)
+        alto_inicio = inicio >> 16
+        resultado = []
+        for alto in sorted(self._bloques):
+            if alto < alto_inicio:
+                continue
+            valores = _valores_bloque(self._bloques[alto])
+            if alto == alto_inicio:
+                valores = valores[valores.searchsorted(np.uint16(inicio & 0xFFFF)):]
+            if cantidad is not None:
+                valores = valores[:cantidad - len(resultado)]
+            resultado.extend(((alto << 16) + valores.astype(np.int64)).tolist())
+            if cantidad is not None and len(resultado) >= cantidad:
+                break
+        return resultado
+
+    def __iter__(self):
+        for alto in sorted(self._bloques):
+            base = alto << 16
+            for bajo in _valores_bloque(self._bloques[alto]).tolist():
+                yield base | bajo
+
+    def a_arreglo(self):
+        """Todos los valores como arreglo NumPy ordenado (int64)"""
+        partes = [(alto << 16) + _valores_bloque(self._bloques[alto]).astype(np.int64)
+                  for alto in sorted(self._bloques)]
+        return np.concatenate(partes) if partes else np.zeros(0, dtype=np.int64)
+
+    def tamano_en_bytes(self):
+        """Memoria aproximada que ocupan los bloques"""
+        return sum(len(bloque) if _es_mapa(bloque) else bloque.itemsize * len(bloque)
+                   for bloque in self._bloques.values())
+
+    # OPERACIONES DE CONJUNTOS
+    def _operar(self, otro, operacion):
+        if not isinstance(otro, ConjuntoEnteros):
+            otro = ConjuntoEnteros(otro)
+        sobre_mapas, sobre_arreglos = _OPERACIONES[operacion]
+
+        if operacion == 'union':
+            claves = self._bloques.keys() | otro._bloques.keys()
+        elif operacion == 'interseccion':
+            claves = self._bloques.keys() & otro._bloques.keys()
+        else:
+            claves = self._bloques.keys()
+
+        bloques = {}
+        for alto in sorted(claves):
+            propio, ajeno = self._bloques.get(alto), otro._bloques.get(alto)
+            if ajeno is None or propio is None:
+                # Unión o diferencia con un bloque ausente: se copia el que existe
+                existente = propio if propio is not None else ajeno
+                bloques[alto] = bytearray(existente) if _es_mapa(existente) else array('H', existente)
+                continue
+            if _es_mapa(propio) and _es_mapa(ajeno):
+                resultado = sobre_mapas(np.frombuffer(propio, dtype=np.uint64), np.frombuffer(ajeno, dtype=np.uint64))
+                bits = np.unpackbits(resultado.view(np.uint8), bitorder='little')
+                valores = np.flatnonzero(bits)
+            else:
+                valores = sobre_arreglos(_valores_bloque(propio), _valores_bloque(ajeno))
+            if len(valores):
+                bloques[alto] = _bloque_desde_valores(valores)
+        return ConjuntoEnteros._desde_bloques(bloques)
+
+    def __or__(self, otro):
+        return self._operar(otro, 'union')
+
+    def __and__(self, otro):
+        return self._operar(otro, 'interseccion')
+
+    def __sub__(self, otro):
+        return self._operar(otro, 'diferencia')
+
+    def __eq__(self, otro):
+        if isinstance(otro, ConjuntoEnteros):
+            return self._tamano == otro._tamano and np.array_equal(self.a_arreglo(), otro.a_arreglo())
+        if isinstance(otro, (set, frozenset)):
+            return self._tamano == len(otro) and all(valor in otro for valor in self)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ConjuntoEnteros({len(self)} elementos)"
@@ -6,6 +6,9 @@ Implementación de los requerimientos del Proyecto 1 - Programación Avanzada
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+from MenuPaginado import (FuenteListado, fuente_desde_registro, mostrar_listado, formato_estudiante,
+                          formato_instructor, formato_evaluacion, seleccionar_curso)
+
 # CLASE BASE PARA MANEJO DE EXCEPCIONES PERSONALIZADAS
 class PlataformaError(Exception):
     """Excepción base para errores de la plataforma"""
@@ -385,6 +388,22 @@ def mostrar_menu_consultas():
     print("6. Volver al menú principal")
     print("="*30)
 
+# LISTADOS PAGINADOS SOBRE LOS DICCIONARIOS DE ESTA PLATAFORMA
+# (el índice por nombre de cada listado se arma la primera vez que se filtra)
+def fuente_usuarios(plataforma, tipo):
+    return fuente_desde_registro({usuario.id: usuario for usuario in plataforma.obtener_usuarios_por_tipo(tipo)})
+
+def fuente_cursos(plataforma):
+    return fuente_desde_registro(plataforma._cursos)
+
+def fuente_estudiantes_curso(plataforma, curso_id):
+    return fuente_desde_registro({estudiante.id: estudiante
+                                  for estudiante in plataforma.obtener_estudiantes_curso(curso_id)})
+
+def fuente_evaluaciones_curso(plataforma, curso_id):
+    return fuente_desde_registro({evaluacion.id: evaluacion
+                                  for evaluacion in plataforma.obtener_evaluaciones_curso(curso_id)})
+
 def registrar_usuario_interactivo(plataforma):
     """Interfaz interactiva para registrar un usuario"""
     print("\n--- REGISTRAR USUARIO ---")
@@ -410,22 +429,16 @@ def crear_curso_interactivo(plataforma):
     print("\n- CREAR CURSO -")
     
     # Listar instructores disponibles
-    instructores = plataforma.obtener_usuarios_por_tipo("instructor")
-    if not instructores:
+    instructores = fuente_usuarios(plataforma, "instructor")
+    if not instructores.total():
         print("No hay instructores registrados. Debe registrar un instructor primero.")
         return
     
-    print("Instructores disponibles:")
-    for i, instructor in enumerate(instructores, 1):
-        print(f"{i}. {instructor.nombre} ({instructor.email}) - Especialidad: {instructor.especialidad}")
-    
     try:
-        seleccion = int(input("Seleccione el número del instructor: "))
-        if seleccion < 1 or seleccion > len(instructores):
-            print("Selección no válida")
+        instructor = mostrar_listado("INSTRUCTORES DISPONIBLES", instructores, formato_instructor, seleccionar=True)
+        if instructor is None:
             return
         
-        instructor = instructores[seleccion - 1]
         nombre_curso = input("Nombre del curso: ").strip()
         
         curso = plataforma.crear_curso(nombre_curso, instructor.id)
@@ -440,40 +453,21 @@ def inscribir_estudiante_interactivo(plataforma):
     print("\n--- INSCRIBIR ESTUDIANTE EN CURSO ---")
     
     # Listar estudiantes disponibles
-    estudiantes = plataforma.obtener_usuarios_por_tipo("estudiante")
-    if not estudiantes:
+    estudiantes = fuente_usuarios(plataforma, "estudiante")
+    if not estudiantes.total():
         print("No hay estudiantes registrados.")
         return
     
-    print("Estudiantes disponibles:")
-    for i, estudiante in enumerate(estudiantes, 1):
-        print(f"{i}. {estudiante.nombre} ({estudiante.email})")
-    
     try:
-        seleccion_est = int(input("Seleccione el número del estudiante: "))
-        if seleccion_est < 1 or seleccion_est > len(estudiantes):
-            print("Selección no válida")
+        estudiante = mostrar_listado("ESTUDIANTES DISPONIBLES", estudiantes, formato_estudiante, seleccionar=True)
+        if estudiante is None:
             return
         
-        estudiante = estudiantes[seleccion_est - 1]
-        
         # Listar cursos disponibles
-        cursos = plataforma.obtener_todos_cursos()
-        if not cursos:
-            print("No hay cursos registrados.")
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
             return
         
-        print("Cursos disponibles:")
-        for i, curso in enumerate(cursos, 1):
-            print(f"{i}. {curso.nombre} (ID: {curso.id})")
-        
-        seleccion_curso = int(input("Seleccione el número del curso: "))
-        if seleccion_curso < 1 or seleccion_curso > len(cursos):
-            print("Selección no válida")
-            return
-        
-        curso = cursos[seleccion_curso - 1]
-        
         plataforma.inscribir_estudiante_curso(estudiante.id, curso.id)
         print(f"Estudiante {estudiante.nombre} inscrito exitosamente en el curso {curso.nombre}")
     except ValueError:
@@ -487,23 +481,12 @@ def crear_evaluacion_interactivo(plataforma):
     """Interfaz interactiva para crear una evaluación"""
     print("\n--- CREAR EVALUACIÓN ---")
     
-    # Listar cursos disponibles
-    cursos = plataforma.obtener_todos_cursos()
-    if not cursos:
-        print("No hay cursos registrados.")
-        return
-    
-    print("Cursos disponibles:")
-    for i, curso in enumerate(cursos, 1):
-        print(f"{i}. {curso.nombre} (ID: {curso.id})")
-    
     try:
-        seleccion_curso = int(input("Seleccione el número del curso: "))
-        if seleccion_curso < 1 or seleccion_curso > len(cursos):
-            print("Selección no válida")
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
             return
         
-        curso = cursos[seleccion_curso - 1]
         tipo = input("Tipo de evaluación (examen/tarea): ").strip().lower()
         
         if tipo not in ["examen", "tarea"]:
@@ -530,57 +513,32 @@ def registrar_calificacion_interactivo(plataforma):
     """Interfaz interactiva para registrar una calificación"""
     print("\n--- REGISTRAR CALIFICACIÓN ---")
     
-    # Listar cursos disponibles
-    cursos = plataforma.obtener_todos_cursos()
-    if not cursos:
-        print("No hay cursos registrados.")
-        return
-    
-    print("Cursos disponibles:")
-    for i, curso in enumerate(cursos, 1):
-        print(f"{i}. {curso.nombre} (ID: {curso.id})")
-    
     try:
-        seleccion_curso = int(input("Seleccione el número del curso: "))
-        if seleccion_curso < 1 or seleccion_curso > len(cursos):
-            print("Selección no válida")
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
             return
         
-        curso = cursos[seleccion_curso - 1]
-        
         # Listar evaluaciones del curso
-        evaluaciones = plataforma.obtener_evaluaciones_curso(curso.id)
-        if not evaluaciones:
+        evaluaciones = fuente_evaluaciones_curso(plataforma, curso.id)
+        if not evaluaciones.total():
             print("El curso no tiene evaluaciones.")
             return
         
-        print("Evaluaciones disponibles:")
-        for i, evaluacion in enumerate(evaluaciones, 1):
-            print(f"{i}. {evaluacion.nombre} ({evaluacion.tipo_evaluacion()}) - Puntaje máximo: {evaluacion._puntaje_maximo}")
-        
-        seleccion_eval = int(input("Seleccione el número de la evaluación: "))
-        if seleccion_eval < 1 or seleccion_eval > len(evaluaciones):
-            print("Selección no válida")
+        evaluacion = mostrar_listado("EVALUACIONES DISPONIBLES", evaluaciones, formato_evaluacion, seleccionar=True)
+        if evaluacion is None:
             return
         
-        evaluacion = evaluaciones[seleccion_eval - 1]
-        
         # Listar estudiantes del curso
-        estudiantes = plataforma.obtener_estudiantes_curso(curso.id)
-        if not estudiantes:
+        estudiantes = fuente_estudiantes_curso(plataforma, curso.id)
+        if not estudiantes.total():
             print("El curso no tiene estudiantes inscritos.")
             return
         
-        print("Estudiantes inscritos:")
-        for i, estudiante in enumerate(estudiantes, 1):
-            print(f"{i}. {estudiante.nombre} ({estudiante.email})")
-        
-        seleccion_est = int(input("Seleccione el número del estudiante: "))
-        if seleccion_est < 1 or seleccion_est > len(estudiantes):
-            print("Selección no válida")
+        estudiante = mostrar_listado("ESTUDIANTES INSCRITOS", estudiantes, formato_estudiante, seleccionar=True)
+        if estudiante is None:
             return
         
-        estudiante = estudiantes[seleccion_est - 1]
         calificacion = float(input("Calificación: "))
         
         plataforma.registrar_calificacion(evaluacion.id, estudiante.id, calificacion, curso.id)
@@ -598,63 +556,37 @@ def consultar_informacion_interactivo(plataforma):
         
         if opcion == "1":
             # Listar todos los cursos
-            cursos = plataforma.obtener_todos_cursos()
-            print("\n- TODOS LOS CURSOS -")
-            if not cursos:
-                print("No hay cursos registrados.")
-            else:
-                for i, curso in enumerate(cursos, 1):
-                    instructor = plataforma._usuarios.get(curso.instructor_id, None)
-                    instructor_nombre = instructor.nombre if instructor else "Desconocido"
-                    print(f"{i}. {curso.nombre} (ID: {curso.id}) - Instructor: {instructor_nombre}")
+            def formato_con_instructor(curso):
+                instructor = plataforma._usuarios.get(curso.instructor_id, None)
+                instructor_nombre = instructor.nombre if instructor else "Desconocido"
+                return f"{curso.nombre} (ID: {curso.id}) - Instructor: {instructor_nombre}"
+            
+            mostrar_listado("TODOS LOS CURSOS", fuente_cursos(plataforma), formato_con_instructor)
         
         elif opcion == "2":
             # Listar estudiantes
-            estudiantes = plataforma.obtener_usuarios_por_tipo("estudiante")
-            print("\n- TODOS LOS ESTUDIANTES -")
-            if not estudiantes:
-                print("No hay estudiantes registrados.")
-            else:
-                for i, estudiante in enumerate(estudiantes, 1):
-                    print(f"{i}. {estudiante.nombre} ({estudiante.email}) - Cursos inscritos: {len(estudiante.cursos_inscritos)}")
+            mostrar_listado("TODOS LOS ESTUDIANTES", fuente_usuarios(plataforma, "estudiante"),
+                            lambda estudiante: f"{formato_estudiante(estudiante)} - "
+                                               f"Cursos inscritos: {len(estudiante.cursos_inscritos)}")
         
         elif opcion == "3":
             # Listar instructores
-            instructores = plataforma.obtener_usuarios_por_tipo("instructor")
-            print("\n--- TODOS LOS INSTRUCTORES ---")
-            if not instructores:
-                print("No hay instructores registrados.")
-            else:
-                for i, instructor in enumerate(instructores, 1):
-                    print(f"{i}. {instructor.nombre} ({instructor.email}) - Especialidad: {instructor.especialidad}")
+            mostrar_listado("TODOS LOS INSTRUCTORES", fuente_usuarios(plataforma, "instructor"), formato_instructor)
         
         elif opcion == "4":
             # Ver estudiantes de un curso
-            cursos = plataforma.obtener_todos_cursos()
-            if not cursos:
-                print("No hay cursos registrados.")
-                continue
-            
-            print("Cursos disponibles:")
-            for i, curso in enumerate(cursos, 1):
-                print(f"{i}. {curso.nombre} (ID: {curso.id})")
-            
             try:
-                seleccion = int(input("Seleccione el número del curso: "))
-                if seleccion < 1 or seleccion > len(cursos):
-                    print("Selección no válida")
+                curso = seleccionar_curso(fuente_cursos(plataforma))
+                if curso is None:
                     continue
                 
-                curso = cursos[seleccion - 1]
-                estudiantes = plataforma.obtener_estudiantes_curso(curso.id)
+                # El promedio se calcula solo para las filas de la página mostrada
+                def formato_con_promedio(estudiante):
+                    promedio = plataforma.obtener_promedio_estudiante(estudiante.id, curso.id)
+                    return f"{formato_estudiante(estudiante)} - Promedio: {promedio:.2f}"
                 
-                print(f"\n--- ESTUDIANTES INSCRITOS EN {curso.nombre} ---")
-                if not estudiantes:
-                    print("No hay estudiantes inscritos en este curso.")
-                else:
-                    for i, estudiante in enumerate(estudiantes, 1):
-                        promedio = plataforma.obtener_promedio_estudiante(estudiante.id, curso.id)
-                        print(f"{i}. {estudiante.nombre} ({estudiante.email}) - Promedio: {promedio:.2f}")
+                mostrar_listado(f"ESTUDIANTES INSCRITOS EN {curso.nombre}",
+                                fuente_estudiantes_curso(plataforma, curso.id), formato_con_promedio)
             except ValueError:
                 print("Error: Debe ingresar un número válido")
             except Exception as e:
@@ -662,30 +594,13 @@ def consultar_informacion_interactivo(plataforma):
         
         elif opcion == "5":
             # Ver evaluaciones de un curso
-            cursos = plataforma.obtener_todos_cursos()
-            if not cursos:
-                print("No hay cursos registrados.")
-                continue
-            
-            print("Cursos disponibles:")
-            for i, curso in enumerate(cursos, 1):
-                print(f"{i}. {curso.nombre} (ID: {curso.id})")
-            
             try:
-                seleccion = int(input("Seleccione el número del curso: "))
-                if seleccion < 1 or seleccion > len(cursos):
-                    print("Selección no válida")
+                curso = seleccionar_curso(fuente_cursos(plataforma))
+                if curso is None:
                     continue
                 
-                curso = cursos[seleccion - 1]
-                evaluaciones = plataforma.obtener_evaluaciones_curso(curso.id)
-                
-                print(f"\n--- EVALUACIONES DE {curso.nombre} ---")
-                if not evaluaciones:
-                    print("No hay evaluaciones para este curso.")
-                else:
-                    for i, evaluacion in enumerate(evaluaciones, 1):
-                        print(f"{i}. {evaluacion.nombre} ({evaluacion.tipo_evaluacion()}) - Puntaje máximo: {evaluacion._puntaje_maximo}")
+                mostrar_listado(f"EVALUACIONES DE {curso.nombre}",
+                                fuente_evaluaciones_curso(plataforma, curso.id), formato_evaluacion)
             except ValueError:
                 print("Error: Debe ingresar un número válido")
             except Exception as e:
@@ -702,33 +617,23 @@ def generar_reportes_interactivo(plataforma):
     """Interfaz interactiva para generar reportes"""
     print("\n--- GENERAR REPORTES ---")
     
-    # Listar cursos disponibles
-    cursos = plataforma.obtener_todos_cursos()
-    if not cursos:
-        print("No hay cursos registrados.")
-        return
-    
-    print("Cursos disponibles:")
-    for i, curso in enumerate(cursos, 1):
-        print(f"{i}. {curso.nombre} (ID: {curso.id})")
-    
     try:
-        seleccion = int(input("Seleccione el número del curso: "))
-        if seleccion < 1 or seleccion > len(cursos):
-            print("Selección no válida")
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
             return
         
-        curso = cursos[seleccion - 1]
         umbral = float(input("Umbral para promedios bajos (por defecto 60): ") or "60")
         
         reporte = plataforma.generar_reporte_promedios_bajos(curso.id, umbral)
         
-        print(f"\n--- REPORTE DE ESTUDIANTES CON PROMEDIO BAJO EN {curso.nombre} ---")
         if not reporte:
             print(f"No hay estudiantes con promedio inferior a {umbral} en este curso.")
         else:
-            for item in reporte:
-                print(f"{item['estudiante'].nombre}: {item['promedio']:.2f}%")
+            # Se pagina por posición para conservar el orden del reporte
+            mostrar_listado(f"REPORTE DE ESTUDIANTES CON PROMEDIO BAJO EN {curso.nombre}",
+                            FuenteListado(range(len(reporte)), reporte.__getitem__),
+                            lambda item: f"{item['estudiante'].nombre}: {item['promedio']:.2f}%")
     except ValueError:
         print("Error: Debe ingresar valores válidos")
     except Exception as e:
@@ -764,5 +669,6 @@ def ejecutar_sistema_con_menu():
         else:
             print("Opción no válida. Intente nuevamente.")
 
-# Punto de entrada del programa
-ejecutar_sistema_con_menu()
\ No newline at end of file
+# Punto de entrada del programa (importar el módulo no inicia el menú)
+if __name__ == "__main__":
+    ejecutar_sistema_con_menu()
\ No newline at end of file
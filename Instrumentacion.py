@@ -0,0 +1,217 @@
+"""
+INSTRUMENTACIÓN DE OPERACIONES
+Cuenta llamadas, errores por tipo de excepción y latencias (histograma con
+p50/p95/p99) de los métodos públicos de un objeto, normalmente una
+PlataformaCursos. Los métodos se envuelven solo mientras la instrumentación
+está activa: desactivada, las llamadas no pasan por ningún código extra. Las
+métricas se exportan en formato de texto de Prometheus o en JSON.
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+import inspect
+import json
+import os
+import time
+
+# Límites superiores (segundos) de las cubetas del histograma: de 1 us a ~95 s
+# en pasos de raíz de 2, así un percentil estimado se aleja a lo sumo un 41%
+_LIMITES_LATENCIA = tuple(1e-6 * 2 ** (paso / 2) for paso in range(54))
+
+class _MetricasMetodo:
+    """Contadores e histograma de un método"""
+
+    __slots__ = ('llamadas', 'errores', 'conteos', 'suma', 'minimo', 'maximo')
+
+    def __init__(self, cubetas):
+        self.llamadas = 0
+        self.errores = {}  # {nombre de la excepción: cantidad}
+        self.conteos = [0] * cubetas  # La última cubeta es +Inf
+        self.suma = 0.0
+        self.minimo = float('inf')
+        self.maximo = 0.0
+
+class Instrumentacion:
+    """
+    Registro de métricas por método. instrumentar(objeto) envuelve sus métodos
+    públicos (o solo los de `metodos`) y desinstrumentar() los restaura; las
+    métricas acumuladas se conservan hasta reiniciar().
+    """
+
+    def __init__(self, metodos=None, limites=_LIMITES_LATENCIA, reloj=time.perf_counter):
+        if not limites or list(limites) != sorted(limites):
+            raise ValueError("Los límites del histograma deben ser crecientes")
+        self._metodos = metodos
+        self._limites = tuple(limites)
+        self._reloj = reloj
+        self._metricas = {}  # {nombre del método: _MetricasMetodo}
+        self._objeto = None
+        self._envueltos = []  # [(nombre, atributo de instancia anterior o None)]
+
+    @property
+    def activa(self):
+        return self._objeto is not None
+
+    def _metodos_publicos(self, objeto):
+        """Nombres de los métodos públicos de la clase del objeto"""
+        nombres = []
+        for nombre, valor in inspect.getmembers(type(objeto)):
+            if nombre.startswith('_') or not inspect.isfunction(valor):
+                continue
+            # Un generador solo se mediría al crearlo, no al recorrerlo
+            if inspect.isgeneratorfunction(valor):
+                continue
+            if self._metodos is None or nombre in self._metodos:
+                nombres.append(nombre)
+        return nombres
+
+    def instrumentar(self, objeto):
+        """Empieza a medir los métodos públicos del objeto"""
+        if self._objeto is not None:
+            raise ValueError("La instrumentación ya está activa")
+        for nombre in self._metodos_publicos(objeto):
+            # Atributo de instancia: tapa al método de la clase hasta desinstrumentar
+            self._envueltos.append((nombre, vars(objeto).get(nombre)))
+            setattr(objeto, nombre, self._envolver(nombre, getattr(objeto, nombre)))
+        self._objeto = objeto
+
+    def desinstrumentar(self):
+        """Quita las envolturas; las llamadas vuelven a ir directo a los métodos"""
+        if self._objeto is None:
+            return
+        # Si otra envoltura (p. ej. el perfilado) ocupaba el atributo, se repone
+        for nombre, anterior in self._envueltos:
+            if anterior is None:
+                vars(self._objeto).pop(nombre, None)
+            else:
+                setattr(self._objeto, nombre, anterior)
+        self._envueltos.clear()
+        self._objeto = None
+
+    def _envolver(self, nombre, metodo):
+        metricas = self._metricas.get(nombre)
+        if metricas is None:
+            metricas = self._metricas[nombre] = _MetricasMetodo(len(self._limites) + 1)
+        limites = self._limites
+        reloj = self._reloj
+
+        def envoltura(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return metodo(*args, **kwargs)
+            except Exception as error:
+                tipo = type(error).__name__
+                metricas.errores[tipo] = metricas.errores.get(tipo, 0) + 1
+                raise
+            finally:
+                duracion = reloj() - inicio
+                metricas.llamadas += 1
+                metricas.suma += duracion
+                metricas.conteos[bisect_left(limites, duracion)] += 1
+                if duracion < metricas.minimo:
+                    metricas.minimo = duracion
+                if duracion > metricas.maximo:
+                    metricas.maximo = duracion
+
+        envoltura.__name__ = nombre
+        envoltura.__doc__ = metodo.__doc__
+        envoltura.__wrapped__ = metodo
+        return envoltura
+
+    def reiniciar(self):
+        """Pone en cero todas las métricas"""
+        cubetas = len(self._limites) + 1
+        for metricas in self._metricas.values():
+            metricas.__init__(cubetas)
+
+    def _percentil(self, metricas, fraccion):
+        """Estima un percentil interpolando dentro de la cubeta que lo contiene"""
+        posicion = fraccion * metricas.llamadas
+        acumulado = 0
+        for indice, conteo in enumerate(metricas.conteos):
+            if conteo and acumulado + conteo >= posicion:
+                inferior = self._limites[indice - 1] if indice else 0.0
+                superior = self._limites[indice] if indice < len(self._limites) else metricas.maximo
+                estimado = inferior + (superior - inferior) * (posicion - acumulado) / conteo
+                return min(max(estimado, metricas.minimo), metricas.maximo)
+            acumulado += conteo
+        return metricas.maximo
+
+    def estadisticas(self):
+        """
+        Lista de diccionarios por método con llamadas, errores por tipo y
+        latencias en milisegundos, ordenada por tiempo total (mayor primero).
+        """
+        reporte = []
+        for nombre, metricas in self._metricas.items():
+            if not metricas.llamadas:
+                continue
+            reporte.append({
+                'metodo': nombre,
+                'llamadas': metricas.llamadas,
+                'errores': dict(metricas.errores),
+                'total_ms': metricas.suma * 1e3,
+                'promedio_ms': metricas.suma / metricas.llamadas * 1e3,
+                'p50_ms': self._percentil(metricas, 0.50) * 1e3,
+                'p95_ms': self._percentil(metricas, 0.95) * 1e3,
+                'p99_ms': self._percentil(metricas, 0.99) * 1e3,
+                'maximo_ms': metricas.maximo * 1e3
+            })
+        reporte.sort(key=lambda item: item['total_ms'], reverse=True)
+        return reporte
+
+    def exportar_prometheus(self, prefijo="plataforma"):
+        """Métricas en el formato de texto de Prometheus"""
+        llamadas = [f"# HELP {prefijo}_llamadas_total Llamadas por método",
+                    f"# TYPE {prefijo}_llamadas_total counter"]
+        errores = [f"# HELP {prefijo}_errores_total Llamadas que lanzaron una excepción, por tipo",
+                   f"# TYPE {prefijo}_errores_total counter"]
+        latencias = [f"# HELP {prefijo}_latencia_segundos Latencia por método",
+                     f"# TYPE {prefijo}_latencia_segundos histogram"]
+        for nombre, metricas in sorted(self._metricas.items()):
+            if not metricas.llamadas:
+                continue
+            llamadas.append(f'{prefijo}_llamadas_total{{metodo="{nombre}"}} {metricas.llamadas}')
+            for tipo, cantidad in sorted(metricas.errores.items()):
+                errores.append(f'{prefijo}_errores_total{{metodo="{nombre}",error="{tipo}"}} {cantidad}')
+            acumulado = 0
+            for limite, conteo in zip(self._limites + ('+Inf',), metricas.conteos):
+                acumulado += conteo
+                limite = limite if isinstance(limite, str) else f"{limite:.6g}"
+                latencias.append(f'{prefijo}_latencia_segundos_bucket{{metodo="{nombre}",le="{limite}"}} {acumulado}')
+            latencias.append(f'{prefijo}_latencia_segundos_sum{{metodo="{nombre}"}} {metricas.suma!r}')
+            latencias.append(f'{prefijo}_latencia_segundos_count{{metodo="{nombre}"}} {metricas.llamadas}')
+        return "\n".join(llamadas + errores + latencias) + "\n"
+
+    def exportar_json(self):
+        """Métricas en JSON: resumen por método y conteos del histograma"""
+        return json.dumps({
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'limites_segundos': self._limites,
+            'metodos': self.estadisticas(),
+            'histogramas': {nombre: metricas.conteos for nombre, metricas in self._metricas.items()
+                            if metricas.llamadas}
+        }, indent=2, ensure_ascii=False)
+
+    def guardar(self, ruta, formato=None):
+        """
+        Escribe las métricas en un archivo: 'json' o 'prometheus' (por
+        defecto según la extensión: .json o .prom/.txt). Se escribe en un
+        temporal y se renombra para no dejar archivos a medias.
+        """
+        if formato is None:
+            formato = os.path.splitext(ruta)[1].lstrip('.').lower()
+        if formato == 'json':
+            contenido = self.exportar_json()
+        elif formato in ('prometheus', 'prom', 'txt'):
+            contenido = self.exportar_prometheus()
+        else:
+            raise ValueError(f"Formato de métricas no soportado: {formato}")
+
+        temporal = ruta + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+
+    def __repr__(self):
+        return f"Instrumentacion({'activa' if self.activa else 'inactiva'}, {len(self._metricas)} métodos)"
@@ -0,0 +1,457 @@
+"""
+MENÚ INTERACTIVO DE LA PLATAFORMA
+Funciones del menú de consola. Importar este módulo no ejecuta nada: el menú
+se inicia con ejecutar_sistema_con_menu() o main() (ver Main(Menu).py y
+python -m gestion_cursos).
+"""
+
+import argparse
+import os
+import sys
+
+from Instrumentacion import Instrumentacion
+from Plataforma import PlataformaCursos, PlataformaError, UsuarioYaRegistradoError, CursoInexistenteError
+from MenuPaginado import (FuenteListado, mostrar_listado, fuente_cursos, fuente_usuarios, fuente_estudiantes_curso,
+                          fuente_evaluaciones_curso, formato_estudiante, formato_instructor, formato_evaluacion,
+                          seleccionar_curso)
+
+def mostrar_menu_principal():
+    """Muestra el menú principal de la plataforma"""
+    print("\n" + "="*50)
+    print("PLATAFORMA DE GESTIÓN DE CURSOS ONLINE")
+    print("="*50)
+    print("1. Registrar usuario")
+    print("2. Crear curso")
+    print("3. Inscribir estudiante en curso")
+    print("4. Crear evaluación")
+    print("5. Registrar calificación")
+    print("6. Consultar información")
+    print("7. Generar reportes")
+    print("8. Métricas de operaciones")
+    print("9. Salir")
+    print("="*50)
+
+def mostrar_menu_consultas():
+    """Muestra el menú de consultas"""
+    print("\n" + "="*50)
+    print("CONSULTAS DE INFORMACIÓN")
+    print("="*50)
+    print("1. Listar todos los cursos")
+    print("2. Listar estudiantes")
+    print("3. Listar instructores")
+    print("4. Ver estudiantes de un curso")
+    print("5. Ver evaluaciones de un curso")
+    print("6. Volver al menú principal")
+    print("="*50)
+
+def mostrar_menu_metricas(instrumentacion):
+    """Muestra el menú de métricas"""
+    print("\n" + "="*50)
+    print(f"MÉTRICAS DE OPERACIONES ({'activas' if instrumentacion.activa else 'inactivas'})")
+    print("="*50)
+    print(f"1. {'Desactivar' if instrumentacion.activa else 'Activar'} la medición")
+    print("2. Ver métricas por método")
+    print("3. Exportar métricas a un archivo (.json o .prom)")
+    print("4. Reiniciar métricas")
+    print("5. Volver al menú principal")
+    print("="*50)
+
+def registrar_usuario_interactivo(plataforma):
+    """Interfaz interactiva para registrar un usuario"""
+    print("\n--- REGISTRAR USUARIO ---")
+    tipo = input("Tipo de usuario (estudiante/instructor): ").strip().lower()
+    
+    if tipo not in ["estudiante", "instructor"]:
+        print("Error: Tipo de usuario no válido")
+        return
+    
+    nombre = input("Nombre: ").strip()
+    email = input("Email: ").strip()
+    
+    try:
+        usuario = plataforma.registrar_usuario(tipo, nombre, email)
+        print(f"Usuario registrado exitosamente: {usuario}")
+    except PlataformaError as e:
+        print(f"Error: {e}")
+    except Exception as e:
+        print(f"Error inesperado: {e}")
+
+def crear_curso_interactivo(plataforma):
+    """Interfaz interactiva para crear un curso"""
+    print("\n--- CREAR CURSO ---")
+    
+    # Listar instructores disponibles
+    instructores = fuente_usuarios(plataforma, "instructor")
+    if not instructores.total():
+        print("No hay instructores registrados. Debe registrar un instructor primero.")
+        return
+    
+    try:
+        instructor = mostrar_listado("INSTRUCTORES DISPONIBLES", instructores, formato_instructor, seleccionar=True)
+        if instructor is None:
+            return
+        
+        nombre_curso = input("Nombre del curso: ").strip()
+        
+        curso = plataforma.crear_curso(nombre_curso, instructor.id)
+        print(f"Curso creado exitosamente: {curso.nombre} (ID: {curso.id})")
+    except ValueError:
+        print("Error: Debe ingresar un número válido")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def inscribir_estudiante_interactivo(plataforma):
+    """Interfaz interactiva para inscribir un estudiante en un curso"""
+    print("\n--- INSCRIBIR ESTUDIANTE EN CURSO ---")
+    
+    # Listar estudiantes disponibles
+    estudiantes = fuente_usuarios(plataforma, "estudiante")
+    if not estudiantes.total():
+        print("No hay estudiantes registrados.")
+        return
+    
+    try:
+        estudiante = mostrar_listado("ESTUDIANTES DISPONIBLES", estudiantes, formato_estudiante, seleccionar=True)
+        if estudiante is None:
+            return
+        
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
+            return
+        
+        plataforma.inscribir_estudiante_curso(estudiante.id, curso.id)
+        print(f"Estudiante {estudiante.nombre} inscrito exitosamente en el curso {curso.nombre}")
+    except ValueError:
+        print("Error: Debe ingresar un número válido")
+    except PlataformaError as e:
+        print(f"Error: {e}")
+    except Exception as e:
+        print(f"Error inesperado: {e}")
+
+def crear_evaluacion_interactivo(plataforma):
+    """Interfaz interactiva para crear una evaluación"""
+    print("\n--- CREAR EVALUACIÓN ---")
+    
+    try:
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
+            return
+        
+        tipo = input("Tipo de evaluación (examen/tarea): ").strip().lower()
+        
+        if tipo not in ["examen", "tarea"]:
+            print("Tipo de evaluación no válido")
+            return
+        
+        nombre = input("Nombre de la evaluación: ").strip()
+        puntaje_maximo = float(input("Puntaje máximo: "))
+        
+        if tipo == "examen":
+            tiempo_limite = int(input("Tiempo límite (minutos): "))
+            evaluacion = plataforma.crear_evaluacion(tipo, nombre, curso.id, puntaje_maximo, tiempo_limite=tiempo_limite)
+        else:
+            fecha_entrega = input("Fecha de entrega (YYYY-MM-DD): ").strip()
+            evaluacion = plataforma.crear_evaluacion(tipo, nombre, curso.id, puntaje_maximo, fecha_entrega=fecha_entrega)
+        
+        print(f"Evaluación creada exitosamente: {evaluacion.nombre} (ID: {evaluacion.id})")
+    except ValueError:
+        print("Error: Debe ingresar valores válidos")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def registrar_calificacion_interactivo(plataforma):
+    """Interfaz interactiva para registrar una calificación"""
+    print("\n--- REGISTRAR CALIFICACIÓN ---")
+    
+    try:
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
+            return
+        
+        # Listar evaluaciones del curso
+        evaluaciones = fuente_evaluaciones_curso(plataforma, curso.id)
+        if not evaluaciones.total():
+            print("El curso no tiene evaluaciones.")
+            return
+        
+        evaluacion = mostrar_listado("EVALUACIONES DISPONIBLES", evaluaciones, formato_evaluacion, seleccionar=True)
+        if evaluacion is None:
+            return
+        
+        # Listar estudiantes del curso
+        estudiantes = fuente_estudiantes_curso(plataforma, curso.id)
+        if not estudiantes.total():
+            print("El curso no tiene estudiantes inscritos.")
+            return
+        
+        estudiante = mostrar_listado("ESTUDIANTES INSCRITOS", estudiantes, formato_estudiante, seleccionar=True)
+        if estudiante is None:
+            return
+        
+        calificacion = float(input("Calificación: "))
+        
+        plataforma.registrar_calificacion(evaluacion.id, estudiante.id, calificacion, curso.id)
+        print(f"Calificación registrada exitosamente para {estudiante.nombre} en {evaluacion.nombre}")
+    except ValueError:
+        print("Error: Debe ingresar valores válidos")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def consultar_informacion_interactivo(plataforma):
+    """Interfaz interactiva para consultar información"""
+    while True:
+        mostrar_menu_consultas()
+        opcion = input("Seleccione una opción: ").strip()
+        
+        if opcion == "1":
+            # Listar todos los cursos
+            def formato_con_instructor(curso):
+                instructor = plataforma._usuarios.get(curso.instructor_id, None)
+                instructor_nombre = instructor.nombre if instructor else "Desconocido"
+                return f"{curso.nombre} (ID: {curso.id}) - Instructor: {instructor_nombre}"
+            
+            mostrar_listado("TODOS LOS CURSOS", fuente_cursos(plataforma), formato_con_instructor)
+        
+        elif opcion == "2":
+            # Listar estudiantes
+            mostrar_listado("TODOS LOS ESTUDIANTES", fuente_usuarios(plataforma, "estudiante"),
+                            lambda estudiante: f"{formato_estudiante(estudiante)} - "
+                                               f"Cursos inscritos: {len(estudiante.cursos_inscritos)}")
+        
+        elif opcion == "3":
+            # Listar instructores
+            mostrar_listado("TODOS LOS INSTRUCTORES", fuente_usuarios(plataforma, "instructor"), formato_instructor)
+        
+        elif opcion == "4":
+            # Ver estudiantes de un curso
+            try:
+                curso = seleccionar_curso(fuente_cursos(plataforma))
+                if curso is None:
+                    continue
+                
+                # Promedios del curso desde la caché de reportes (se recalculan solo tras escrituras)
+                promedios = plataforma.obtener_promedios_curso(curso.id)
+
+                def formato_con_promedio(estudiante):
+                    return f"{formato_estudiante(estudiante)} - Promedio: {promedios.get(estudiante.id, 0):.2f}"
+                
+                mostrar_listado(f"ESTUDIANTES INSCRITOS EN {curso.nombre}",
+                                fuente_estudiantes_curso(plataforma, curso.id), formato_con_promedio)
+            except ValueError:
+                print("Error: Debe ingresar un número válido")
+            except Exception as e:
+                print(f"Error: {e}")
+        
+        elif opcion == "5":
+            # Ver evaluaciones de un curso
+            try:
+                curso = seleccionar_curso(fuente_cursos(plataforma))
+                if curso is None:
+                    continue
+                
+                mostrar_listado(f"EVALUACIONES DE {curso.nombre}",
+                                fuente_evaluaciones_curso(plataforma, curso.id), formato_evaluacion)
+            except ValueError:
+                print("Error: Debe ingresar un número válido")
+            except Exception as e:
+                print(f"Error: {e}")
+        
+        elif opcion == "6":
+            # Volver al menú principal
+            break
+        
+        else:
+            print("Opción no válida. Intente nuevamente.")
+
+def generar_reportes_interactivo(plataforma):
+    """Interfaz interactiva para generar reportes"""
+    print("\n--- GENERAR REPORTES ---")
+    
+    try:
+        # Listar cursos disponibles
+        curso = seleccionar_curso(fuente_cursos(plataforma))
+        if curso is None:
+            return
+        
+        umbral = float(input("Umbral para promedios bajos (por defecto 60): ") or "60")
+        
+        reporte = plataforma.generar_reporte_promedios_bajos(curso.id, umbral)
+        
+        if not reporte:
+            print(f"No hay estudiantes con promedio inferior a {umbral} en este curso.")
+        else:
+            # Se pagina por posición para conservar el orden del reporte
+            mostrar_listado(f"REPORTE DE ESTUDIANTES CON PROMEDIO BAJO EN {curso.nombre}",
+                            FuenteListado(range(len(reporte)), reporte.__getitem__),
+                            lambda item: f"{item['estudiante'].nombre}: {item['promedio']:.2f}%")
+    except ValueError:
+        print("Error: Debe ingresar valores válidos")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def formato_metricas(item):
+    errores = sum(item['errores'].values())
+    detalle_errores = ", ".join(f"{tipo}: {cantidad}" for tipo, cantidad in item['errores'].items())
+    return (f"{item['metodo']}: {item['llamadas']} llamadas, {errores} errores"
+            f"{f' ({detalle_errores})' if errores else ''} - p50 {item['p50_ms']:.3f} ms, "
+            f"p95 {item['p95_ms']:.3f} ms, p99 {item['p99_ms']:.3f} ms, máx {item['maximo_ms']:.3f} ms")
+
+def metricas_interactivo(plataforma, instrumentacion):
+    """Interfaz interactiva para activar, ver y exportar las métricas"""
+    while True:
+        mostrar_menu_metricas(instrumentacion)
+        opcion = input("Seleccione una opción: ").strip()
+        
+        if opcion == "1":
+            if instrumentacion.activa:
+                instrumentacion.desinstrumentar()
+                print("Medición desactivada (las métricas acumuladas se conservan).")
+            else:
+                instrumentacion.instrumentar(plataforma)
+                print("Medición activada.")
+        
+        elif opcion == "2":
+            # Ordenadas por tiempo total: primero las operaciones que más pesan
+            reporte = instrumentacion.estadisticas()
+            if not reporte:
+                print("No hay métricas registradas. Active la medición y use la plataforma.")
+            else:
+                mostrar_listado("MÉTRICAS POR MÉTODO", FuenteListado(range(len(reporte)), reporte.__getitem__),
+                                formato_metricas)
+        
+        elif opcion == "3":
+            ruta = input("Archivo (.json, .prom o .txt): ").strip()
+            try:
+                instrumentacion.guardar(ruta)
+                print(f"Métricas exportadas a {ruta}")
+            except (ValueError, OSError) as e:
+                print(f"Error: {e}")
+        
+        elif opcion == "4":
+            instrumentacion.reiniciar()
+            print("Métricas reiniciadas.")
+        
+        elif opcion == "5":
+            break
+        
+        else:
+            print("Opción no válida. Intente nuevamente.")
+
+# FUNCIÓN PRINCIPAL PARA EJECUTAR EL SISTEMA CON MENÚ
+def ejecutar_sistema_con_menu(plataforma=None, instrumentacion=None):
+    """Función principal que ejecuta el sistema con un menú interactivo"""
+    plataforma = plataforma if plataforma is not None else PlataformaCursos()
+    # Sin instrumentación activa los métodos de la plataforma no se envuelven
+    instrumentacion = instrumentacion if instrumentacion is not None else Instrumentacion()
+    
+    # Menú principal
+    while True:
+        mostrar_menu_principal()
+        opcion = input("Seleccione una opción: ").strip()
+        
+        if opcion == "1":
+            registrar_usuario_interactivo(plataforma)
+        elif opcion == "2":
+            crear_curso_interactivo(plataforma)
+        elif opcion == "3":
+            inscribir_estudiante_interactivo(plataforma)
+        elif opcion == "4":
+            crear_evaluacion_interactivo(plataforma)
+        elif opcion == "5":
+            registrar_calificacion_interactivo(plataforma)
+        elif opcion == "6":
+            consultar_informacion_interactivo(plataforma)
+        elif opcion == "7":
+            generar_reportes_interactivo(plataforma)
+        elif opcion == "8":
+            metricas_interactivo(plataforma, instrumentacion)
+        elif opcion == "9":
+            print("¡Gracias por usar la plataforma de gestión de cursos!")
+            break
+        else:
+            print("Opción no válida. Intente nuevamente.")
+
+def crear_plataforma(db=None, bitacora=None):
+    """Plataforma con el motor elegido: SQLite, bitácora o solo memoria"""
+    if db and bitacora:
+        raise ValueError("Elija un solo motor de almacenamiento: --db o --bitacora")
+    if db:
+        from Almacenamiento import AlmacenamientoSQLite
+        return PlataformaCursos(AlmacenamientoSQLite(db))
+    if bitacora:
+        from Bitacora import AlmacenamientoBitacora
+        return PlataformaCursos(AlmacenamientoBitacora(bitacora))
+    return PlataformaCursos()
+
+def crear_perfilador(plataforma, nombres, umbral=1.0, archivo="perfiles.log"):
+    """
+    Perfila las funciones de este menú o los métodos de la plataforma con esos
+    nombres. El módulo de perfilado se importa solo aquí, al pedirlo.
+    """
+    from Perfilado import PerfiladorLento
+    
+    perfilador = PerfiladorLento(archivo, umbral)
+    menu = sys.modules[__name__]
+    try:
+        for nombre in (nombre.strip() for nombre in nombres):
+            if not nombre:
+                continue
+            # Las funciones del menú se buscan en el módulo en cada llamada, así que basta reemplazarlas aquí
+            objetivo = menu if callable(globals().get(nombre)) else plataforma
+            perfilador.instalar(objetivo, [nombre])
+    except ValueError:
+        perfilador.cerrar()
+        raise
+    return perfilador
+
+def main(argumentos=None):
+    """Lee las opciones de la línea de comandos e inicia el menú"""
+    parser = argparse.ArgumentParser(description="Plataforma de gestión de cursos online")
+    parser.add_argument('--db', help="archivo SQLite donde persistir los datos")
+    parser.add_argument('--bitacora', help="directorio de la bitácora y sus snapshots")
+    parser.add_argument('--metricas', help="mide las operaciones desde el inicio y guarda las métricas "
+                                           "en este archivo (.json o .prom) al salir")
+    # El perfilado también se activa con variables de entorno (PLATAFORMA_PERFILAR...)
+    parser.add_argument('--perfilar', default=os.environ.get('PLATAFORMA_PERFILAR'),
+                        help="funciones del menú o métodos de la plataforma a perfilar, separados por comas "
+                             "(p. ej. generar_reportes_interactivo,obtener_estudiantes_curso)")
+    # Se valida solo si se pide perfilar, para no fallar por una variable que no se usa
+    parser.add_argument('--perfilar-umbral', default=os.environ.get('PLATAFORMA_PERFILAR_UMBRAL', '1.0'),
+                        help="segundos a partir de los cuales se registra el perfil de una llamada")
+    parser.add_argument('--perfilar-log', default=os.environ.get('PLATAFORMA_PERFILAR_LOG', 'perfiles.log'),
+                        help="bitácora con rotación donde se escriben los perfiles")
+    args = parser.parse_args(argumentos)
+    
+    umbral = None
+    if args.perfilar:
+        try:
+            umbral = float(args.perfilar_umbral)
+        except ValueError:
+            parser.error(f"--perfilar-umbral debe ser un número de segundos: '{args.perfilar_umbral}'")
+        if not umbral >= 0:
+            parser.error(f"--perfilar-umbral debe ser un número no negativo: {args.perfilar_umbral}")
+    
+    plataforma = crear_plataforma(args.db, args.bitacora)
+    perfilador = None
+    if args.perfilar:
+        try:
+            perfilador = crear_perfilador(plataforma, args.perfilar.split(','), umbral, args.perfilar_log)
+        except ValueError as error:
+            plataforma.cerrar()
+            parser.error(str(error))
+    # Después del perfilado: al desactivar las métricas se reponen sus envolturas
+    instrumentacion = Instrumentacion()
+    if args.metricas:
+        instrumentacion.instrumentar(plataforma)
+    try:
+        ejecutar_sistema_con_menu(plataforma, instrumentacion)
+    finally:
+        instrumentacion.desinstrumentar()
+        if args.metricas:
+            instrumentacion.guardar(args.metricas)
+        if perfilador is not None:
+            perfilador.cerrar()
+        plataforma.cerrar()
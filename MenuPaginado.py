@@ -0,0 +1,221 @@
+"""
+LISTADOS PAGINADOS PARA LOS MENÚS
+Muestra listados grandes de a una página por vez. Cada página se arma completa
+y se escribe con una sola llamada de salida; se puede saltar a una página,
+filtrar por nombre a través de un índice y elegir un elemento por su ID sin
+mostrar el listado completo.
+"""
+
+from bisect import bisect_left
+import sys
+
+TAMANO_PAGINA = 20
+
+AYUDA = "[Enter] siguiente  [a] anterior  [p N] ir a página  [f texto] filtrar  [f] quitar filtro  [q] salir"
+AYUDA_SELECCION = "Elija un número de fila o #ID.  " + AYUDA
+
+class FuenteListado:
+    """
+    Origen de un listado paginado: IDs ordenados (cualquier secuencia con len
+    y recortes), una función para obtener cada elemento por ID y, opcional,
+    una función de filtro que devuelve los IDs ordenados que coinciden.
+    """
+
+    def __init__(self, ids, obtener, filtrar=None):
+        self._ids = ids
+        self._obtener = obtener
+        self._filtrar = filtrar
+
+    def total(self):
+        return len(self._ids)
+
+    def pagina(self, numero, tamano):
+        """Elementos de la página `numero` (desde 0), acceso directo por posición"""
+        inicio = numero * tamano
+        return [self._obtener(int(id_elemento)) for id_elemento in self._ids[inicio:inicio + tamano]]
+
+    def elemento_en(self, posicion):
+        return self._obtener(int(self._ids[posicion]))
+
+    def contiene(self, id_elemento):
+        posicion = bisect_left(self._ids, id_elemento)
+        return posicion < len(self._ids) and self._ids[posicion] == id_elemento
+
+    def obtener(self, id_elemento):
+        """Elemento con ese ID si pertenece al listado, si no None (búsqueda binaria)"""
+        return self._obtener(id_elemento) if self.contiene(id_elemento) else None
+
+    def filtrar(self, texto):
+        """Nueva fuente con los elementos que coinciden con el texto"""
+        if self._filtrar is None:
+            raise ValueError("Este listado no admite filtros")
+        return FuenteListado(self._filtrar(texto), self._obtener, self._filtrar)
+
+def fuente_desde_registro(registro):
+    """
+    Fuente para un diccionario {id: objeto con nombre}. El índice por nombre se
+    construye la primera vez que se filtra.
+    """
+    ids = sorted(registro)
+    indice = []
+
+    def filtrar(texto):
+        if not indice:
+            indice.extend(sorted((registro[id_elemento].nombre.strip().casefold(), id_elemento) for id_elemento in ids))
+        prefijo = texto.strip().casefold()
+        encontrados = []
+        posicion = bisect_left(indice, (prefijo,))
+        while posicion < len(indice) and indice[posicion][0].startswith(prefijo):
+            encontrados.append(indice[posicion][1])
+            posicion += 1
+        return sorted(encontrados)
+
+    return FuenteListado(ids, registro.__getitem__, filtrar)
+
+# FUENTES SOBRE LA PLATAFORMA (Plataforma.PlataformaCursos)
+def _filtro_usuarios(plataforma, tipo, permitidos=None):
+    """
+    Filtra por prefijo del nombre con el índice de la plataforma, o por email
+    exacto si el texto tiene '@'. Con `permitidos` (FuenteListado) el
+    resultado se limita a sus IDs.
+    """
+    def filtrar(texto):
+        if "@" in texto:
+            usuario = plataforma.obtener_usuario_por_email(texto)
+            ids = [usuario.id] if usuario is not None and usuario.obtener_tipo().lower() == tipo else []
+        else:
+            ids = plataforma.buscar_por_nombre(tipo, texto)
+        if permitidos is not None:
+            ids = [id_usuario for id_usuario in ids if permitidos.contiene(id_usuario)]
+        return ids
+
+    return filtrar
+
+def fuente_usuarios(plataforma, tipo):
+    """Usuarios de un tipo, ordenados por ID"""
+    tipo = tipo.lower()
+    return FuenteListado(plataforma.obtener_ids_ordenados(tipo), plataforma._usuarios.__getitem__,
+                         _filtro_usuarios(plataforma, tipo))
+
+def fuente_cursos(plataforma):
+    """Todos los cursos, ordenados por ID"""
+    return FuenteListado(plataforma.obtener_ids_ordenados("curso"), plataforma._cursos.__getitem__,
+                         lambda texto: plataforma.buscar_por_nombre("curso", texto))
+
+def fuente_estudiantes_curso(plataforma, curso_id):
+    """Estudiantes inscritos en un curso; el filtro se cruza con los inscritos"""
+    inscritos = FuenteListado(plataforma.obtener_ids_estudiantes_curso(curso_id), plataforma._usuarios.__getitem__)
+    inscritos._filtrar = _filtro_usuarios(plataforma, "estudiante", inscritos)
+    return inscritos
+
+def fuente_evaluaciones_curso(plataforma, curso_id):
+    """Evaluaciones de un curso"""
+    return fuente_desde_registro({evaluacion.id: evaluacion
+                                  for evaluacion in plataforma.obtener_evaluaciones_curso(curso_id)})
+
+def escribir(texto, salida=None):
+    """Escribe un bloque de texto con una sola llamada y vacía el buffer"""
+    salida = salida if salida is not None else sys.stdout
+    salida.write(texto)
+    salida.flush()
+
+def renderizar_pagina(titulo, fuente, numero, tamano, formatear, filtro=None, ayuda=AYUDA):
+    """Arma el texto completo de una página del listado"""
+    total = fuente.total()
+    paginas = max(1, -(-total // tamano))
+    lineas = [f"\n--- {titulo} ---"]
+    if filtro:
+        lineas.append(f"Filtro: '{filtro}'")
+    if not total:
+        lineas.append("No hay elementos para mostrar.")
+    for posicion, elemento in enumerate(fuente.pagina(numero, tamano), numero * tamano + 1):
+        lineas.append(f"{posicion}. {formatear(elemento)}")
+    lineas.append(f"Página {numero + 1}/{paginas} ({total} elementos)")
+    lineas.append(ayuda)
+    return "\n".join(lineas) + "\n"
+
+def mostrar_listado(titulo, fuente, formatear, seleccionar=False, tamano=TAMANO_PAGINA,
+                    entrada=input, salida=None):
+    """
+    Muestra un listado paginado. Con seleccionar=True devuelve el elemento
+    elegido por número de fila o por #ID (None si el usuario sale); si no,
+    solo permite recorrerlo.
+    """
+    original = fuente
+    numero = 0
+    filtro = None
+    mensaje = ""
+    while True:
+        paginas = max(1, -(-fuente.total() // tamano))
+        numero = min(numero, paginas - 1)
+        ayuda = AYUDA_SELECCION if seleccionar else AYUDA
+        escribir(mensaje + renderizar_pagina(titulo, fuente, numero, tamano, formatear, filtro, ayuda), salida)
+        mensaje = ""
+
+        comando = entrada("Opción: ").strip()
+        if comando == "" or comando.lower() == "s":
+            if numero + 1 < paginas:
+                numero += 1
+            elif not seleccionar:
+                return None
+            else:
+                mensaje = "Ya está en la última página.\n"
+        elif comando.lower() == "a":
+            numero = max(0, numero - 1)
+        elif comando.lower() == "q":
+            return None
+        elif comando.lower().startswith("p "):
+            try:
+                destino = int(comando[2:])
+            except ValueError:
+                mensaje = "Número de página no válido.\n"
+                continue
+            if 1 <= destino <= paginas:
+                numero = destino - 1
+            else:
+                mensaje = f"La página debe estar entre 1 y {paginas}.\n"
+        elif comando.lower() == "f" or comando.lower().startswith("f "):
+            texto = comando[2:].strip()
+            try:
+                fuente = original.filtrar(texto) if texto else original
+            except ValueError as e:
+                mensaje = f"{e}\n"
+                continue
+            filtro = texto or None
+            numero = 0
+        elif comando.startswith("#") and seleccionar:
+            try:
+                elemento = original.obtener(int(comando[1:]))
+            except ValueError:
+                mensaje = "ID no válido.\n"
+                continue
+            if elemento is not None:
+                return elemento
+            mensaje = f"No hay ningún elemento con ID {comando[1:]} en este listado.\n"
+        elif comando.isdigit() and seleccionar:
+            posicion = int(comando)
+            if 1 <= posicion <= fuente.total():
+                return fuente.elemento_en(posicion - 1)
+            mensaje = "Selección no válida.\n"
+        else:
+            mensaje = "Comando no válido.\n"
+
+# FORMATOS DE UNA FILA EN LOS LISTADOS PAGINADOS (compartidos por ambos menús)
+def formato_curso(curso):
+    return f"{curso.nombre} (ID: {curso.id})"
+
+def formato_estudiante(estudiante):
+    return f"{estudiante.nombre} ({estudiante.email}) - ID: {estudiante.id}"
+
+def formato_instructor(instructor):
+    return f"{instructor.nombre} ({instructor.email}) - Especialidad: {instructor.especialidad} - ID: {instructor.id}"
+
+def formato_evaluacion(evaluacion):
+    return f"{evaluacion.nombre} ({evaluacion.tipo_evaluacion()}) - Puntaje máximo: {evaluacion._puntaje_maximo}"
+
+def seleccionar_curso(cursos):
+    """Pide un curso de la fuente con el listado paginado (None si no hay cursos o se cancela)"""
+    if not cursos.total():
+        print("No hay cursos registrados.")
+        return None
+    return mostrar_listado("CURSOS DISPONIBLES", cursos, formato_curso, seleccionar=True)
@@ -0,0 +1,103 @@
+"""
+PERFILADO DE OPERACIONES LENTAS
+Envuelve funciones o métodos elegidos con cProfile y, cuando una llamada
+supera un umbral de tiempo, escribe sus funciones más costosas en una
+bitácora local con rotación. Es opcional: el menú solo importa este módulo
+si se pide con --perfilar o con la variable de entorno PLATAFORMA_PERFILAR.
+"""
+
+import cProfile
+from datetime import datetime
+import io
+import logging
+from logging.handlers import RotatingFileHandler
+import pstats
+import time
+
+class PerfiladorLento:
+    """
+    Perfila las llamadas de los objetivos instalados y registra las que
+    tardan al menos `umbral` segundos: duración y las `lineas` funciones con
+    mayor tiempo acumulado. El archivo rota al llegar a `maximo_bytes` y se
+    conservan `respaldos` archivos anteriores.
+    """
+
+    def __init__(self, archivo="perfiles.log", umbral=1.0, lineas=20, maximo_bytes=1_000_000, respaldos=3,
+                 reloj=time.perf_counter):
+        if umbral < 0:
+            raise ValueError("El umbral de perfilado no puede ser negativo")
+        self._umbral = umbral
+        self._lineas = lineas
+        self._reloj = reloj
+        self._en_curso = False
+        self._instalados = []  # [(objeto, nombre, atributo anterior o None)]
+        self._llamadas_lentas = 0
+        self._manejador = RotatingFileHandler(archivo, maxBytes=maximo_bytes, backupCount=respaldos,
+                                              encoding='utf-8', delay=True)
+        self._manejador.setFormatter(logging.Formatter('%(message)s'))
+
+    @property
+    def llamadas_lentas(self):
+        return self._llamadas_lentas
+
+    def envolver(self, funcion, nombre=None):
+        """Devuelve una versión de la función que se perfila en cada llamada"""
+        nombre = nombre or funcion.__name__
+
+        def envoltura(*args, **kwargs):
+            # cProfile no admite perfiles anidados: una llamada dentro de otra
+            # ya perfilada corre normal y queda incluida en el perfil externo
+            if self._en_curso:
+                return funcion(*args, **kwargs)
+            perfil = cProfile.Profile()
+            self._en_curso = True
+            inicio = self._reloj()
+            perfil.enable()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                perfil.disable()
+                duracion = self._reloj() - inicio
+                self._en_curso = False
+                if duracion >= self._umbral:
+                    self._registrar(nombre, duracion, perfil)
+
+        envoltura.__name__ = nombre
+        envoltura.__doc__ = funcion.__doc__
+        envoltura.__wrapped__ = funcion
+        return envoltura
+
+    def instalar(self, objeto, nombres):
+        """
+        Reemplaza los atributos `nombres` del objeto (una instancia o un
+        módulo) por versiones perfiladas hasta llamar a desinstalar().
+        """
+        for nombre in nombres:
+            funcion = getattr(objeto, nombre, None)
+            if not callable(funcion):
+                raise ValueError(f"No hay una función o método '{nombre}' para perfilar")
+            self._instalados.append((objeto, nombre, vars(objeto).get(nombre)))
+            setattr(objeto, nombre, self.envolver(funcion, nombre))
+
+    def desinstalar(self):
+        """Restaura las funciones originales"""
+        for objeto, nombre, anterior in reversed(self._instalados):
+            if anterior is None:
+                delattr(objeto, nombre)
+            else:
+                setattr(objeto, nombre, anterior)
+        self._instalados.clear()
+
+    def _registrar(self, nombre, duracion, perfil):
+        """Escribe en la bitácora el resumen del perfil de una llamada lenta"""
+        self._llamadas_lentas += 1
+        salida = io.StringIO()
+        pstats.Stats(perfil, stream=salida).sort_stats('cumulative').print_stats(self._lineas)
+        mensaje = (f"{datetime.now().isoformat(timespec='seconds')} {nombre} tardó {duracion:.3f} s "
+                   f"(umbral {self._umbral:g} s)\n{salida.getvalue().strip()}\n")
+        self._manejador.handle(logging.makeLogRecord({'msg': mensaje}))
+
+    def cerrar(self):
+        """Restaura las funciones y cierra el archivo de la bitácora"""
+        self.desinstalar()
+        self._manejador.close()
@@ -1,5 +1,29 @@
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from itertools import islice
+from types import MappingProxyType
+import csv
+import gc
+import heapq
+import json
+import math
+import os
+
+import numpy as np
+
+from Almacenamiento import Almacenamiento
+from CacheReportes import CacheReportes
+from ConjuntoEnteros import ConjuntoEnteros
+
+_CAPACIDAD_INICIAL = 4  # Filas/columnas iniciales de la matriz de calificaciones
+_TAMANO_LOTE = 10000  # Filas que se procesan por lote al cargar archivos
+_TAMANO_PAGINA = 50  # Elementos por página en las consultas paginadas
+_ID_MAXIMO = 0xFFFFFFFF  # Los índices guardan los IDs como enteros de 32 bits sin signo
+# Pools de concurrent.futures por nombre; el módulo se importa al usarlo (arranque más rápido)
+_EJECUTORES = {'hilos': 'ThreadPoolExecutor', 'procesos': 'ProcessPoolExecutor'}
 
 # CLASE BASE PARA MANEJO DE EXCEPCIONES PERSONALIZADAS
 class PlataformaError(Exception):
@@ -14,6 +38,191 @@ class CursoInexistenteError(PlataformaError):
     """Excepción para cuando un curso no existe"""
     pass
 
+# ÍNDICE BIDIRECCIONAL DE INSCRIPCIONES
+class IndiceInscripciones:
+    """
+    Única copia de las inscripciones curso <-> estudiante; Curso y Estudiante
+    solo exponen vistas sobre ella. La pertenencia se consulta en el conjunto
+    compacto del curso (O(1) desde ambos lados) y los dos lados conservan el
+    orden de inscripción.
+    """
+    
+    __slots__ = ('_inscritos', '_orden_curso', '_cursos_estudiante')
+    
+    def __init__(self):
+        self._inscritos = {}          # Diccionario: {curso_id: ConjuntoEnteros de estudiantes}
+        self._orden_curso = {}        # Diccionario: {curso_id: array de estudiantes en orden}
+        self._cursos_estudiante = {}  # Diccionario: {estudiante_id: array de cursos en orden}
+    
+    @staticmethod
+    def _validar_id(valor):
+        if not 0 <= valor <= _ID_MAXIMO:
+            raise ValueError(f"ID fuera de rango: {valor}")
+    
+    def _entrada_curso(self, curso_id):
+        conjunto = self._inscritos.get(curso_id)
+        if conjunto is None:
+            self._validar_id(curso_id)
+            conjunto = self._inscritos[curso_id] = ConjuntoEnteros()
+            self._orden_curso[curso_id] = array('I')
+        return conjunto
+    
+    def esta_inscrito(self, curso_id, estudiante_id):
+        conjunto = self._inscritos.get(curso_id)
+        return conjunto is not None and estudiante_id in conjunto
+    
+    def inscribir(self, curso_id, estudiante_id):
+        """Registra una inscripción en ambos lados del índice"""
+        conjunto = self._entrada_curso(curso_id)
+        if estudiante_id in conjunto:
+            raise UsuarioYaRegistradoError(f"El estudiante {estudiante_id} ya está inscrito")
+        # Todo lo que puede fallar se valida antes de modificar algún lado
+        conjunto.add(estudiante_id)
+        self._orden_curso[curso_id].append(estudiante_id)
+        self._cursos_estudiante.setdefault(estudiante_id, array('I')).append(curso_id)
+    
+    def inscribir_lote(self, curso_id, estudiante_ids):
+        """Registra un lote de estudiantes que aún no están inscritos (sin repetir)"""
+        conjunto = self._entrada_curso(curso_id)
+        conjunto.update(estudiante_ids)  # Valida el rango de todos los IDs antes de agregar
+        self._orden_curso[curso_id].extend(estudiante_ids)
+        cursos_estudiante = self._cursos_estudiante
+        for estudiante_id in estudiante_ids:
+            cursos = cursos_estudiante.get(estudiante_id)
+            if cursos is None:
+                cursos_estudiante[estudiante_id] = array('I', (curso_id,))
+            else:
+                cursos.append(curso_id)
+    
+    def cargar(self, inscripciones):
+        """Carga pares (curso_id, estudiante_id) conservando el orden en ambos lados"""
+        por_curso = {}
+        cursos_estudiante = self._cursos_estudiante
+        for curso_id, estudiante_id in inscripciones:
+            por_curso.setdefault(curso_id, []).append(estudiante_id)
+            cursos = cursos_estudiante.get(estudiante_id)
+            if cursos is None:
+                cursos_estudiante[estudiante_id] = array('I', (curso_id,))
+            else:
+                cursos.append(curso_id)
+        for curso_id, estudiante_ids in por_curso.items():
+            self._entrada_curso(curso_id).update(estudiante_ids)
+            self._orden_curso[curso_id].extend(estudiante_ids)
+        return por_curso.keys()
+    
+    def restaurar_curso(self, curso_id, estudiante_ids):
+        """
+        Carga el lado del curso guardado en un snapshot sin tocar el de los
+        estudiantes. Las inscripciones hechas después quedan al final.
+        """
+        conjunto = self._entrada_curso(curso_id)
+        posteriores = []
+        if len(conjunto):
+            guardados = set(estudiante_ids)
+            posteriores = [estudiante_id for estudiante_id in self._orden_curso[curso_id]
+                           if estudiante_id not in guardados]
+        conjunto.update(estudiante_ids)
+        self._orden_curso[curso_id] = array('I', estudiante_ids) + array('I', posteriores)
+    
+    def restaurar_estudiante(self, estudiante_id, curso_ids):
+        """Carga el lado del estudiante guardado en un snapshot (ver restaurar_curso)"""
+        posteriores = [curso_id for curso_id in self._cursos_estudiante.get(estudiante_id, ())
+                       if curso_id not in curso_ids]
+        self._cursos_estudiante[estudiante_id] = array('I', curso_ids) + array('I', posteriores)
+    
+    def estudiantes_de(self, curso_id):
+        """IDs de los estudiantes de un curso en orden de inscripción"""
+        return self._orden_curso.get(curso_id, array('I'))
+    
+    def cursos_de(self, estudiante_id):
+        """IDs de los cursos de un estudiante en orden de inscripción"""
+        return self._cursos_estudiante.get(estudiante_id, array('I'))
+    
+    def conjunto_curso(self, curso_id):
+        """Conjunto compacto de los estudiantes de un curso"""
+        return self._inscritos.get(curso_id, ConjuntoEnteros())
+    
+    def cantidad_inscritos(self, curso_id):
+        return len(self._orden_curso.get(curso_id, ()))
+
+# VISTAS DE SOLO LECTURA
+class VistaInscripciones(Sequence):
+    """
+    Vista viva de solo lectura sobre un lado del índice de inscripciones: los
+    estudiantes de un curso o los cursos de un estudiante, en orden de
+    inscripción. No copia nada; snapshot() devuelve una lista independiente.
+    """
+    
+    __slots__ = ('_indice', '_id', '_de_curso')
+    
+    def __init__(self, indice, id_dueno, de_curso):
+        self._indice = indice
+        self._id = id_dueno
+        self._de_curso = de_curso
+    
+    def _orden(self):
+        if self._de_curso:
+            return self._indice.estudiantes_de(self._id)
+        return self._indice.cursos_de(self._id)
+    
+    def __len__(self):
+        return len(self._orden())
+    
+    def __getitem__(self, indice):
+        return self._orden()[indice]
+    
+    def __iter__(self):
+        return iter(self._orden())
+    
+    def __contains__(self, valor):
+        # Pertenencia en O(1) sobre el conjunto del curso
+        if self._de_curso:
+            return self._indice.esta_inscrito(self._id, valor)
+        return self._indice.esta_inscrito(valor, self._id)
+    
+    def snapshot(self):
+        return list(self._orden())
+    
+    def __repr__(self):
+        return f"VistaInscripciones({self.snapshot()!r})"
+
+class VistaCalificaciones(Mapping):
+    """
+    Vista viva de solo lectura {estudiante_id: calificación} de una evaluación.
+    Lee directamente de la matriz del curso (o del diccionario de la evaluación
+    si aún no pertenece a un curso); snapshot() devuelve un diccionario.
+    """
+    
+    __slots__ = ('_evaluacion',)
+    
+    def __init__(self, evaluacion):
+        self._evaluacion = evaluacion
+    
+    def __getitem__(self, estudiante_id):
+        calificacion = self._evaluacion.obtener_calificacion(estudiante_id)
+        if calificacion is None:
+            raise KeyError(estudiante_id)
+        return calificacion
+    
+    def __contains__(self, estudiante_id):
+        return self._evaluacion.obtener_calificacion(estudiante_id) is not None
+    
+    def __iter__(self):
+        for estudiante_id, _ in self._evaluacion.iter_calificaciones():
+            yield estudiante_id
+    
+    def __len__(self):
+        evaluacion = self._evaluacion
+        if evaluacion._curso is None:
+            return len(evaluacion._calificaciones)
+        return evaluacion._curso._contar_columna(evaluacion._columna)
+    
+    def snapshot(self):
+        return dict(self._evaluacion.iter_calificaciones())
+    
+    def __repr__(self):
+        return f"VistaCalificaciones({self.snapshot()!r})"
+
 # CLASE PADRE PARA USUARIOS (APLICANDO HERENCIA)
 class Usuario(ABC):
     """
@@ -21,6 +230,9 @@ class Usuario(ABC):
     Aplica el principio de abstracción de POO.
     """
     
+    # __slots__ en toda la jerarquía: sin __dict__ por instancia
+    __slots__ = ('_id', '_nombre', '_email')
+    
     def __init__(self, id_usuario, nombre, email):
         self._id = id_usuario  # Encapsulamiento: atributo protegido
         self._nombre = nombre
@@ -48,25 +260,41 @@ class Usuario(ABC):
 
 # Subclase de usuario (estudiante, aplicando herencia)
 class Estudiante(Usuario):
+    __slots__ = ('_inscripciones',)
+    
     def __init__(self, id_usuario, nombre, email):
         super().__init__(id_usuario, nombre, email)
-        self._cursos_inscritos = []  # Lista de IDs de cursos
+        # Índice de inscripciones compartido (lo asigna la plataforma al registrarlo)
+        self._inscripciones = None
     
     def obtener_tipo(self):
         return "Estudiante"
     
+    def _indice(self):
+        # Un estudiante suelto (fuera de una plataforma) usa un índice propio
+        if self._inscripciones is None:
+            self._inscripciones = IndiceInscripciones()
+        return self._inscripciones
+    
     def inscribir_curso(self, curso_id):
         """Inscribe al estudiante en un curso"""
-        if curso_id not in self._cursos_inscritos:
-            self._cursos_inscritos.append(curso_id)
+        indice = self._indice()
+        if not indice.esta_inscrito(curso_id, self._id):
+            indice.inscribir(curso_id, self._id)
+    
+    def iter_cursos_inscritos(self):
+        """Recorre los IDs de los cursos del estudiante sin copiarlos"""
+        yield from self._indice().cursos_de(self._id)
     
     @property
     def cursos_inscritos(self):
-        return self._cursos_inscritos
+        return VistaInscripciones(self._indice(), self._id, de_curso=False)
     
 
 # Subclase de usuario (instructor, aplicando herencia)
 class Instructor(Usuario):
+    __slots__ = ('_especialidad',)
+    
     def __init__(self, id_usuario, nombre, email):
         super().__init__(id_usuario, nombre, email)
         self._especialidad = "General"  # Especialidad por defecto
@@ -85,22 +313,224 @@ class Curso:
     Aplica encapsulamiento con propiedades.
     """
     
-    def __init__(self, id_curso, nombre, instructor_id):
+    __slots__ = ('_id', '_nombre', '_instructor_id', '_inscripciones', '_evaluaciones',
+                 '_filas', '_ids_filas', '_matriz', '_num_columnas', '_sumas', '_conteos', '_filas_inscritos')
+    
+    def __init__(self, id_curso, nombre, instructor_id, inscripciones=None):
         self._id = id_curso
         self._nombre = nombre
         self._instructor_id = instructor_id
-        self._estudiantes_inscritos = set()  # Usamos set para evitar duplicados
+        # Índice de inscripciones de la plataforma (uno propio si el curso está suelto)
+        self._inscripciones = inscripciones if inscripciones is not None else IndiceInscripciones()
         self._evaluaciones = []
+        
+        # Matriz columnar de calificaciones: filas = estudiantes, columnas =
+        # evaluaciones, NaN = sin calificación. Crece por duplicación.
+        self._filas = {}      # Diccionario: {estudiante_id: fila}
+        self._ids_filas = np.zeros(_CAPACIDAD_INICIAL, dtype=np.int64)
+        self._matriz = np.full((_CAPACIDAD_INICIAL, _CAPACIDAD_INICIAL), np.nan)
+        self._num_columnas = 0
+        # Agregados por fila para leer promedios en O(1)
+        self._sumas = np.zeros(_CAPACIDAD_INICIAL)
+        self._conteos = np.zeros(_CAPACIDAD_INICIAL, dtype=np.int64)
+        self._filas_inscritos = []  # Filas de los inscritos, en orden de inscripción
 
     def inscribir_estudiante(self, estudiante_id):
         """Inscribe un estudiante en el curso"""
-        if estudiante_id in self._estudiantes_inscritos:
-            raise UsuarioYaRegistradoError(f"El estudiante {estudiante_id} ya está inscrito")
-        self._estudiantes_inscritos.add(estudiante_id)
+        self._sincronizar_filas()
+        self._inscripciones.inscribir(self._id, estudiante_id)
+        self._filas_inscritos.append(self._fila_estudiante(estudiante_id))
+    
+    def inscribir_estudiantes(self, estudiante_ids):
+        """Inscribe un lote de estudiantes que aún no están inscritos (sin repetir)"""
+        self._inscripciones.inscribir_lote(self._id, estudiante_ids)
+        self._sincronizar_filas()
+    
+    def esta_inscrito(self, estudiante_id):
+        return self._inscripciones.esta_inscrito(self._id, estudiante_id)
+    
+    def _sincronizar_filas(self):
+        """
+        Reserva filas en la matriz para las inscripciones del índice que aún
+        no tienen (las del final del orden de inscripción)
+        """
+        orden = self._inscripciones.estudiantes_de(self._id)
+        if len(orden) == len(self._filas_inscritos):
+            return
+        estudiante_ids = orden[len(self._filas_inscritos):].tolist()
+        
+        # Reservar de una sola vez las filas de los estudiantes que no tienen
+        sin_fila = [estudiante_id for estudiante_id in estudiante_ids if estudiante_id not in self._filas]
+        primera = len(self._filas)
+        ultima = primera + len(sin_fila)
+        if sin_fila:
+            capacidad = self._matriz.shape[0]
+            while capacidad < ultima:
+                capacidad *= 2
+            if capacidad > self._matriz.shape[0]:
+                self._redimensionar(capacidad, self._matriz.shape[1])
+            self._filas.update(zip(sin_fila, range(primera, ultima)))
+            self._ids_filas[primera:ultima] = sin_fila
+        
+        if len(sin_fila) == len(estudiante_ids):
+            # Caso habitual: todas las filas son nuevas y consecutivas
+            self._filas_inscritos.extend(range(primera, ultima))
+        else:
+            self._filas_inscritos.extend(map(self._filas.__getitem__, estudiante_ids))
     
     def agregar_evaluacion(self, evaluacion):
         """Agrega una evaluación al curso"""
         self._evaluaciones.append(evaluacion)
+        
+        # Reservar una columna de la matriz para la evaluación
+        if self._num_columnas == self._matriz.shape[1]:
+            self._redimensionar(self._matriz.shape[0], self._num_columnas * 2)
+        columna = self._num_columnas
+        self._num_columnas += 1
+        
+        # Migrar las calificaciones que la evaluación ya tuviera a la matriz
+        calificaciones_previas = evaluacion._calificaciones
+        evaluacion._curso = self
+        evaluacion._columna = columna
+        evaluacion._calificaciones = None
+        for estudiante_id, calificacion in calificaciones_previas.items():
+            self._asignar_calificacion(columna, estudiante_id, calificacion)
+    
+    # MÉTODOS INTERNOS DE LA MATRIZ DE CALIFICACIONES
+    def _redimensionar(self, filas, columnas):
+        """Amplía la matriz y los agregados conservando los datos"""
+        filas_actuales, columnas_actuales = self._matriz.shape
+        matriz = np.full((filas, columnas), np.nan)
+        matriz[:filas_actuales, :columnas_actuales] = self._matriz
+        self._matriz = matriz
+        if filas > filas_actuales:
+            self._ids_filas = np.resize(self._ids_filas, filas)
+            self._sumas = np.concatenate([self._sumas, np.zeros(filas - filas_actuales)])
+            self._conteos = np.concatenate([self._conteos, np.zeros(filas - filas_actuales, dtype=np.int64)])
+    
+    def _fila_estudiante(self, estudiante_id, crear=True):
+        """Devuelve la fila de un estudiante, reservándola si hace falta"""
+        fila = self._filas.get(estudiante_id)
+        if fila is None and crear:
+            fila = len(self._filas)
+            if fila == self._matriz.shape[0]:
+                self._redimensionar(fila * 2, self._matriz.shape[1])
+            self._filas[estudiante_id] = fila
+            self._ids_filas[fila] = estudiante_id
+        return fila
+    
+    def _asignar_calificacion(self, columna, estudiante_id, calificacion):
+        """Escribe una calificación en la matriz y actualiza los agregados"""
+        fila = self._fila_estudiante(estudiante_id)
+        anterior = self._matriz[fila, columna]
+        self._matriz[fila, columna] = calificacion
+        if np.isnan(anterior):
+            self._sumas[fila] += calificacion
+            self._conteos[fila] += 1
+        else:
+            # Sobrescritura: la cantidad no cambia, solo la suma
+            self._sumas[fila] += calificacion - anterior
+    
+    def _obtener_calificacion(self, columna, estudiante_id):
+        """Lee una calificación de la matriz (None si no existe)"""
+        fila = self._filas.get(estudiante_id)
+        if fila is None:
+            return None
+        calificacion = self._matriz[fila, columna]
+        return None if np.isnan(calificacion) else float(calificacion)
+    
+    def _asignar_calificaciones_lote(self, columna, estudiante_ids, calificaciones):
+        """
+        Escribe un lote de calificaciones (IDs sin repetir) en una columna y
+        actualiza los agregados una sola vez con operaciones vectorizadas.
+        """
+        filas = np.fromiter((self._fila_estudiante(estudiante_id) for estudiante_id in estudiante_ids.tolist()),
+                            dtype=np.int64, count=len(estudiante_ids))
+        anteriores = self._matriz[filas, columna]
+        nuevas = np.isnan(anteriores)
+        self._matriz[filas, columna] = calificaciones
+        self._sumas[filas] += calificaciones - np.where(nuevas, 0, anteriores)
+        self._conteos[filas] += nuevas
+    
+    def _iter_columna(self, columna):
+        """Recorre los pares (estudiante_id, calificación) de una columna, por lotes"""
+        valores = self._matriz[:len(self._filas), columna]
+        filas = np.flatnonzero(~np.isnan(valores))
+        for inicio in range(0, len(filas), _TAMANO_LOTE):
+            lote = filas[inicio:inicio + _TAMANO_LOTE]
+            yield from zip(self._ids_filas[lote].tolist(), valores[lote].tolist())
+    
+    def _contar_columna(self, columna):
+        """Cantidad de calificaciones registradas en una columna"""
+        return int(np.count_nonzero(~np.isnan(self._matriz[:len(self._filas), columna])))
+    
+    # CONSULTAS VECTORIZADAS
+    def promedio_estudiante(self, estudiante_id):
+        """Devuelve el promedio de un estudiante en O(1) (0 si no tiene notas)"""
+        fila = self._filas.get(estudiante_id)
+        if fila is None or not self._conteos[fila]:
+            return 0
+        return float(self._sumas[fila] / self._conteos[fila])
+    
+    def promedios_inscritos(self):
+        """
+        Devuelve dos arreglos (ids de estudiantes, promedios) con los inscritos
+        en orden de inscripción. Los estudiantes sin notas tienen promedio 0.
+        """
+        ids, sumas, conteos = self.agregados_inscritos()
+        return ids, _calcular_promedios(sumas, conteos)
+    
+    def agregados_inscritos(self):
+        """Copias de (ids, sumas, cantidad de notas) de los inscritos, en orden de inscripción"""
+        self._sincronizar_filas()
+        filas = np.array(self._filas_inscritos, dtype=np.int64)
+        return self._ids_filas[filas], self._sumas[filas], self._conteos[filas]
+    
+    def estadisticas_evaluacion(self, evaluacion):
+        """Calcula cantidad, promedio, mínimo, máximo y desviación de una evaluación"""
+        valores = self._matriz[:len(self._filas), evaluacion._columna]
+        valores = valores[~np.isnan(valores)]
+        if not len(valores):
+            return {'cantidad': 0, 'promedio': 0, 'minimo': None, 'maximo': None, 'desviacion': 0}
+        return {
+            'cantidad': int(len(valores)),
+            'promedio': float(valores.mean()),
+            'minimo': float(valores.min()),
+            'maximo': float(valores.max()),
+            'desviacion': float(valores.std())
+        }
+    
+    def reconstruir_agregados(self):
+        """
+        Reconstruye los agregados a partir de la matriz de calificaciones.
+        Devuelve True si los agregados mantenidos eran consistentes.
+        """
+        num_filas = len(self._filas)
+        matriz = self._matriz[:num_filas, :self._num_columnas]
+        sumas = np.nansum(matriz, axis=1)
+        conteos = np.count_nonzero(~np.isnan(matriz), axis=1)
+        
+        consistente = (np.array_equal(conteos, self._conteos[:num_filas])
+                       and np.allclose(sumas, self._sumas[:num_filas], rtol=1e-9, atol=1e-9))
+        self._sumas[:num_filas] = sumas
+        self._conteos[:num_filas] = conteos
+        return consistente
+    
+    def _restaurar(self, ids_filas, matriz, filas_inscritos):
+        """
+        Carga de una vez las filas, la matriz de calificaciones y las
+        inscripciones guardadas en un snapshot (las evaluaciones ya agregadas).
+        """
+        num_filas, num_columnas = matriz.shape
+        capacidad = max(_CAPACIDAD_INICIAL, num_filas)
+        self._redimensionar(capacidad, max(self._matriz.shape[1], num_columnas))
+        self._matriz[:num_filas, :num_columnas] = matriz
+        self._ids_filas[:num_filas] = ids_filas
+        self._filas = dict(zip(ids_filas.tolist(), range(num_filas)))
+        self._filas_inscritos = filas_inscritos.tolist()
+        self._inscripciones.restaurar_curso(self._id, ids_filas[filas_inscritos].tolist())
+        self._sincronizar_filas()
+        self.reconstruir_agregados()
 
  # Propiedades para acceso controlado a los atributos
     @property
@@ -115,9 +545,13 @@ class Curso:
     def instructor_id(self):
         return self._instructor_id
     
+    def iter_estudiantes_inscritos(self):
+        """Recorre los IDs de los inscritos en orden de inscripción sin copiarlos"""
+        yield from self._inscripciones.estudiantes_de(self._id)
+    
     @property
     def estudiantes_inscritos(self):
-        return list(self._estudiantes_inscritos)
+        return VistaInscripciones(self._inscripciones, self._id, de_curso=True)
     
     @property
     def evaluaciones(self):
@@ -130,26 +564,43 @@ class Evaluacion(ABC):
     Aplica el principio de polimorfismo de POO.
     """
     
+    __slots__ = ('_id', '_nombre', '_curso_id', '_puntaje_maximo', '_calificaciones', '_curso', '_columna')
+    
     def __init__(self, id_evaluacion, nombre, curso_id, puntaje_maximo):
         self._id = id_evaluacion
         self._nombre = nombre
         self._curso_id = curso_id
         self._puntaje_maximo = puntaje_maximo
-        self._calificaciones = {}  # Diccionario: {estudiante_id: calificación}
+        # Diccionario {estudiante_id: calificación} mientras la evaluación no
+        # pertenezca a un curso; después las notas viven en la matriz del curso
+        self._calificaciones = {}
+        self._curso = None  # Curso al que pertenece (lo asigna Curso.agregar_evaluacion)
+        self._columna = None  # Columna de la evaluación en la matriz del curso
     
     @abstractmethod
     def tipo_evaluacion(self):
         """Método abstracto que debe implementarse en subclases"""
         pass
     
+    def validar_calificacion(self, calificacion):
+        """Lanza ValueError si la calificación no es válida para esta evaluación"""
+        # NaN no cumple ninguna comparación y en la matriz significa "sin calificación"
+        if not math.isfinite(calificacion) or calificacion < 0 or calificacion > self._puntaje_maximo:
+            raise ValueError("Calificación fuera de rango válido")
+    
     def registrar_calificacion(self, estudiante_id, calificacion):
         """Registra una calificación para un estudiante"""
-        if calificacion < 0 or calificacion > self._puntaje_maximo:
-            raise ValueError("Calificación fuera de rango válido")
-        self._calificaciones[estudiante_id] = calificacion
+        self.validar_calificacion(calificacion)
+        if self._curso is not None:
+            # La matriz del curso también mantiene el promedio incremental
+            self._curso._asignar_calificacion(self._columna, estudiante_id, calificacion)
+        else:
+            self._calificaciones[estudiante_id] = calificacion
     
     def obtener_calificacion(self, estudiante_id):
         """Obtiene la calificación de un estudiante"""
+        if self._curso is not None:
+            return self._curso._obtener_calificacion(self._columna, estudiante_id)
         return self._calificaciones.get(estudiante_id, None)
     
     @property
@@ -160,12 +611,29 @@ class Evaluacion(ABC):
     def nombre(self):
         return self._nombre
     
+    @property
+    def curso_id(self):
+        return self._curso_id
+    
+    @property
+    def puntaje_maximo(self):
+        return self._puntaje_maximo
+    
+    def iter_calificaciones(self):
+        """Recorre los pares (estudiante_id, calificación) sin copiar el conjunto"""
+        if self._curso is not None:
+            yield from self._curso._iter_columna(self._columna)
+        else:
+            yield from self._calificaciones.items()
+    
     @property
     def calificaciones(self):
-        return self._calificaciones.copy()
+        return VistaCalificaciones(self)
     
  # SUBCLASES DE EVALUACION (APLICANDO HERENCIA Y POLIMORFISMO)
 class Examen(Evaluacion):
+    __slots__ = ('_tiempo_limite',)
+    
     def __init__(self, id_evaluacion, nombre, curso_id, puntaje_maximo, tiempo_limite):
         super().__init__(id_evaluacion, nombre, curso_id, puntaje_maximo)
         self._tiempo_limite = tiempo_limite  # en minutos
@@ -179,6 +647,8 @@ class Examen(Evaluacion):
 
  # SUBCLASES DE TAREA (APLICANDO HERENCIA Y POLIMORFISMO)
 class Tarea(Evaluacion):
+    __slots__ = ('_fecha_entrega',)
+    
     def __init__(self, id_evaluacion, nombre, curso_id, puntaje_maximo, fecha_entrega):
         super().__init__(id_evaluacion, nombre, curso_id, puntaje_maximo)
         self._fecha_entrega = fecha_entrega
@@ -196,42 +666,231 @@ class PlataformaCursos:
     Aplica composición para manejar usuarios, cursos y evaluaciones.
     """
     
-    def __init__(self):
+    # Clases de usuario que se pueden registrar, por nombre de tipo.
+    # Para soportar un nuevo tipo basta con agregar su subclase aquí.
+    _tipos_usuario = {
+        "estudiante": Estudiante,
+        "instructor": Instructor
+    }
+    
+    def __init__(self, almacenamiento=None, cache_reportes=None):
         self._usuarios = {}  # Diccionario: {id: objeto Usuario}
         self._cursos = {}    # Diccionario: {id: objeto Curso}
+        self._usuarios_por_email = {}  # Índice: {email normalizado: objeto Usuario}
+        self._inscripciones = IndiceInscripciones()  # Inscripciones curso <-> estudiante
+        # IDs ordenados para paginar por cursor: {tipo: array de IDs} y los de cursos
+        self._ids_por_tipo = {tipo: array('I') for tipo in self._tipos_usuario}
+        self._ids_cursos = array('I')
+        # Índices por nombre para búsquedas por prefijo, construidos al consultarlos:
+        # {tipo o 'curso': (IDs indexados, [(nombre normalizado, id)] ordenada)}
+        self._indices_nombres = {}
+        # Registros particionados: {tipo en minúsculas: {id: objeto Usuario}}
+        self._usuarios_por_tipo = {tipo: {} for tipo in self._tipos_usuario}
+        self._evaluaciones = {}  # Índice: {id: objeto Evaluacion} de todos los cursos
         self._proximo_id_usuario = 1
         self._proximo_id_curso = 1
         self._proximo_id_evaluacion = 1
-
+        # Resultados de reportes por curso; las escrituras invalidan los del curso afectado
+        self._cache_reportes = cache_reportes if cache_reportes is not None else CacheReportes()
+        
+        # Motor de almacenamiento: por defecto todo vive solo en memoria
+        self._almacenamiento = almacenamiento if almacenamiento is not None else Almacenamiento()
+        # La carga crea millones de objetos de vida larga: el recolector de
+        # ciclos se pausa mientras tanto para no recorrerlos una y otra vez
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            datos = self._almacenamiento.cargar()
+            if datos:
+                self._cargar_datos(datos)
+        finally:
+            if recolector_activo:
+                gc.enable()
+        self._almacenamiento.vincular(self)
+    
+    def _cargar_datos(self, datos):
+        """Reconstruye el estado en memoria a partir de las filas de un motor"""
+        for id_usuario, tipo, nombre, email in datos['usuarios']:
+            usuario = self._tipos_usuario[tipo](id_usuario, nombre, email)
+            self._agregar_usuario(usuario, self._normalizar_email(email))
+            self._proximo_id_usuario = max(self._proximo_id_usuario, id_usuario + 1)
+        
+        for id_curso, nombre, instructor_id in datos['cursos']:
+            self._cursos[id_curso] = Curso(id_curso, nombre, instructor_id, self._inscripciones)
+            _agregar_ordenado(self._ids_cursos, id_curso)
+            self._proximo_id_curso = max(self._proximo_id_curso, id_curso + 1)
+        
+        for id_evaluacion, curso_id, tipo, nombre, puntaje_maximo, extras in datos['evaluaciones']:
+            evaluacion = self._construir_evaluacion(id_evaluacion, tipo, nombre, curso_id, puntaje_maximo, **extras)
+            self._cursos[curso_id].agregar_evaluacion(evaluacion)
+            self._evaluaciones[id_evaluacion] = evaluacion
+            self._proximo_id_evaluacion = max(self._proximo_id_evaluacion, id_evaluacion + 1)
+        
+        # Inscripciones en el índice (ambos lados en el orden original) y
+        # después las filas de la matriz de cada curso, en lote
+        for curso_id in self._inscripciones.cargar(datos['inscripciones']):
+            self._cursos[curso_id]._sincronizar_filas()
+        
+        # Calificaciones agrupadas por evaluación (la última fila de cada
+        # estudiante prevalece) y escritas en lote en la matriz
+        por_evaluacion = {}
+        for evaluacion_id, estudiante_id, calificacion in datos['calificaciones']:
+            por_evaluacion.setdefault(evaluacion_id, {})[estudiante_id] = calificacion
+        for evaluacion_id, calificaciones in por_evaluacion.items():
+            evaluacion = self._evaluaciones[evaluacion_id]
+            self._cursos[evaluacion.curso_id]._asignar_calificaciones_lote(
+                evaluacion._columna,
+                np.fromiter(calificaciones.keys(), dtype=np.int64, count=len(calificaciones)),
+                np.fromiter(calificaciones.values(), dtype=np.float64, count=len(calificaciones)))
+    
+    def exportar_datos(self):
+        """
+        Devuelve el estado completo en el formato de filas que usan los motores
+        de almacenamiento (el mismo que reconstruye _cargar_datos).
+        """
+        datos = {
+            'usuarios': [(usuario.id, usuario.obtener_tipo().lower(), usuario.nombre, usuario.email)
+                         for usuario in self._usuarios.values()],
+            'cursos': [(curso.id, curso.nombre, curso.instructor_id) for curso in self._cursos.values()],
+            'evaluaciones': [(evaluacion.id, evaluacion.curso_id, evaluacion.tipo_evaluacion().lower(),
+                              evaluacion.nombre, evaluacion.puntaje_maximo, datos_extra_evaluacion(evaluacion))
+                             for evaluacion in self._evaluaciones.values()],
+            'inscripciones': [],
+            'calificaciones': []
+        }
+        
+        for curso in self._cursos.values():
+            datos['inscripciones'].extend((curso.id, estudiante_id)
+                                          for estudiante_id in curso.iter_estudiantes_inscritos())
+            
+            # Las columnas de la matriz siguen el orden de curso.evaluaciones
+            matriz = curso._matriz[:len(curso._filas), :curso._num_columnas]
+            filas, columnas = np.nonzero(~np.isnan(matriz))
+            evaluacion_ids = np.array([evaluacion.id for evaluacion in curso.evaluaciones], dtype=np.int64)
+            datos['calificaciones'].extend(zip(evaluacion_ids[columnas].tolist(),
+                                               curso._ids_filas[filas].tolist(),
+                                               matriz[filas, columnas].tolist()))
+        return datos
+    
+    def cerrar(self):
+        """Cierra el motor de almacenamiento"""
+        self._almacenamiento.cerrar()
  # MÉTODOS PARA REGISTRAR USUARIOS
+    @staticmethod
+    def _normalizar_email(email):
+        """Normaliza un email para usarlo como clave del índice"""
+        return email.strip().lower()
+    
     def registrar_usuario(self, tipo, nombre, email):
         """Registra un nuevo usuario en el sistema"""
-        # Verificar si el email ya está registrado
-        for usuario in self._usuarios.values():
-            if usuario.email == email:
-                raise UsuarioYaRegistradoError(f"El email {email} ya está registrado")
+        # Verificar si el email ya está registrado (búsqueda O(1) en el índice)
+        clave_email = self._normalizar_email(email)
+        if clave_email in self._usuarios_por_email:
+            raise UsuarioYaRegistradoError(f"El email {email} ya está registrado")
         
         # Crear usuario según el tipo
-        if tipo.lower() == "estudiante":
-            usuario = Estudiante(self._proximo_id_usuario, nombre, email)
-        elif tipo.lower() == "instructor":
-            usuario = Instructor(self._proximo_id_usuario, nombre, email)
-        else:
+        clase_usuario = self._tipos_usuario.get(tipo.lower())
+        if clase_usuario is None:
             raise ValueError("Tipo de usuario no válido")
+        usuario = clase_usuario(self._proximo_id_usuario, nombre, email)
         
-        # Agregar usuario al sistema
-        self._usuarios[usuario.id] = usuario
+        # Primero el motor: si falla, la memoria queda como estaba
+        self._almacenamiento.usuarios_registrados([usuario])
+        self._agregar_usuario(usuario, clave_email)
         self._proximo_id_usuario += 1
         return usuario
     
+    def _agregar_usuario(self, usuario, clave_email):
+        """Agrega un usuario al sistema manteniendo todos los índices"""
+        self._usuarios[usuario.id] = usuario
+        self._usuarios_por_email[clave_email] = usuario
+        tipo = usuario.obtener_tipo().lower()
+        self._usuarios_por_tipo.setdefault(tipo, {})[usuario.id] = usuario
+        _agregar_ordenado(self._ids_por_tipo.setdefault(tipo, array('I')), usuario.id)
+        if isinstance(usuario, Estudiante):
+            usuario._inscripciones = self._inscripciones
+    
+    def registrar_usuarios_lote(self, filas):
+        """
+        Registra un lote de usuarios a partir de filas (tipo, nombre, email) o
+        diccionarios con esas claves. Valida todo el lote en una sola pasada,
+        asigna un bloque contiguo de IDs a las filas válidas y devuelve
+        {'registrados': [usuarios], 'errores': [{'fila': n, 'error': excepción}]}
+        en lugar de detenerse en el primer error.
+        """
+        validas = []
+        errores = []
+        emails_lote = set()
+        
+        # Validación de todo el lote contra el índice de emails
+        for numero, fila in enumerate(filas, 1):
+            if isinstance(fila, dict):
+                fila = (fila.get('tipo'), fila.get('nombre'), fila.get('email'))
+            if (not isinstance(fila, (tuple, list)) or len(fila) != 3
+                    or not all(isinstance(valor, str) and valor.strip() for valor in fila)):
+                errores.append({'fila': numero, 'error': ValueError("Fila incompleta o con formato no válido")})
+                continue
+            tipo, nombre, email = fila
+            
+            clase_usuario = self._tipos_usuario.get(tipo.strip().lower())
+            if clase_usuario is None:
+                errores.append({'fila': numero, 'error': ValueError("Tipo de usuario no válido")})
+                continue
+            
+            clave_email = self._normalizar_email(email)
+            if clave_email in self._usuarios_por_email or clave_email in emails_lote:
+                errores.append({'fila': numero, 'error': UsuarioYaRegistradoError(f"El email {email} ya está registrado")})
+                continue
+            
+            emails_lote.add(clave_email)
+            validas.append((clase_usuario, nombre.strip(), email.strip(), clave_email))
+        
+        # Bloque contiguo de IDs para las filas válidas
+        registrados = [clase_usuario(id_usuario, nombre, email) for id_usuario, (clase_usuario, nombre, email, _)
+                       in enumerate(validas, self._proximo_id_usuario)]
+        
+        # Primero el motor: si falla, no se agrega ningún usuario del lote
+        if registrados:
+            self._almacenamiento.usuarios_registrados(registrados)
+        for usuario, (_, _, _, clave_email) in zip(registrados, validas):
+            self._agregar_usuario(usuario, clave_email)
+        self._proximo_id_usuario += len(registrados)
+        return {'registrados': registrados, 'errores': errores}
+    
+    def cargar_usuarios_desde_archivo(self, ruta, formato=None, tamano_lote=_TAMANO_LOTE):
+        """
+        Carga usuarios desde un archivo CSV o JSONL leyéndolo por lotes, sin
+        cargarlo completo en memoria. Devuelve la cantidad de usuarios
+        registrados y los errores con el número de fila del archivo.
+        """
+        registrados = 0
+        errores = []
+        desplazamiento = 0
+        
+        for lote in _leer_lotes(leer_filas_archivo(ruta, formato), tamano_lote):
+            resultado = self.registrar_usuarios_lote(lote)
+            registrados += len(resultado['registrados'])
+            for error in resultado['errores']:
+                error['fila'] += desplazamiento
+                errores.append(error)
+            desplazamiento += len(lote)
+        
+        return {'registrados': registrados, 'errores': errores}
+    
+    def obtener_usuario_por_email(self, email):
+        """Obtiene el usuario registrado con un email (None si no existe)"""
+        return self._usuarios_por_email.get(self._normalizar_email(email))
+    
     # MÉTODOS PARA GESTIONAR CURSOS
     def crear_curso(self, nombre, instructor_id):
         """Crea un nuevo curso en el sistema"""
         if instructor_id not in self._usuarios or not isinstance(self._usuarios[instructor_id], Instructor):
             raise ValueError("ID de instructor no válido")
         
-        curso = Curso(self._proximo_id_curso, nombre, instructor_id)
+        curso = Curso(self._proximo_id_curso, nombre, instructor_id, self._inscripciones)
+        self._almacenamiento.curso_creado(curso)
         self._cursos[curso.id] = curso
+        _agregar_ordenado(self._ids_cursos, curso.id)
         self._proximo_id_curso += 1
         return curso
     
@@ -243,12 +902,50 @@ class PlataformaCursos:
         if curso_id not in self._cursos:
             raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
         
-        # Inscribir estudiante en el curso
-        self._cursos[curso_id].inscribir_estudiante(estudiante_id)
+        curso = self._cursos[curso_id]
+        if curso.esta_inscrito(estudiante_id):
+            raise UsuarioYaRegistradoError(f"El estudiante {estudiante_id} ya está inscrito")
         
-        # Registrar el curso en el perfil del estudiante
-        estudiante = self._usuarios[estudiante_id]
-        estudiante.inscribir_curso(curso_id)
+        # Primero el motor; después el índice registra la inscripción en el curso y en el estudiante a la vez
+        self._almacenamiento.estudiantes_inscritos(curso_id, [estudiante_id])
+        curso.inscribir_estudiante(estudiante_id)
+        self._cache_reportes.invalidar_curso(curso_id)
+    
+    def inscribir_estudiantes_lote(self, curso_id, estudiante_ids):
+        """
+        Inscribe un lote de estudiantes en un curso. Clasifica los IDs con
+        operaciones de conjuntos y devuelve
+        {'inscritos': [ids], 'duplicados': [ids], 'invalidos': [ids]}
+        conservando el orden recibido, en lugar de detenerse en el primer error.
+        """
+        if curso_id not in self._cursos:
+            raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+        curso = self._cursos[curso_id]
+        
+        solicitados = dict.fromkeys(estudiante_ids)  # Sin repetir, en orden
+        # Pertenencia ID por ID: la diferencia de vistas recorrería el registro entero
+        estudiantes = self._usuarios_por_tipo["estudiante"]
+        invalidos = {estudiante_id for estudiante_id in solicitados if estudiante_id not in estudiantes}
+        duplicados = {estudiante_id for estudiante_id in solicitados
+                      if estudiante_id not in invalidos and curso.esta_inscrito(estudiante_id)}
+        descartados = invalidos | duplicados
+        if descartados:
+            nuevos = [estudiante_id for estudiante_id in solicitados if estudiante_id not in descartados]
+        else:
+            nuevos = list(solicitados)
+        
+        # Primero el motor; después el índice actualiza ambos lados de la inscripción
+        if nuevos:
+            self._almacenamiento.estudiantes_inscritos(curso_id, nuevos)
+        curso.inscribir_estudiantes(nuevos)
+        if nuevos:
+            self._cache_reportes.invalidar_curso(curso_id)
+        
+        return {
+            'inscritos': nuevos,
+            'duplicados': [estudiante_id for estudiante_id in solicitados if estudiante_id in duplicados],
+            'invalidos': [estudiante_id for estudiante_id in solicitados if estudiante_id in invalidos]
+        }
         
          # MÉTODOS PARA GESTIONAR EVALUACIONES
     def crear_evaluacion(self, tipo, nombre, curso_id, puntaje_maximo, **kwargs):
@@ -256,38 +953,134 @@ class PlataformaCursos:
         if curso_id not in self._cursos:
             raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
         
-        # Crear evaluación según el tipo
+        evaluacion = self._construir_evaluacion(self._proximo_id_evaluacion, tipo, nombre, curso_id,
+                                                puntaje_maximo, **kwargs)
+        
+        # Primero el motor; después se agrega la evaluación al curso y al índice global
+        self._almacenamiento.evaluacion_creada(evaluacion)
+        self._cursos[curso_id].agregar_evaluacion(evaluacion)
+        self._evaluaciones[evaluacion.id] = evaluacion
+        self._proximo_id_evaluacion += 1
+        self._cache_reportes.invalidar_curso(curso_id)
+        return evaluacion
+    
+    @staticmethod
+    def _construir_evaluacion(id_evaluacion, tipo, nombre, curso_id, puntaje_maximo, **kwargs):
+        """Crea una evaluación según el tipo"""
         if tipo.lower() == "examen":
             tiempo_limite = kwargs.get('tiempo_limite', 60)
-            evaluacion = Examen(self._proximo_id_evaluacion, nombre, curso_id, puntaje_maximo, tiempo_limite)
+            return Examen(id_evaluacion, nombre, curso_id, puntaje_maximo, tiempo_limite)
         elif tipo.lower() == "tarea":
             fecha_entrega = kwargs.get('fecha_entrega', datetime.now())
-            evaluacion = Tarea(self._proximo_id_evaluacion, nombre, curso_id, puntaje_maximo, fecha_entrega)
+            return Tarea(id_evaluacion, nombre, curso_id, puntaje_maximo, fecha_entrega)
         else:
             raise ValueError("Tipo de evaluación no válido")
-        
-        # Agregar evaluación al curso
-        self._cursos[curso_id].agregar_evaluacion(evaluacion)
-        self._proximo_id_evaluacion += 1
+    
+    def obtener_evaluacion(self, evaluacion_id):
+        """Obtiene una evaluación por su ID"""
+        evaluacion = self._evaluaciones.get(evaluacion_id)
+        if evaluacion is None:
+            raise ValueError("Evaluación no encontrada")
         return evaluacion
     
-    def registrar_calificacion(self, evaluacion_id, estudiante_id, calificacion, curso_id):
+    def registrar_calificacion(self, evaluacion_id, estudiante_id, calificacion, curso_id=None):
         """Registra una calificación para una evaluación"""
-        if curso_id not in self._cursos:
+        # El curso es opcional y solo se usa para verificar consistencia
+        if curso_id is not None and curso_id not in self._cursos:
             raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
         
-        # Buscar la evaluación en el curso
-        evaluacion = None
-        for eval_obj in self._cursos[curso_id].evaluaciones:
-            if eval_obj.id == evaluacion_id:
-                evaluacion = eval_obj
-                break
+        # Buscar la evaluación en el índice global (O(1))
+        evaluacion = self.obtener_evaluacion(evaluacion_id)
+        if curso_id is not None and evaluacion.curso_id != curso_id:
+            raise ValueError("La evaluación no pertenece al curso indicado")
         
-        if not evaluacion:
-            raise ValueError("Evaluación no encontrada")
-        
-        # Registrar la calificación
+        # Validar, persistir y recién entonces registrar la calificación
+        evaluacion.validar_calificacion(calificacion)
+        self._almacenamiento.calificaciones_registradas(evaluacion, [estudiante_id], [calificacion])
         evaluacion.registrar_calificacion(estudiante_id, calificacion)
+        self._cache_reportes.invalidar_curso(evaluacion.curso_id)
+    
+    def registrar_calificaciones_lote(self, evaluacion_id, filas):
+        """
+        Registra un lote de calificaciones para una evaluación a partir de filas
+        (estudiante_id, calificacion) o diccionarios con esas claves. Verifica
+        rango e inscripción de todo el lote de forma vectorizada; si un
+        estudiante tiene varias filas válidas vale la última, como al registrar
+        de a una. Actualiza la matriz y los promedios una sola vez y devuelve
+        {'aceptadas': n, 'rechazadas': n, 'errores': [{'fila': n, 'error': excepción}]}.
+        """
+        evaluacion = self.obtener_evaluacion(evaluacion_id)
+        curso = self._cursos[evaluacion.curso_id]
+        errores = []
+        numeros, ids, valores = [], [], []
+        
+        # Conversión de las filas; las mal formadas se rechazan aquí
+        for numero, fila in enumerate(filas, 1):
+            try:
+                if isinstance(fila, dict):
+                    fila = (fila['estudiante_id'], fila['calificacion'])
+                estudiante_id, calificacion = fila
+                # Se convierte todo antes de anexar, así las tres listas quedan alineadas
+                estudiante_id, calificacion = int(estudiante_id), float(calificacion)
+            except (KeyError, TypeError, ValueError):
+                errores.append({'fila': numero, 'error': ValueError("Fila incompleta o con formato no válido")})
+                continue
+            ids.append(estudiante_id)
+            valores.append(calificacion)
+            numeros.append(numero)
+        
+        ids = np.array(ids, dtype=np.int64)
+        valores = np.array(valores, dtype=np.float64)
+        
+        # Validaciones vectorizadas sobre todo el lote
+        en_rango = (valores >= 0) & (valores <= evaluacion._puntaje_maximo)
+        inscritos = self._inscripciones.conjunto_curso(curso.id).contiene_arreglo(ids)
+        # Entre las filas válidas, la última de cada estudiante (np.unique da la
+        # primera aparición, por eso se recorren invertidas)
+        validas = np.flatnonzero(en_rango & inscritos)[::-1]
+        aceptadas = np.zeros(len(ids), dtype=bool)
+        aceptadas[validas[np.unique(ids[validas], return_index=True)[1]]] = True
+        
+        for posicion in np.flatnonzero(~aceptadas).tolist():
+            if not en_rango[posicion]:
+                error = ValueError("Calificación fuera de rango válido")
+            elif not inscritos[posicion]:
+                error = ValueError(f"El estudiante {ids[posicion]} no está inscrito en el curso")
+            else:
+                error = ValueError(f"El estudiante {ids[posicion]} tiene otra fila más adelante en el lote; "
+                                   "vale la última")
+            errores.append({'fila': numeros[posicion], 'error': error})
+        errores.sort(key=lambda error: error['fila'])
+        
+        # Escritura del lote en la matriz y actualización única de agregados
+        ids, valores = ids[aceptadas], valores[aceptadas]
+        if len(ids):
+            self._almacenamiento.calificaciones_registradas(evaluacion, ids.tolist(), valores.tolist())
+        curso._asignar_calificaciones_lote(evaluacion._columna, ids, valores)
+        if len(ids):
+            self._cache_reportes.invalidar_curso(curso.id)
+        
+        total_aceptadas = len(ids)
+        return {'aceptadas': total_aceptadas, 'rechazadas': len(errores), 'errores': errores}
+    
+    def cargar_calificaciones_desde_archivo(self, evaluacion_id, ruta, formato=None, tamano_lote=_TAMANO_LOTE):
+        """
+        Carga calificaciones de una evaluación desde un archivo CSV o JSONL con
+        columnas estudiante_id y calificacion, leyéndolo por lotes.
+        """
+        aceptadas = 0
+        errores = []
+        desplazamiento = 0
+        
+        for lote in _leer_lotes(leer_filas_archivo(ruta, formato), tamano_lote):
+            resultado = self.registrar_calificaciones_lote(evaluacion_id, lote)
+            aceptadas += resultado['aceptadas']
+            for error in resultado['errores']:
+                error['fila'] += desplazamiento
+                errores.append(error)
+            desplazamiento += len(lote)
+        
+        return {'aceptadas': aceptadas, 'rechazadas': len(errores), 'errores': errores}
     
     # MÉTODOS DE CONSULTA
     def obtener_estudiantes_curso(self, curso_id):
@@ -295,8 +1088,29 @@ class PlataformaCursos:
         if curso_id not in self._cursos:
             raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
         
-        return [self._usuarios[est_id] for est_id in self._cursos[curso_id].estudiantes_inscritos]
-    
+        return [self._usuarios[est_id] for est_id in self._cursos[curso_id].iter_estudiantes_inscritos()]
+
+    def comparar_inscripciones(self, curso_id_a, curso_id_b, operacion="diferencia"):
+        """
+        Cruza los inscritos de dos cursos sin construir sets de Python.
+        operacion: 'diferencia' (en A pero no en B), 'interseccion' o 'union'.
+        Devuelve los estudiantes ordenados por ID.
+        """
+        operaciones = {
+            "diferencia": ConjuntoEnteros.__sub__,
+            "interseccion": ConjuntoEnteros.__and__,
+            "union": ConjuntoEnteros.__or__
+        }
+        if operacion not in operaciones:
+            raise ValueError(f"Operación no válida: {operacion}")
+        for curso_id in (curso_id_a, curso_id_b):
+            if curso_id not in self._cursos:
+                raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+
+        resultado = operaciones[operacion](self._inscripciones.conjunto_curso(curso_id_a),
+                                           self._inscripciones.conjunto_curso(curso_id_b))
+        return [self._usuarios[estudiante_id] for estudiante_id in resultado]
+
     def obtener_promedio_estudiante(self, estudiante_id, curso_id):
         """Calcula el promedio de un estudiante en un curso"""
         if curso_id not in self._cursos:
@@ -305,43 +1119,189 @@ class PlataformaCursos:
         if estudiante_id not in self._usuarios or not isinstance(self._usuarios[estudiante_id], Estudiante):
             raise ValueError("ID de estudiante no válido")
         
-        curso = self._cursos[curso_id]
-        calificaciones = []
+        # Lectura O(1) del promedio mantenido incrementalmente por el curso
+        return self._cursos[curso_id].promedio_estudiante(estudiante_id)
+    
+    def generar_reporte_promedios_bajos(self, curso_id, umbral=60):
+        """Genera un reporte de estudiantes con promedio bajo en un curso"""
+        if curso_id not in self._cursos:
+            raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+        return self._cache_reportes.obtener(
+            (curso_id, 'promedios_bajos', umbral), lambda: self._calcular_promedios_bajos(curso_id, umbral))
+    
+    def _calcular_promedios_bajos(self, curso_id, umbral):
+        # El motor puede resolver el reporte con agregados SQL
+        filas = self._almacenamiento.reporte_promedios_bajos(curso_id, umbral)
+        if filas is None:
+            # Una sola reducción vectorizada sobre los inscritos del curso
+            ids, promedios = self._cursos[curso_id].promedios_inscritos()
+            bajos = np.flatnonzero(promedios < umbral)
+            filas = zip(ids[bajos].tolist(), promedios[bajos].tolist())
         
-        # Recopilar todas las calificaciones del estudiante en este curso
-        for evaluacion in curso.evaluaciones:
-            calificacion = evaluacion.obtener_calificacion(estudiante_id)
-            if calificacion is not None:
-                calificaciones.append(calificacion)
+        return [
+            {
+                'estudiante': self._usuarios[estudiante_id],
+                'promedio': promedio
+            }
+            for estudiante_id, promedio in filas
+        ]
+    
+    def generar_reporte_riesgo_global(self, umbral=60, trabajadores=None, ejecutor="hilos"):
+        """
+        Reporte de promedios bajos de todos los cursos a la vez. Los cursos se
+        reparten en grupos entre un pool de hilos (por defecto: el cálculo es
+        NumPy y libera el GIL) o de procesos (ejecutor="procesos"), y los
+        resultados se unen en una lista ordenada por curso y, dentro de cada
+        curso, por promedio: [{'curso', 'estudiante', 'promedio'}].
+        """
+        if ejecutor not in _EJECUTORES:
+            raise ValueError(f"Ejecutor no válido: {ejecutor} (use 'hilos' o 'procesos')")
+        trabajadores = trabajadores or os.cpu_count() or 1
         
-        # Calcular promedio
-        if not calificaciones:
-            return 0
+        # Los arreglos se copian en este hilo: los trabajadores no tocan los cursos
+        partes = [(curso_id, *self._cursos[curso_id].agregados_inscritos()) for curso_id in self._ids_cursos]
+        grupos = [partes[inicio::trabajadores] for inicio in range(min(trabajadores, len(partes)))]
+        if len(grupos) <= 1:
+            resultados = [_promedios_bajos_cursos(grupo, umbral) for grupo in grupos]
+        else:
+            import concurrent.futures
+            pool_ejecutor = getattr(concurrent.futures, _EJECUTORES[ejecutor])
+            with pool_ejecutor(max_workers=len(grupos)) as pool:
+                resultados = list(pool.map(_promedios_bajos_cursos, grupos, [umbral] * len(grupos)))
         
-        return sum(calificaciones) / len(calificaciones)
+        # Armar los diccionarios del reporte es secuencial: cuesta por estudiante en riesgo
+        reporte = []
+        usuarios = self._usuarios
+        for curso_id, ids, promedios in sorted((parte for resultado in resultados for parte in resultado),
+                                               key=lambda parte: parte[0]):
+            curso = self._cursos[curso_id]
+            reporte.extend({'curso': curso, 'estudiante': usuarios[estudiante_id], 'promedio': promedio}
+                           for estudiante_id, promedio in zip(ids, promedios))
+        return reporte
     
-    def generar_reporte_promedios_bajos(self, curso_id, umbral=60):
-        """Genera un reporte de estudiantes con promedio bajo en un curso"""
+    def _promedios_curso(self, curso_id):
         if curso_id not in self._cursos:
             raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+        return self._cursos[curso_id].promedios_inscritos()
+    
+    def obtener_promedios_curso(self, curso_id):
+        """
+        Vista de solo lectura {estudiante_id: promedio} de los inscritos en un
+        curso. Se guarda en la caché de reportes: sin escrituras en el curso,
+        las consultas siguientes no recalculan nada.
+        """
+        def calcular():
+            ids, promedios = self._promedios_curso(curso_id)
+            return MappingProxyType(dict(zip(ids.tolist(), promedios.tolist())))
         
-        estudiantes_bajos = []
+        return self._cache_reportes.obtener((curso_id, 'promedios', None), calcular)
+    
+    def estadisticas_cache_reportes(self):
+        """Aciertos, fallos, invalidaciones y ocupación de la caché de reportes"""
+        return self._cache_reportes.estadisticas()
+    
+    def generar_reporte_extremos(self, curso_id, k=10, mayores=False):
+        """
+        Reporte de los K estudiantes con promedio más bajo (o más alto con
+        mayores=True) de un curso, ordenado. Usa un heap acotado a K elementos:
+        O(n log K) en una pasada, sin ordenar todos los promedios. Los empates
+        se resuelven por ID.
+        """
+        if k < 0:
+            raise ValueError("K no puede ser negativo")
+        return self._cache_reportes.obtener(
+            (curso_id, 'extremos', (k, mayores)), lambda: self._calcular_extremos(curso_id, k, mayores))
+    
+    def _calcular_extremos(self, curso_id, k, mayores):
+        ids, promedios = self._promedios_curso(curso_id)
+        pares = zip(promedios.tolist(), ids.tolist())
+        clave = (lambda par: (-par[0], par[1])) if mayores else None
+        return [
+            {
+                'estudiante': self._usuarios[estudiante_id],
+                'promedio': promedio
+            }
+            for promedio, estudiante_id in heapq.nsmallest(k, pares, key=clave)
+        ]
+    
+    def generar_reporte_percentiles(self, curso_id, percentiles=(10, 25, 50)):
+        """
+        Cortes de percentil de los promedios de un curso, con interpolación
+        lineal: {'cantidad': n, 'p10': ..., 'p25': ..., 'p50': ...} (p50 es la
+        mediana). Usa una sola selección parcial (np.partition) en lugar de
+        ordenar todos los promedios. Con el curso vacío los cortes son None.
+        """
+        if any(not 0 <= percentil <= 100 for percentil in percentiles):
+            raise ValueError("Los percentiles deben estar entre 0 y 100")
+        return self._cache_reportes.obtener(
+            (curso_id, 'percentiles', tuple(percentiles)), lambda: self._calcular_percentiles(curso_id, percentiles))
+    
+    def _calcular_percentiles(self, curso_id, percentiles):
+        _, promedios = self._promedios_curso(curso_id)
+        cantidad = len(promedios)
+        reporte = {'cantidad': cantidad}
+        if not cantidad:
+            reporte.update((f"p{percentil:g}", None) for percentil in percentiles)
+            return reporte
         
-        for estudiante_id in self._cursos[curso_id].estudiantes_inscritos:
-            promedio = self.obtener_promedio_estudiante(estudiante_id, curso_id)
-            if promedio < umbral:
-                estudiante = self._usuarios[estudiante_id]
-                estudiantes_bajos.append({
-                    'estudiante': estudiante,
-                    'promedio': promedio
-                })
+        # Posiciones fraccionarias en el orden ascendente; se seleccionan sus vecinas enteras
+        posiciones = [percentil / 100 * (cantidad - 1) for percentil in percentiles]
+        vecinas = sorted({int(posicion) for posicion in posiciones} |
+                         {min(int(posicion) + 1, cantidad - 1) for posicion in posiciones})
+        seleccion = np.partition(promedios, vecinas)
+        for percentil, posicion in zip(percentiles, posiciones):
+            inferior = int(posicion)
+            superior = min(inferior + 1, cantidad - 1)
+            fraccion = posicion - inferior
+            reporte[f"p{percentil:g}"] = float(seleccion[inferior] + (seleccion[superior] - seleccion[inferior]) * fraccion)
+        return reporte
+    
+    def obtener_posicion_estudiante(self, estudiante_id, curso_id):
+        """
+        Posición de un estudiante en su curso según el promedio (1 = el más
+        alto; los empates comparten posición) y el percentil: porcentaje de
+        inscritos con promedio menor o igual. Una pasada sobre los inscritos.
+        """
+        ids, promedios = self._promedios_curso(curso_id)
+        fila = np.flatnonzero(ids == estudiante_id)
+        if not len(fila):
+            raise ValueError(f"El estudiante {estudiante_id} no está inscrito en el curso {curso_id}")
         
-        return estudiantes_bajos
+        promedio = promedios[fila[0]]
+        return {
+            'estudiante': self._usuarios[estudiante_id],
+            'promedio': float(promedio),
+            'posicion': int(np.count_nonzero(promedios > promedio)) + 1,
+            'total': len(promedios),
+            'percentil': float(np.count_nonzero(promedios <= promedio) * 100 / len(promedios))
+        }
+    
+    def obtener_estadisticas_evaluacion(self, evaluacion_id):
+        """Obtiene las estadísticas de calificaciones de una evaluación"""
+        evaluacion = self.obtener_evaluacion(evaluacion_id)
+        return self._cursos[evaluacion.curso_id].estadisticas_evaluacion(evaluacion)
+    
+    def verificar_agregados(self):
+        """
+        Reconstruye los promedios incrementales de todos los cursos desde las
+        calificaciones y devuelve los IDs de los cursos que eran inconsistentes.
+        """
+        return [curso.id for curso in self._cursos.values() if not curso.reconstruir_agregados()]
     
  # MÉTODOS PARA OBTENER INFORMACIÓN (útiles para el menú)
     def obtener_usuarios_por_tipo(self, tipo):
         """Obtiene todos los usuarios de un tipo específico"""
-        return [usuario for usuario in self._usuarios.values() if usuario.obtener_tipo().lower() == tipo.lower()]
+        # Solo se recorre el registro del tipo pedido
+        return list(self._usuarios_por_tipo.get(tipo.lower(), {}).values())
+    
+    def contar_usuarios_por_tipo(self, tipo=None):
+        """
+        Devuelve en O(1) la cantidad de usuarios de un tipo, o un diccionario
+        {tipo: cantidad} con todos los tipos si no se indica ninguno.
+        """
+        if tipo is None:
+            return {nombre: len(registro) for nombre, registro in self._usuarios_por_tipo.items()}
+        return len(self._usuarios_por_tipo.get(tipo.lower(), {}))
     
     def obtener_todos_cursos(self):
         """Obtiene todos los cursos registrados"""
@@ -352,3 +1312,212 @@ class PlataformaCursos:
         if curso_id not in self._cursos:
             raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
         return self._cursos[curso_id].evaluaciones
+    
+    # CONSULTAS PAGINADAS Y POR STREAMING
+    # El cursor es el último ID entregado: las páginas se ordenan por ID y los
+    # IDs nuevos siempre son mayores, así que las inserciones concurrentes no
+    # desplazan ni repiten elementos de las páginas siguientes.
+    @staticmethod
+    def _armar_pagina(ids, registro, cursor, tamano):
+        """Arma la página a partir de hasta tamano + 1 IDs mayores que el cursor"""
+        hay_mas = len(ids) > tamano
+        ids = ids[:tamano]
+        return {
+            'elementos': [registro[id_elemento] for id_elemento in ids],
+            'siguiente_cursor': ids[-1] if ids else cursor,
+            'hay_mas': hay_mas
+        }
+    
+    @staticmethod
+    def _validar_tamano_pagina(tamano):
+        if tamano < 1:
+            raise ValueError("El tamaño de página debe ser mayor que cero")
+    
+    def paginar_cursos(self, cursor=None, tamano=_TAMANO_PAGINA):
+        """
+        Devuelve hasta `tamano` cursos con ID mayor que el cursor como
+        {'elementos': [cursos], 'siguiente_cursor': id, 'hay_mas': bool}
+        """
+        self._validar_tamano_pagina(tamano)
+        ids = _siguientes_ordenados(self._ids_cursos, cursor, tamano + 1)
+        return self._armar_pagina(ids, self._cursos, cursor, tamano)
+    
+    def paginar_usuarios_por_tipo(self, tipo, cursor=None, tamano=_TAMANO_PAGINA):
+        """Página de usuarios de un tipo ordenados por ID (ver paginar_cursos)"""
+        self._validar_tamano_pagina(tamano)
+        ids = _siguientes_ordenados(self._ids_por_tipo.get(tipo.lower(), ()), cursor, tamano + 1)
+        return self._armar_pagina(ids, self._usuarios, cursor, tamano)
+    
+    def paginar_estudiantes_curso(self, curso_id, cursor=None, tamano=_TAMANO_PAGINA):
+        """Página de estudiantes inscritos en un curso ordenados por ID (ver paginar_cursos)"""
+        if curso_id not in self._cursos:
+            raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+        self._validar_tamano_pagina(tamano)
+        # Se lee el índice sin materializar el curso: todos los motores (también el
+        # snapshot binario al abrirse) lo cargan completo para cada curso
+        ids = self._inscripciones.conjunto_curso(curso_id).siguientes(cursor, tamano + 1)
+        return self._armar_pagina(ids, self._usuarios, cursor, tamano)
+    
+    def obtener_ids_ordenados(self, tipo):
+        """Copia de los IDs ordenados de un tipo de usuario o de los cursos ('curso')"""
+        if tipo.lower() == "curso":
+            return array('I', self._ids_cursos)
+        return array('I', self._ids_por_tipo.get(tipo.lower(), ()))
+    
+    def obtener_ids_estudiantes_curso(self, curso_id):
+        """IDs ordenados de los estudiantes inscritos en un curso (arreglo NumPy)"""
+        if curso_id not in self._cursos:
+            raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+        return self._inscripciones.conjunto_curso(curso_id).a_arreglo()
+    
+    def _indice_nombres(self, tipo):
+        """
+        Devuelve la lista ordenada [(nombre normalizado, id)] de un tipo de
+        usuario o de los cursos. Se construye en la primera búsqueda y luego
+        solo se le agregan los IDs nuevos.
+        """
+        es_curso = tipo == "curso"
+        ids = self._ids_cursos if es_curso else self._ids_por_tipo.get(tipo, array('I'))
+        registro = self._cursos if es_curso else self._usuarios
+        indexados, ultimo_id, entradas = self._indices_nombres.get(tipo, (0, None, []))
+        
+        # Los IDs nuevos suelen quedar al final del array ordenado; si no, se reconstruye
+        if indexados and (indexados > len(ids) or ids[indexados - 1] != ultimo_id):
+            indexados, entradas = 0, []
+        nuevos = ids[indexados:]
+        if len(nuevos) > len(entradas) // 8:
+            entradas.extend((registro[id_elemento].nombre.strip().casefold(), id_elemento) for id_elemento in nuevos)
+            entradas.sort()
+        else:
+            for id_elemento in nuevos:
+                insort(entradas, (registro[id_elemento].nombre.strip().casefold(), id_elemento))
+        self._indices_nombres[tipo] = (len(ids), ids[-1] if ids else None, entradas)
+        return entradas
+    
+    def buscar_por_nombre(self, tipo, texto, limite=None):
+        """
+        IDs ordenados de los usuarios de un tipo (o de los cursos con tipo
+        'curso') cuyo nombre empieza con el texto, sin distinguir mayúsculas.
+        """
+        entradas = self._indice_nombres(tipo.lower())
+        prefijo = texto.strip().casefold()
+        ids = []
+        posicion = bisect_left(entradas, (prefijo,))
+        while posicion < len(entradas) and entradas[posicion][0].startswith(prefijo):
+            if limite is not None and len(ids) >= limite:
+                break
+            ids.append(entradas[posicion][1])
+            posicion += 1
+        return sorted(ids)
+    
+    @staticmethod
+    def _recorrer_paginas(paginar, tamano_lote):
+        cursor = None
+        while True:
+            pagina = paginar(cursor, tamano_lote)
+            yield from pagina['elementos']
+            if not pagina['hay_mas']:
+                return
+            cursor = pagina['siguiente_cursor']
+    
+    def iter_cursos(self, tamano_lote=_TAMANO_LOTE):
+        """Recorre los cursos por ID con memoria constante"""
+        return self._recorrer_paginas(self.paginar_cursos, tamano_lote)
+    
+    def iter_usuarios_por_tipo(self, tipo, tamano_lote=_TAMANO_LOTE):
+        """Recorre los usuarios de un tipo por ID con memoria constante"""
+        return self._recorrer_paginas(
+            lambda cursor, tamano: self.paginar_usuarios_por_tipo(tipo, cursor, tamano), tamano_lote)
+    
+    def iter_estudiantes_curso(self, curso_id, tamano_lote=_TAMANO_LOTE):
+        """Recorre los estudiantes de un curso por ID con memoria constante"""
+        if curso_id not in self._cursos:
+            raise CursoInexistenteError(f"El curso con ID {curso_id} no existe")
+        return self._recorrer_paginas(
+            lambda cursor, tamano: self.paginar_estudiantes_curso(curso_id, cursor, tamano), tamano_lote)
+
+# FUNCIONES AUXILIARES
+def _agregar_ordenado(ids, valor):
+    """Agrega un ID a un array ordenado (los IDs nuevos casi siempre van al final)"""
+    if not ids or valor > ids[-1]:
+        ids.append(valor)
+    else:
+        insort(ids, valor)
+
+def _siguientes_ordenados(ids, cursor, cantidad):
+    """Hasta `cantidad` IDs de un array ordenado que son mayores que el cursor"""
+    inicio = 0 if cursor is None else bisect_right(ids, cursor)
+    return list(ids[inicio:inicio + cantidad])
+
+def _calcular_promedios(sumas, conteos):
+    """Promedios a partir de sumas y cantidades de notas (0 sin notas)"""
+    return np.divide(sumas, conteos, out=np.zeros(len(sumas)), where=conteos > 0)
+
+def _promedios_bajos_cursos(partes, umbral):
+    """
+    Calcula los promedios bajos de un grupo de cursos a partir de sus arreglos
+    (curso_id, ids, sumas, conteos). Solo usa NumPy, así que puede correr en
+    un hilo o en otro proceso. Devuelve [(curso_id, ids, promedios)] con cada
+    curso ordenado por promedio.
+    """
+    resultado = []
+    for curso_id, ids, sumas, conteos in partes:
+        promedios = _calcular_promedios(sumas, conteos)
+        bajos = np.flatnonzero(promedios < umbral)
+        bajos = bajos[np.argsort(promedios[bajos], kind='stable')]
+        resultado.append((curso_id, ids[bajos].tolist(), promedios[bajos].tolist()))
+    return resultado
+
+def datos_extra_evaluacion(evaluacion):
+    """Devuelve los argumentos propios del tipo de evaluación (para crear_evaluacion)"""
+    if isinstance(evaluacion, Examen):
+        return {'tiempo_limite': evaluacion.tiempo_limite}
+    return {'fecha_entrega': evaluacion.fecha_entrega}
+
+def codificar_extras_evaluacion(extras):
+    """
+    Convierte los datos extra de una evaluación a tipos simples (la fecha
+    como texto ISO); lo usan la bitácora y el snapshot binario
+    """
+    fecha_entrega = extras.get('fecha_entrega')
+    if isinstance(fecha_entrega, datetime):
+        return {'fecha_entrega_iso': fecha_entrega.isoformat()}
+    return extras
+
+def decodificar_extras_evaluacion(extras):
+    """Operación inversa de codificar_extras_evaluacion"""
+    if 'fecha_entrega_iso' in extras:
+        return {'fecha_entrega': datetime.fromisoformat(extras['fecha_entrega_iso'])}
+    return extras
+
+# FUNCIONES DE LECTURA DE ARCHIVOS
+def _leer_lotes(filas, tamano_lote):
+    """Agrupa un iterable de filas en listas de a lo sumo tamano_lote filas"""
+    while True:
+        lote = list(islice(filas, tamano_lote))
+        if not lote:
+            return
+        yield lote
+
+def leer_filas_archivo(ruta, formato=None):
+    """
+    Generador que lee un archivo CSV (con encabezado) o JSONL fila por fila y
+    produce diccionarios. Las líneas JSON mal formadas producen None para que
+    el lote las informe como error sin detener la carga.
+    """
+    if formato is None:
+        formato = os.path.splitext(ruta)[1].lstrip('.').lower()
+    
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        if formato == 'csv':
+            yield from csv.DictReader(archivo)
+        elif formato in ('jsonl', 'ndjson'):
+            for linea in archivo:
+                if not linea.strip():
+                    continue
+                try:
+                    yield json.loads(linea)
+                except json.JSONDecodeError:
+                    yield None
+        else:
+            raise ValueError(f"Formato de archivo no soportado: {formato}")
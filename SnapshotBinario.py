@@ -0,0 +1,427 @@
+"""
+SNAPSHOT BINARIO MAPEADO EN MEMORIA
+Formato versionado con tablas de registros de ancho fijo y un montículo de
+cadenas. Se lee con mmap: abrir un snapshot interpreta la cabecera y carga los
+IDs de las inscripciones de cada curso; los objetos Usuario, Curso y
+Evaluacion se crean recién cuando se accede a ellos, por lo que la memoria
+usada es proporcional a los datos realmente consultados.
+
+Estructura del archivo:
+    MAGICO (8 bytes) | versión (u32) | longitud de metadatos (u32) | metadatos JSON
+    secciones alineadas a 8 bytes, descritas en metadatos['secciones']
+"""
+
+from array import array
+from collections.abc import MutableMapping
+import hashlib
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from Plataforma import (Curso, Estudiante, PlataformaCursos, codificar_extras_evaluacion, datos_extra_evaluacion,
+                        decodificar_extras_evaluacion)
+
+MAGICO = b'GCSNAPB\x00'
+VERSION = 1
+_CABECERA = struct.Struct('<8sII')
+
+# Tablas de registros de ancho fijo
+_DTYPE_USUARIO = np.dtype([
+    ('id', '<u4'), ('tipo', '<u4'),
+    ('nombre_off', '<u8'), ('email_off', '<u8'),
+    ('nombre_len', '<u4'), ('email_len', '<u4'),
+    ('cursos_off', '<u8'), ('cursos_n', '<u4'), ('_relleno', '<u4')
+])
+_DTYPE_CURSO = np.dtype([
+    ('id', '<u4'), ('instructor_id', '<u4'),
+    ('nombre_off', '<u8'), ('nombre_len', '<u4'),
+    ('evaluaciones_inicio', '<u4'), ('evaluaciones_n', '<u4'),
+    ('filas_n', '<u4'), ('filas_off', '<u8'),
+    ('inscritos_off', '<u8'), ('inscritos_n', '<u4'), ('_relleno', '<u4'),
+    ('matriz_off', '<u8')
+])
+_DTYPE_EVALUACION = np.dtype([
+    ('id', '<u4'), ('curso_id', '<u4'),
+    ('puntaje_maximo', '<f8'),
+    ('nombre_off', '<u8'), ('extras_off', '<u8'),
+    ('nombre_len', '<u4'), ('extras_len', '<u4'),
+    ('tipo', '<u4'), ('_relleno', '<u4')
+])
+_TIPOS_EVALUACION = ["examen", "tarea"]
+_ID_MAXIMO = np.iinfo(np.uint32).max
+
+def _hash_email(clave_email):
+    """Hash estable de 64 bits de un email normalizado"""
+    return int.from_bytes(hashlib.blake2b(clave_email.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def _posicion(arreglo, valor):
+    """
+    Búsqueda binaria en un arreglo ordenado. El valor se convierte al tipo del
+    arreglo: con un int de Python NumPy convertiría el arreglo entero.
+    """
+    return int(arreglo.searchsorted(arreglo.dtype.type(valor)))
+
+class _Monticulo:
+    """Acumula cadenas UTF-8 y devuelve su posición y longitud"""
+
+    def __init__(self):
+        self._datos = bytearray()
+
+    def agregar(self, texto):
+        codificado = texto.encode('utf-8')
+        posicion = len(self._datos)
+        self._datos += codificado
+        return posicion, len(codificado)
+
+    def bytes(self):
+        return bytes(self._datos)
+
+# ESCRITURA
+def escribir_snapshot_binario(plataforma, ruta):
+    """Escribe el estado completo de la plataforma en formato binario"""
+    monticulo = _Monticulo()
+    tipos = list(plataforma._usuarios_por_tipo)
+    indice_tipo = {tipo: posicion for posicion, tipo in enumerate(tipos)}
+
+    # Cursos de cada estudiante en formato CSR (posición y cantidad en 'cursos_estudiante')
+    usuarios = sorted(plataforma._usuarios.values(), key=lambda usuario: usuario.id)
+    columnas = {campo: [] for campo in ('id', 'tipo', 'nombre_off', 'nombre_len', 'email_off', 'email_len',
+                                         'cursos_off', 'cursos_n')}
+    cursos_estudiante = []
+    for usuario in usuarios:
+        columnas['id'].append(usuario.id)
+        columnas['tipo'].append(indice_tipo[usuario.obtener_tipo().lower()])
+        for campo, texto in (('nombre', usuario.nombre), ('email', usuario.email)):
+            posicion, longitud = monticulo.agregar(texto)
+            columnas[f'{campo}_off'].append(posicion)
+            columnas[f'{campo}_len'].append(longitud)
+        cursos = getattr(usuario, 'cursos_inscritos', ())
+        columnas['cursos_off'].append(len(cursos_estudiante))
+        columnas['cursos_n'].append(len(cursos))
+        cursos_estudiante.extend(cursos)
+
+    # Se llena la tabla columna por columna: asignar registro por registro es lento
+    tabla_usuarios = np.zeros(len(usuarios), dtype=_DTYPE_USUARIO)
+    for campo, valores in columnas.items():
+        tabla_usuarios[campo] = valores
+
+    # Índice de emails: hashes ordenados con la fila del usuario correspondiente
+    hashes = np.fromiter((_hash_email(PlataformaCursos._normalizar_email(usuario.email)) for usuario in usuarios),
+                         dtype=np.uint64, count=len(usuarios))
+    orden_hashes = np.argsort(hashes, kind='stable')
+
+    secciones = {
+        'usuarios': tabla_usuarios,
+        'email_hashes': hashes[orden_hashes],
+        'email_filas': orden_hashes.astype(np.uint32),
+        'cursos_estudiante': np.array(cursos_estudiante, dtype=np.uint32)
+    }
+    for tipo in tipos:
+        secciones[f'ids_{tipo}'] = np.array(sorted(plataforma._usuarios_por_tipo[tipo]), dtype=np.uint32)
+
+    # Cursos con sus evaluaciones, filas, inscripciones y matriz de calificaciones
+    cursos = sorted(plataforma._cursos.values(), key=lambda curso: curso.id)
+    tabla_cursos = np.zeros(len(cursos), dtype=_DTYPE_CURSO)
+    evaluaciones, filas_ids, inscritos, matrices = [], [], [], []
+    desplazamientos = {'filas': 0, 'inscritos': 0, 'matriz': 0}
+    for fila, curso in enumerate(cursos):
+        registro = tabla_cursos[fila]
+        registro['id'] = curso.id
+        registro['instructor_id'] = curso.instructor_id
+        registro['nombre_off'], registro['nombre_len'] = monticulo.agregar(curso.nombre)
+        registro['evaluaciones_inicio'], registro['evaluaciones_n'] = len(evaluaciones), len(curso.evaluaciones)
+        evaluaciones.extend(curso.evaluaciones)
+
+        num_filas = len(curso._filas)
+        registro['filas_n'] = num_filas
+        registro['filas_off'] = desplazamientos['filas']
+        filas_ids.append(curso._ids_filas[:num_filas].astype(np.uint32))
+        desplazamientos['filas'] += num_filas
+
+        registro['inscritos_off'] = desplazamientos['inscritos']
+        registro['inscritos_n'] = len(curso._filas_inscritos)
+        inscritos.append(np.array(curso._filas_inscritos, dtype=np.uint32))
+        desplazamientos['inscritos'] += len(curso._filas_inscritos)
+
+        registro['matriz_off'] = desplazamientos['matriz']
+        matriz = np.ascontiguousarray(curso._matriz[:num_filas, :curso._num_columnas])
+        matrices.append(matriz.ravel())
+        desplazamientos['matriz'] += matriz.size
+
+    tabla_evaluaciones = np.zeros(len(evaluaciones), dtype=_DTYPE_EVALUACION)
+    for fila, evaluacion in enumerate(evaluaciones):
+        registro = tabla_evaluaciones[fila]
+        registro['id'] = evaluacion.id
+        registro['curso_id'] = evaluacion.curso_id
+        registro['puntaje_maximo'] = evaluacion.puntaje_maximo
+        registro['tipo'] = _TIPOS_EVALUACION.index(evaluacion.tipo_evaluacion().lower())
+        registro['nombre_off'], registro['nombre_len'] = monticulo.agregar(evaluacion.nombre)
+        registro['extras_off'], registro['extras_len'] = monticulo.agregar(
+            json.dumps(codificar_extras_evaluacion(datos_extra_evaluacion(evaluacion))))
+
+    vacio_u4 = np.zeros(0, dtype=np.uint32)
+    secciones.update({
+        'cursos': tabla_cursos,
+        'evaluaciones': tabla_evaluaciones,
+        'filas_ids': np.concatenate(filas_ids) if filas_ids else vacio_u4,
+        'inscritos_filas': np.concatenate(inscritos) if inscritos else vacio_u4,
+        'matrices': np.concatenate(matrices) if matrices else np.zeros(0),
+        'monticulo': np.frombuffer(monticulo.bytes(), dtype=np.uint8)
+    })
+
+    # Metadatos con la ubicación de cada sección; se calculan en dos pasadas
+    # porque el tamaño de los metadatos determina dónde empiezan los datos
+    metadatos = {
+        'tipos_usuario': tipos,
+        'proximo_id_usuario': plataforma._proximo_id_usuario,
+        'proximo_id_curso': plataforma._proximo_id_curso,
+        'proximo_id_evaluacion': plataforma._proximo_id_evaluacion,
+        'secciones': {}
+    }
+    inicio_datos = 0
+    for _ in range(2):
+        posicion = inicio_datos
+        for nombre, arreglo in secciones.items():
+            metadatos['secciones'][nombre] = [posicion, arreglo.nbytes]
+            posicion += _alinear(arreglo.nbytes)
+        codificados = json.dumps(metadatos).encode('utf-8')
+        inicio_datos = _alinear(_CABECERA.size + len(codificados) + 64)
+
+    with open(ruta, 'wb') as archivo:
+        archivo.write(_CABECERA.pack(MAGICO, VERSION, len(codificados)))
+        archivo.write(codificados)
+        for nombre, arreglo in secciones.items():
+            archivo.seek(metadatos['secciones'][nombre][0])
+            archivo.write(arreglo.tobytes())
+        archivo.truncate(max(archivo.tell(), inicio_datos))
+
+def _alinear(tamano):
+    return (tamano + 7) & ~7
+
+# LECTURA PEREZOSA
+class _RegistroMapeado(MutableMapping):
+    """
+    Diccionario {id: objeto} cuyas claves base son un arreglo ordenado de IDs
+    del snapshot. Los objetos se crean con materializar(id) al accederlos; los
+    que se agregan después de abrir el snapshot se guardan aparte.
+    """
+
+    def __init__(self, ids, materializar, guardar_materializados=True):
+        self._ids = ids
+        self._materializar = materializar
+        self._guardar = guardar_materializados
+        self._materializados = {}
+        self._nuevos = {}
+
+    def _en_snapshot(self, clave):
+        if not isinstance(clave, (int, np.integer)) or not 0 <= clave <= _ID_MAXIMO:
+            return False
+        posicion = _posicion(self._ids, clave)
+        return posicion < len(self._ids) and self._ids[posicion] == clave
+
+    def __getitem__(self, clave):
+        objeto = self._nuevos.get(clave)
+        if objeto is None:
+            objeto = self._materializados.get(clave)
+        if objeto is None:
+            if not self._en_snapshot(clave):
+                raise KeyError(clave)
+            objeto = self._materializar(int(clave))
+            if self._guardar:
+                self._materializados[clave] = objeto
+        return objeto
+
+    def __contains__(self, clave):
+        return clave in self._nuevos or clave in self._materializados or self._en_snapshot(clave)
+
+    def __setitem__(self, clave, objeto):
+        if self._en_snapshot(clave):
+            self._materializados[clave] = objeto
+        else:
+            self._nuevos[clave] = objeto
+
+    def __delitem__(self, clave):
+        raise TypeError("Los registros de un snapshot no admiten eliminar elementos")
+
+    def __iter__(self):
+        yield from self._ids.tolist()
+        yield from list(self._nuevos)
+
+    def __len__(self):
+        return len(self._ids) + len(self._nuevos)
+
+class _IndiceEmailMapeado(MutableMapping):
+    """
+    Índice {email normalizado: Usuario} que busca en la tabla de hashes
+    ordenados del snapshot (búsqueda binaria) y verifica el email candidato.
+    """
+
+    def __init__(self, snapshot, usuarios):
+        self._snapshot = snapshot
+        self._usuarios = usuarios
+        self._nuevos = {}
+
+    def _buscar(self, clave):
+        hashes = self._snapshot.email_hashes
+        valor = _hash_email(clave)
+        posicion = _posicion(hashes, valor)
+        while posicion < len(hashes) and hashes[posicion] == valor:
+            fila = int(self._snapshot.email_filas[posicion])
+            if PlataformaCursos._normalizar_email(self._snapshot.email(fila)) == clave:
+                return int(self._snapshot.usuarios['id'][fila])
+            posicion += 1
+        return None
+
+    def __getitem__(self, clave):
+        if clave in self._nuevos:
+            return self._nuevos[clave]
+        id_usuario = self._buscar(clave)
+        if id_usuario is None:
+            raise KeyError(clave)
+        return self._usuarios[id_usuario]
+
+    def __contains__(self, clave):
+        return clave in self._nuevos or self._buscar(clave) is not None
+
+    def __setitem__(self, clave, usuario):
+        self._nuevos[clave] = usuario
+
+    def __delitem__(self, clave):
+        raise TypeError("El índice de un snapshot no admite eliminar elementos")
+
+    def __iter__(self):
+        for fila in range(len(self._snapshot.usuarios)):
+            yield PlataformaCursos._normalizar_email(self._snapshot.email(fila))
+        yield from list(self._nuevos)
+
+    def __len__(self):
+        return len(self._snapshot.usuarios) + len(self._nuevos)
+
+class SnapshotBinario:
+    """Vista de solo lectura sobre un archivo de snapshot mapeado en memoria"""
+
+    def __init__(self, ruta):
+        with open(ruta, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, version, longitud = _CABECERA.unpack_from(self._mapa, 0)
+        if magico != MAGICO:
+            raise ValueError("El archivo no es un snapshot binario de la plataforma")
+        if version != VERSION:
+            raise ValueError(f"Versión de snapshot no soportada: {version}")
+        self.metadatos = json.loads(self._mapa[_CABECERA.size:_CABECERA.size + longitud])
+
+        self.usuarios = self._seccion('usuarios', _DTYPE_USUARIO)
+        self.email_hashes = self._seccion('email_hashes', np.uint64)
+        self.email_filas = self._seccion('email_filas', np.uint32)
+        self.cursos_estudiante = self._seccion('cursos_estudiante', np.uint32)
+        self.cursos = self._seccion('cursos', _DTYPE_CURSO)
+        self.evaluaciones = self._seccion('evaluaciones', _DTYPE_EVALUACION)
+        self.filas_ids = self._seccion('filas_ids', np.uint32)
+        self.inscritos_filas = self._seccion('inscritos_filas', np.uint32)
+        self.matrices = self._seccion('matrices', np.float64)
+        self._inicio_monticulo = self.metadatos['secciones']['monticulo'][0]
+        self.ids_por_tipo = {tipo: self._seccion(f'ids_{tipo}', np.uint32)
+                             for tipo in self.metadatos['tipos_usuario']}
+
+    def _seccion(self, nombre, dtype):
+        """Arreglo NumPy sin copia sobre una sección del archivo"""
+        posicion, longitud = self.metadatos['secciones'][nombre]
+        return np.frombuffer(self._mapa, dtype=dtype, count=longitud // np.dtype(dtype).itemsize, offset=posicion)
+
+    def texto(self, posicion, longitud):
+        """Cadena guardada en el montículo (posición relativa al inicio del montículo)"""
+        inicio = self._inicio_monticulo + int(posicion)
+        return self._mapa[inicio:inicio + int(longitud)].decode('utf-8')
+
+    def email(self, fila):
+        registro = self.usuarios[fila]
+        return self.texto(registro['email_off'], registro['email_len'])
+
+def abrir_snapshot_binario(ruta):
+    """
+    Abre un snapshot binario y devuelve una PlataformaCursos cuyos registros
+    materializan usuarios, cursos y evaluaciones al accederlos.
+    """
+    snapshot = SnapshotBinario(ruta)
+    plataforma = PlataformaCursos()
+    clases = [plataforma._tipos_usuario[tipo] for tipo in snapshot.metadatos['tipos_usuario']]
+    ids_usuarios = snapshot.usuarios['id']
+    ids_cursos = snapshot.cursos['id']
+
+    def materializar_usuario(id_usuario):
+        registro = snapshot.usuarios[_posicion(ids_usuarios, id_usuario)]
+        usuario = clases[registro['tipo']](id_usuario,
+                                           snapshot.texto(registro['nombre_off'], registro['nombre_len']),
+                                           snapshot.texto(registro['email_off'], registro['email_len']))
+        if isinstance(usuario, Estudiante):
+            usuario._inscripciones = plataforma._inscripciones
+        if registro['cursos_n']:
+            inicio = int(registro['cursos_off'])
+            plataforma._inscripciones.restaurar_estudiante(
+                id_usuario, snapshot.cursos_estudiante[inicio:inicio + int(registro['cursos_n'])].tolist())
+        return usuario
+
+    def materializar_curso(id_curso):
+        registro = snapshot.cursos[_posicion(ids_cursos, id_curso)]
+        curso = Curso(id_curso, snapshot.texto(registro['nombre_off'], registro['nombre_len']),
+                      int(registro['instructor_id']), plataforma._inscripciones)
+        inicio = int(registro['evaluaciones_inicio'])
+        for evaluacion in snapshot.evaluaciones[inicio:inicio + int(registro['evaluaciones_n'])]:
+            extras = decodificar_extras_evaluacion(
+                json.loads(snapshot.texto(evaluacion['extras_off'], evaluacion['extras_len'])))
+            curso.agregar_evaluacion(PlataformaCursos._construir_evaluacion(
+                int(evaluacion['id']), _TIPOS_EVALUACION[evaluacion['tipo']],
+                snapshot.texto(evaluacion['nombre_off'], evaluacion['nombre_len']),
+                id_curso, float(evaluacion['puntaje_maximo']), **extras))
+
+        num_filas, num_columnas = int(registro['filas_n']), int(registro['evaluaciones_n'])
+        filas_off, matriz_off = int(registro['filas_off']), int(registro['matriz_off'])
+        inscritos_off = int(registro['inscritos_off'])
+        curso._restaurar(
+            snapshot.filas_ids[filas_off:filas_off + num_filas].astype(np.int64),
+            snapshot.matrices[matriz_off:matriz_off + num_filas * num_columnas].reshape(num_filas, num_columnas),
+            snapshot.inscritos_filas[inscritos_off:inscritos_off + int(registro['inscritos_n'])].astype(np.int64))
+        return curso
+
+    # Índice global de evaluaciones: {id: id del curso}, ordenado por id
+    orden_evaluaciones = np.argsort(snapshot.evaluaciones['id'], kind='stable')
+    ids_evaluaciones = snapshot.evaluaciones['id'][orden_evaluaciones]
+    cursos_evaluaciones = snapshot.evaluaciones['curso_id'][orden_evaluaciones]
+
+    def materializar_evaluacion(id_evaluacion):
+        curso_id = int(cursos_evaluaciones[_posicion(ids_evaluaciones, id_evaluacion)])
+        curso = plataforma._cursos[curso_id]
+        return next(evaluacion for evaluacion in curso.evaluaciones if evaluacion.id == id_evaluacion)
+
+    plataforma._usuarios = _RegistroMapeado(ids_usuarios, materializar_usuario)
+    plataforma._usuarios_por_email = _IndiceEmailMapeado(snapshot, plataforma._usuarios)
+    plataforma._usuarios_por_tipo = {
+        tipo: _RegistroMapeado(ids, plataforma._usuarios.__getitem__, guardar_materializados=False)
+        for tipo, ids in snapshot.ids_por_tipo.items()
+    }
+    for tipo in plataforma._tipos_usuario:
+        plataforma._usuarios_por_tipo.setdefault(tipo, {})
+    plataforma._cursos = _RegistroMapeado(ids_cursos, materializar_curso)
+    # IDs ordenados para la paginación (4 bytes por ID, sin crear objetos)
+    plataforma._ids_cursos = array('I', ids_cursos.astype(np.uint32).tobytes())
+    plataforma._ids_por_tipo = {tipo: array('I', ids.tobytes()) for tipo, ids in snapshot.ids_por_tipo.items()}
+    for tipo in plataforma._tipos_usuario:
+        plataforma._ids_por_tipo.setdefault(tipo, array('I'))
+    plataforma._evaluaciones = _RegistroMapeado(ids_evaluaciones, materializar_evaluacion)
+
+    # El lado de los cursos del índice de inscripciones se carga completo al
+    # abrir: las consultas por curso (paginación, conjuntos, vistas) lo leen
+    # sin materializar el curso. Son solo IDs, sin crear objetos.
+    for registro in snapshot.cursos:
+        inicio, cantidad = int(registro['inscritos_off']), int(registro['inscritos_n'])
+        if cantidad:
+            filas = snapshot.inscritos_filas[inicio:inicio + cantidad].astype(np.int64) + int(registro['filas_off'])
+            plataforma._inscripciones.restaurar_curso(int(registro['id']), snapshot.filas_ids[filas].tolist())
+
+    plataforma._proximo_id_usuario = snapshot.metadatos['proximo_id_usuario']
+    plataforma._proximo_id_curso = snapshot.metadatos['proximo_id_curso']
+    plataforma._proximo_id_evaluacion = snapshot.metadatos['proximo_id_evaluacion']
+    plataforma._snapshot_binario = snapshot  # Mantiene vivo el mmap
+    return plataforma
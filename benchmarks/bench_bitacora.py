@@ -0,0 +1,77 @@
+"""
+BENCHMARK DE RECUPERACIÓN DE LA BITÁCORA
+Mide cuánto tarda en reconstruirse la plataforma a partir de una bitácora con
+N operaciones registradas, sin snapshot y con un snapshot cada
+intervalo_snapshot operaciones (que acota la cantidad de registros a reproducir).
+
+Uso: python benchmarks/bench_bitacora.py [--operaciones 10000000] [--intervalo 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Bitacora import AlmacenamientoBitacora
+from Plataforma import PlataformaCursos
+
+def preparar_plataforma(directorio, estudiantes, evaluaciones, intervalo):
+    """Crea una plataforma con un curso y sus evaluaciones sobre una bitácora"""
+    motor = AlmacenamientoBitacora(directorio, intervalo_snapshot=intervalo)
+    plataforma = PlataformaCursos(motor)
+    instructor = plataforma.registrar_usuario("instructor", "Instructor", "instructor@bench")
+    registrados = plataforma.registrar_usuarios_lote(
+        [("estudiante", f"Estudiante {i}", f"estudiante{i}@bench") for i in range(estudiantes)])['registrados']
+    curso = plataforma.crear_curso("Curso de prueba", instructor.id)
+    plataforma.inscribir_estudiantes_lote(curso.id, [estudiante.id for estudiante in registrados])
+    lista_evaluaciones = [plataforma.crear_evaluacion("tarea", f"Tarea {i}", curso.id, 100)
+                          for i in range(evaluaciones)]
+    return plataforma, motor, [estudiante.id for estudiante in registrados], lista_evaluaciones
+
+def escribir_operaciones(plataforma, ids, evaluaciones, operaciones, semilla=42):
+    """Registra calificaciones individuales (una operación de bitácora cada una)"""
+    azar = random.Random(semilla)
+    inicio = time.perf_counter()
+    for _ in range(operaciones):
+        evaluacion = evaluaciones[azar.randrange(len(evaluaciones))]
+        plataforma.registrar_calificacion(evaluacion.id, ids[azar.randrange(len(ids))], azar.uniform(0, 100))
+    return time.perf_counter() - inicio
+
+def medir_recuperacion(directorio):
+    """Tiempo de reconstruir la plataforma desde el directorio de la bitácora"""
+    inicio = time.perf_counter()
+    motor = AlmacenamientoBitacora(directorio)
+    plataforma = PlataformaCursos(motor)
+    duracion = time.perf_counter() - inicio
+    reproducidos = motor._operaciones_desde_snapshot
+    plataforma.cerrar()
+    return duracion, reproducidos
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--operaciones', type=int, default=10_000_000)
+    parser.add_argument('--intervalo', type=int, default=100_000)
+    parser.add_argument('--estudiantes', type=int, default=5000)
+    parser.add_argument('--evaluaciones', type=int, default=20)
+    args = parser.parse_args()
+
+    for nombre, intervalo in (("sin snapshot", 2 * args.operaciones + 1000), ("con snapshot", args.intervalo)):
+        with tempfile.TemporaryDirectory() as directorio:
+            plataforma, motor, ids, evaluaciones = preparar_plataforma(
+                directorio, args.estudiantes, args.evaluaciones, intervalo)
+            escritura = escribir_operaciones(plataforma, ids, evaluaciones, args.operaciones)
+            plataforma.cerrar()
+            tamano = sum(os.path.getsize(os.path.join(directorio, archivo)) for archivo in os.listdir(directorio))
+            recuperacion, reproducidos = medir_recuperacion(directorio)
+
+            print(f"{nombre}: {args.operaciones} operaciones")
+            print(f"  escritura:    {escritura:.2f} s ({args.operaciones / escritura:,.0f} op/s)")
+            print(f"  en disco:     {tamano / 1e6:.1f} MB")
+            print(f"  recuperación: {recuperacion:.2f} s ({reproducidos} registros reproducidos)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+"""
+GENERADOR DE CARGA DE LA PLATAFORMA
+Reproduce tráfico de producción por fases: inscripciones masivas al inicio
+del ciclo, tormentas de calificaciones antes de las entregas y semanas de
+reportes. Varios trabajadores (procesos o hilos) ejecutan a la vez la mezcla
+de operaciones de cada fase y al final se informa, por fase y operación, el
+throughput y la latencia de cola (p50/p95/p99).
+
+Cada trabajador tiene su propia plataforma, generada con la misma semilla
+(benchmarks/generador.py), en memoria o sobre su propio archivo SQLite o
+bitácora: PlataformaCursos no se comparte entre hilos. Todo corre localmente.
+
+Uso:
+    python benchmarks/bench_carga.py [--trabajadores 4] [--modo procesos|hilos] [--motor memoria|sqlite|bitacora]
+        [--fases inicio_ciclo cierre_entregas semana_reportes] [--operaciones 2000]
+        [--mezcla registrar_calificacion=5,generar_reporte_promedios_bajos=1] [--salida carga.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import random
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+
+import numpy as np
+
+from generador import generar_plataforma
+
+# OPERACIONES: cada una recibe (plataforma, estado, aleatorio) y elige sus argumentos
+def _elegir_inscrito(plataforma, estado, aleatorio):
+    """(curso, estudiante inscrito en él) al azar; el estudiante es None si el curso está vacío"""
+    curso_id = aleatorio.choice(estado.cursos)
+    inscritos = plataforma.obtener_ids_estudiantes_curso(curso_id)
+    return curso_id, int(inscritos[aleatorio.randrange(len(inscritos))]) if len(inscritos) else None
+
+def _registrar_usuario(plataforma, estado, aleatorio):
+    numero = estado.siguiente_numero()
+    usuario = plataforma.registrar_usuario("estudiante", f"Carga {numero}", f"carga{numero}@carga.test")
+    estado.nuevos.append(usuario.id)
+
+def _inscribir_estudiante_curso(plataforma, estado, aleatorio):
+    # Sobre todo estudiantes recién registrados, como al abrir un ciclo
+    candidatos = estado.nuevos if estado.nuevos and aleatorio.random() < 0.8 else estado.estudiantes
+    plataforma.inscribir_estudiante_curso(aleatorio.choice(candidatos), aleatorio.choice(estado.cursos))
+
+def _inscribir_estudiantes_lote(plataforma, estado, aleatorio):
+    plataforma.inscribir_estudiantes_lote(aleatorio.choice(estado.cursos), aleatorio.sample(estado.estudiantes, 50))
+
+def _registrar_calificacion(plataforma, estado, aleatorio):
+    curso_id, estudiante_id = _elegir_inscrito(plataforma, estado, aleatorio)
+    if estudiante_id is not None:
+        plataforma.registrar_calificacion(aleatorio.choice(estado.evaluaciones[curso_id]), estudiante_id,
+                                          aleatorio.randint(0, 100))
+
+def _registrar_calificaciones_lote(plataforma, estado, aleatorio):
+    curso_id = aleatorio.choice(estado.cursos)
+    inscritos = plataforma.obtener_ids_estudiantes_curso(curso_id).tolist()
+    filas = [(estudiante_id, aleatorio.randint(0, 100))
+             for estudiante_id in aleatorio.sample(inscritos, min(100, len(inscritos)))]
+    plataforma.registrar_calificaciones_lote(aleatorio.choice(estado.evaluaciones[curso_id]), filas)
+
+def _obtener_promedio_estudiante(plataforma, estado, aleatorio):
+    curso_id, estudiante_id = _elegir_inscrito(plataforma, estado, aleatorio)
+    if estudiante_id is not None:
+        plataforma.obtener_promedio_estudiante(estudiante_id, curso_id)
+
+def _obtener_posicion_estudiante(plataforma, estado, aleatorio):
+    curso_id, estudiante_id = _elegir_inscrito(plataforma, estado, aleatorio)
+    if estudiante_id is not None:
+        plataforma.obtener_posicion_estudiante(estudiante_id, curso_id)
+
+OPERACIONES = {
+    'registrar_usuario': _registrar_usuario,
+    'inscribir_estudiante_curso': _inscribir_estudiante_curso,
+    'inscribir_estudiantes_lote': _inscribir_estudiantes_lote,
+    'registrar_calificacion': _registrar_calificacion,
+    'registrar_calificaciones_lote': _registrar_calificaciones_lote,
+    'obtener_promedio_estudiante': _obtener_promedio_estudiante,
+    'obtener_posicion_estudiante': _obtener_posicion_estudiante,
+    'paginar_estudiantes_curso': lambda plataforma, estado, aleatorio:
+        plataforma.paginar_estudiantes_curso(aleatorio.choice(estado.cursos)),
+    'paginar_cursos': lambda plataforma, estado, aleatorio: plataforma.paginar_cursos(),
+    'generar_reporte_promedios_bajos': lambda plataforma, estado, aleatorio:
+        plataforma.generar_reporte_promedios_bajos(aleatorio.choice(estado.cursos)),
+    'generar_reporte_extremos': lambda plataforma, estado, aleatorio:
+        plataforma.generar_reporte_extremos(aleatorio.choice(estado.cursos)),
+    'generar_reporte_percentiles': lambda plataforma, estado, aleatorio:
+        plataforma.generar_reporte_percentiles(aleatorio.choice(estado.cursos)),
+    # Un solo trabajador interno: la concurrencia ya la ponen los trabajadores de la carga
+    'generar_reporte_riesgo_global': lambda plataforma, estado, aleatorio:
+        plataforma.generar_reporte_riesgo_global(trabajadores=1)
+}
+
+# Mezclas de cada fase: {operación: peso}
+ESCENARIOS = {
+    'inicio_ciclo': {
+        'registrar_usuario': 25, 'inscribir_estudiante_curso': 50, 'inscribir_estudiantes_lote': 2,
+        'paginar_cursos': 10, 'paginar_estudiantes_curso': 8, 'obtener_promedio_estudiante': 5
+    },
+    'cierre_entregas': {
+        'registrar_calificacion': 60, 'registrar_calificaciones_lote': 5, 'obtener_promedio_estudiante': 25,
+        'generar_reporte_promedios_bajos': 10
+    },
+    'semana_reportes': {
+        'generar_reporte_promedios_bajos': 25, 'generar_reporte_extremos': 15, 'generar_reporte_percentiles': 15,
+        'obtener_posicion_estudiante': 20, 'paginar_estudiantes_curso': 15, 'registrar_calificacion': 9,
+        'generar_reporte_riesgo_global': 1
+    }
+}
+
+class EstadoCarga:
+    """IDs que usan las operaciones de un trabajador"""
+
+    def __init__(self, trabajador, datos, plataforma):
+        self.trabajador = trabajador
+        self.estudiantes = datos['estudiantes']
+        self.cursos = datos['cursos']
+        self.evaluaciones = {curso_id: [evaluacion.id
+                                        for evaluacion in plataforma.obtener_evaluaciones_curso(curso_id)]
+                             for curso_id in self.cursos}
+        self.nuevos = []  # Estudiantes registrados durante la carga
+        self._numero = 0
+
+    def siguiente_numero(self):
+        """Sufijo único para los usuarios que registra este trabajador"""
+        self._numero += 1
+        return f"{self.trabajador}-{self._numero}"
+
+def crear_almacenamiento(motor, directorio, trabajador):
+    """Motor de almacenamiento propio de un trabajador (None = solo memoria)"""
+    if motor == 'sqlite':
+        from Almacenamiento import AlmacenamientoSQLite
+        return AlmacenamientoSQLite(os.path.join(directorio, f'trabajador{trabajador}.db'))
+    if motor == 'bitacora':
+        from Bitacora import AlmacenamientoBitacora
+        return AlmacenamientoBitacora(os.path.join(directorio, f'trabajador{trabajador}'))
+    return None
+
+def ejecutar_trabajador(trabajador, configuracion, barrera, resultados):
+    """
+    Genera la plataforma del trabajador y ejecuta cada fase tras esperar a los
+    demás en la barrera. Pone en `resultados` (trabajador, {fase: {'duracion',
+    'operaciones': {nombre: {'latencias', 'errores'}}}}) o (trabajador, texto del error).
+    """
+    try:
+        almacenamiento = crear_almacenamiento(configuracion['motor'], configuracion['directorio'], trabajador)
+        opciones = {'almacenamiento': almacenamiento} if almacenamiento is not None else {}
+        plataforma, datos = generar_plataforma(configuracion['usuarios'], configuracion['cursos'],
+                                               configuracion['inscripciones'], configuracion['evaluaciones'],
+                                               semilla=configuracion['semilla'], **opciones)
+        estado = EstadoCarga(trabajador, datos, plataforma)
+        aleatorio = random.Random(configuracion['semilla'] * 1000 + trabajador)
+
+        fases = {}
+        for fase, mezcla in configuracion['fases']:
+            # La secuencia se sortea antes de medir
+            secuencia = aleatorio.choices(list(mezcla), list(mezcla.values()), k=configuracion['operaciones'])
+            operaciones = {nombre: {'latencias': [], 'errores': 0} for nombre in mezcla}
+            barrera.wait()
+            inicio_fase = time.perf_counter()
+            for nombre in secuencia:
+                medicion = operaciones[nombre]
+                inicio = time.perf_counter()
+                try:
+                    OPERACIONES[nombre](plataforma, estado, aleatorio)
+                except Exception:
+                    medicion['errores'] += 1
+                medicion['latencias'].append(time.perf_counter() - inicio)
+            fases[fase] = {'duracion': time.perf_counter() - inicio_fase, 'operaciones': operaciones}
+        plataforma.cerrar()
+        resultados.put((trabajador, fases))
+    except Exception:
+        barrera.abort()  # Los demás no se quedan esperando a este trabajador
+        resultados.put((trabajador, traceback.format_exc()))
+
+def ejecutar_carga(configuracion, trabajadores, modo):
+    """Lanza los trabajadores y devuelve la lista de resultados de cada uno"""
+    if modo == 'procesos':
+        barrera, resultados, crear = (multiprocessing.Barrier(trabajadores), multiprocessing.Queue(),
+                                      multiprocessing.Process)
+    else:
+        barrera, resultados, crear = threading.Barrier(trabajadores), queue.Queue(), threading.Thread
+    hilos = [crear(target=ejecutar_trabajador, args=(numero, configuracion, barrera, resultados))
+             for numero in range(trabajadores)]
+    for hilo in hilos:
+        hilo.start()
+    recibidos = [resultados.get() for _ in hilos]  # Antes de join: la cola de procesos debe vaciarse
+    for hilo in hilos:
+        hilo.join()
+
+    fallidos = [(numero, error) for numero, error in recibidos if isinstance(error, str)]
+    if fallidos:
+        # Los que abortaron por la barrera rota solo repiten el error del primero
+        numero, error = next(((numero, error) for numero, error in fallidos
+                              if 'BrokenBarrierError' not in error), fallidos[0])
+        raise RuntimeError(f"El trabajador {numero} falló:\n{error}")
+    return [fases for _, fases in sorted(recibidos)]
+
+def resumir(por_trabajador, fases):
+    """
+    Une las mediciones de todos los trabajadores: por fase, la duración (la
+    del trabajador más lento) y por operación las llamadas, errores,
+    operaciones por segundo y latencias en ms.
+    """
+    resumen = {}
+    for fase, _ in fases:
+        duracion = max(resultado[fase]['duracion'] for resultado in por_trabajador)
+        operaciones = {}
+        total = 0
+        for nombre in por_trabajador[0][fase]['operaciones']:
+            latencias = np.concatenate([resultado[fase]['operaciones'][nombre]['latencias']
+                                        for resultado in por_trabajador]) * 1e3
+            if not len(latencias):
+                continue
+            p50, p95, p99 = np.percentile(latencias, (50, 95, 99))
+            total += len(latencias)
+            operaciones[nombre] = {
+                'llamadas': len(latencias),
+                'errores': sum(resultado[fase]['operaciones'][nombre]['errores'] for resultado in por_trabajador),
+                'ops_por_segundo': len(latencias) / duracion,
+                'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99,
+                'maximo_ms': latencias.max()
+            }
+        resumen[fase] = {'duracion_s': duracion, 'ops_por_segundo': total / duracion, 'operaciones': operaciones}
+    return resumen
+
+def imprimir(resumen):
+    for fase, medicion in resumen.items():
+        print(f"\n{fase}: {medicion['ops_por_segundo']:.0f} ops/s en {medicion['duracion_s']:.2f} s")
+        print(f"  {'operación':34}{'llamadas':>9}{'errores':>8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+              f"{'p99 ms':>10}{'máx ms':>10}")
+        for nombre, datos in sorted(medicion['operaciones'].items(), key=lambda item: -item[1]['llamadas']):
+            latencias = "".join(f"{datos[clave]:>10.3f}" for clave in ('p50_ms', 'p95_ms', 'p99_ms', 'maximo_ms'))
+            print(f"  {nombre:34}{datos['llamadas']:>9}{datos['errores']:>8}"
+                  f"{datos['ops_por_segundo']:>10.0f}{latencias}")
+
+def leer_mezcla(texto):
+    """'operacion=peso,operacion=peso' -> {operación: peso}"""
+    mezcla = {}
+    for parte in texto.split(','):
+        nombre, _, peso = parte.partition('=')
+        nombre = nombre.strip()
+        if nombre not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: {nombre} (disponibles: {', '.join(OPERACIONES)})")
+        mezcla[nombre] = float(peso) if peso else 1.0
+        if mezcla[nombre] < 0:
+            raise ValueError(f"El peso de {nombre} no puede ser negativo")
+    return mezcla
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trabajadores', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--modo', choices=('procesos', 'hilos'), default='procesos')
+    parser.add_argument('--motor', choices=('memoria', 'sqlite', 'bitacora'), default='memoria')
+    parser.add_argument('--directorio',
+                        help="dónde crear los archivos de SQLite o bitácora (por defecto, uno temporal)")
+    parser.add_argument('--fases', nargs='+', help=f"escenarios en orden: {', '.join(ESCENARIOS)} "
+                                                   "o personalizada (con --mezcla)")
+    parser.add_argument('--mezcla', help="escenario 'personalizada': operacion=peso,operacion=peso...")
+    parser.add_argument('--operaciones', type=int, default=2000, help="operaciones por trabajador y fase")
+    parser.add_argument('--usuarios', type=int, default=5000)
+    parser.add_argument('--cursos', type=int, default=20)
+    parser.add_argument('--inscripciones', type=int, default=200, help="inscritos por curso al empezar")
+    parser.add_argument('--evaluaciones', type=int, default=5, help="evaluaciones por curso")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', help="archivo JSON donde guardar el resumen")
+    args = parser.parse_args()
+
+    escenarios = dict(ESCENARIOS)
+    if args.mezcla:
+        try:
+            escenarios['personalizada'] = leer_mezcla(args.mezcla)
+        except ValueError as error:
+            parser.error(str(error))
+    nombres_fases = args.fases or (['personalizada'] if args.mezcla else list(ESCENARIOS))
+    desconocidas = [fase for fase in nombres_fases if fase not in escenarios]
+    if desconocidas:
+        parser.error(f"Fases desconocidas: {', '.join(desconocidas)}")
+    if args.trabajadores < 1:
+        parser.error("Se necesita al menos un trabajador")
+    fases = [(fase, escenarios[fase]) for fase in nombres_fases]
+
+    directorio = args.directorio or tempfile.mkdtemp(prefix='carga-')
+    configuracion = {
+        'motor': args.motor, 'directorio': directorio, 'fases': fases, 'operaciones': args.operaciones,
+        'usuarios': args.usuarios, 'cursos': args.cursos, 'inscripciones': args.inscripciones,
+        'evaluaciones': args.evaluaciones, 'semilla': args.semilla
+    }
+    print(f"{args.trabajadores} trabajadores ({args.modo}), motor {args.motor}, {args.usuarios} usuarios y "
+          f"{args.cursos} cursos por trabajador, {args.operaciones} operaciones por trabajador y fase")
+    try:
+        resumen = resumir(ejecutar_carga(configuracion, args.trabajadores, args.modo), fases)
+    finally:
+        if not args.directorio:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+    imprimir(resumen)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            json.dump({'configuracion': vars(args), 'fases': resumen}, archivo, indent=2, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
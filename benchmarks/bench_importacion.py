@@ -0,0 +1,89 @@
+"""
+BENCHMARK DE TIEMPO DE IMPORTACIÓN
+Importa cada punto de entrada en un proceso nuevo con `python -X importtime`,
+suma el tiempo acumulado de los módulos de primer nivel (sin los que el
+intérprete ya importa al arrancar) y verifica que no se
+carguen módulos que deberían importarse solo al usarlos. Termina con código 1
+si algún objetivo supera su presupuesto; tests/test_importacion.py ejecuta las
+mismas verificaciones con pytest.
+
+Uso: python benchmarks/bench_importacion.py [--repeticiones 5] [--factor 1.0]
+"""
+
+import argparse
+import compileall
+import os
+import re
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (sentencia, presupuesto en ms, módulos que no deben quedar cargados)
+OBJETIVOS = [
+    ("import gestion_cursos", 5,
+     ['numpy', 'Plataforma', 'Almacenamiento', 'Menu']),
+    ("from gestion_cursos import PlataformaCursos", 250,
+     ['sqlite3', 'concurrent.futures', 'Bitacora', 'SnapshotBinario', 'Menu', 'MenuPaginado']),
+    ("from gestion_cursos import AlmacenamientoSQLite", 15,
+     ['numpy', 'sqlite3', 'Plataforma']),
+    ("import CursosOnline", 15,
+     ['numpy', 'Plataforma'])
+]
+
+_LINEA = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)")
+_VERIFICAR = "import sys; {sentencia}; print(','.join(m for m in {prohibidos!r} if m in sys.modules))"
+
+def importar(codigo):
+    """Ejecuta código con -X importtime y devuelve (stdout, [(acumulado en us, módulo de primer nivel)])"""
+    proceso = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo],
+                             cwd=RAIZ, capture_output=True, text=True, check=True)
+    # Solo los módulos de primer nivel: su acumulado ya incluye a sus dependencias
+    return proceso.stdout, [(int(acumulado), modulo) for acumulado, sangria, modulo
+                            in _LINEA.findall(proceso.stderr) if not sangria]
+
+def medir(sentencia, prohibidos, arranque):
+    """Tiempo de importación en ms (sin los módulos del arranque) y módulos prohibidos cargados"""
+    salida, modulos = importar(_VERIFICAR.format(sentencia=sentencia, prohibidos=prohibidos))
+    total_us = sum(acumulado for acumulado, modulo in modulos if modulo not in arranque)
+    cargados = [modulo for modulo in salida.strip().split(',') if modulo]
+    return total_us / 1000, cargados
+
+def verificar(repeticiones=5, factor=1.0):
+    """
+    Mide cada objetivo y devuelve una lista de diccionarios con la sentencia,
+    el tiempo en ms, el límite y los módulos perezosos que quedaron cargados.
+    """
+    # Con PYTHONDONTWRITEBYTECODE un .pyc viejo haría medir también la compilación
+    compileall.compile_dir(RAIZ, quiet=1)
+    # Módulos que el intérprete importa al arrancar (site, encodings...): no cuentan
+    arranque = {modulo for _, modulo in importar("import sys")[1]}
+    resultados = []
+    for sentencia, presupuesto, prohibidos in OBJETIVOS:
+        mediciones = [medir(sentencia, prohibidos, arranque) for _ in range(repeticiones)]
+        resultados.append({
+            'sentencia': sentencia,
+            'tiempo_ms': min(tiempo for tiempo, _ in mediciones),  # El mínimo descarta el ruido del sistema
+            'limite_ms': presupuesto * factor,
+            'cargados': sorted({modulo for _, modulos in mediciones for modulo in modulos})
+        })
+    return resultados
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--factor', type=float, default=1.0, help="multiplica los presupuestos (máquinas lentas)")
+    args = parser.parse_args()
+
+    fallas = 0
+    for resultado in verificar(args.repeticiones, args.factor):
+        correcto = resultado['tiempo_ms'] <= resultado['limite_ms'] and not resultado['cargados']
+        fallas += not correcto
+        print(f"{'OK   ' if correcto else 'FALLA'} {resultado['sentencia']:48}{resultado['tiempo_ms']:>8.1f} ms "
+              f"(presupuesto {resultado['limite_ms']:.0f} ms)")
+        if resultado['cargados']:
+            print(f"      cargó módulos que deberían ser perezosos: {', '.join(resultado['cargados'])}")
+    sys.exit(1 if fallas else 0)
+
+if __name__ == '__main__':
+    main()
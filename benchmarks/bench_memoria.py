@@ -0,0 +1,126 @@
+"""
+BENCHMARK DE MEMORIA DEL MODELO DE DOMINIO
+Mide con tracemalloc los bytes por usuario, por curso y por calificación de una
+plataforma con N usuarios, y estima cuánto ocuparía el mismo modelo sin
+__slots__: para cada clase se compara una instancia con slots contra un objeto
+con __dict__ que guarda los mismos atributos (mismos valores compartidos), y la
+diferencia se suma a lo medido.
+
+Uso: python benchmarks/bench_memoria.py [--usuarios 100000 1000000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Plataforma import Curso, Estudiante, Examen, PlataformaCursos, Tarea
+
+_EVALUACIONES_POR_CURSO = 4
+_ESTUDIANTES_POR_CURSO = 1000
+_MUESTRA = 10000
+
+def bytes_asignados(funcion):
+    """Ejecuta funcion() y devuelve (resultado, bytes que quedaron asignados)"""
+    gc.collect()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = funcion()
+    gc.collect()
+    return resultado, tracemalloc.get_traced_memory()[0] - antes
+
+def slots_de(clase):
+    """Todos los atributos declarados en __slots__ a lo largo de la jerarquía"""
+    return [nombre for base in clase.__mro__ for nombre in base.__dict__.get('__slots__', ())]
+
+def ahorro_por_instancia(clase, instancia):
+    """Bytes que ahorra una instancia con slots frente a una con __dict__"""
+    sin_slots = type(f"{clase.__name__}SinSlots", (), {})  # Una clase por tipo: dicts con claves compartidas
+    atributos = slots_de(clase)
+
+    def copiar():
+        copias = []
+        for _ in range(_MUESTRA):
+            copia = sin_slots()
+            for nombre in atributos:
+                setattr(copia, nombre, getattr(instancia, nombre))
+            copias.append(copia)
+        return copias
+
+    _, con_dict = bytes_asignados(copiar)
+    _, con_slots = bytes_asignados(lambda: [clase.__new__(clase) for _ in range(_MUESTRA)])
+    return (con_dict - con_slots) / _MUESTRA
+
+def medir(usuarios):
+    """Bytes por usuario, curso y calificación de una plataforma con N estudiantes"""
+    tracemalloc.start()
+    plataforma = PlataformaCursos()
+    instructor = plataforma.registrar_usuario("instructor", "Instructor", "instructor@bench")
+
+    resultado, bytes_usuarios = bytes_asignados(lambda: plataforma.registrar_usuarios_lote(
+        (("estudiante", f"Estudiante {i}", f"estudiante{i}@bench") for i in range(usuarios))))
+    ids = [estudiante.id for estudiante in resultado['registrados']]
+    del resultado
+
+    def crear_cursos():
+        cursos = []
+        for inicio in range(0, len(ids), _ESTUDIANTES_POR_CURSO):
+            curso = plataforma.crear_curso(f"Curso {len(cursos)}", instructor.id)
+            plataforma.inscribir_estudiantes_lote(curso.id, ids[inicio:inicio + _ESTUDIANTES_POR_CURSO])
+            for indice in range(_EVALUACIONES_POR_CURSO):
+                if indice % 2:
+                    plataforma.crear_evaluacion("examen", f"Examen {indice}", curso.id, 100, tiempo_limite=60)
+                else:
+                    plataforma.crear_evaluacion("tarea", f"Tarea {indice}", curso.id, 100,
+                                                fecha_entrega=datetime(2025, 1, 1))
+            cursos.append(curso)
+        return cursos
+
+    cursos, bytes_cursos = bytes_asignados(crear_cursos)
+
+    def calificar():
+        total = 0
+        for curso in cursos:
+            inscritos = curso.estudiantes_inscritos
+            for evaluacion in curso.evaluaciones:
+                total += plataforma.registrar_calificaciones_lote(
+                    evaluacion.id, [(estudiante_id, estudiante_id % 101) for estudiante_id in inscritos])['aceptadas']
+        return total
+
+    calificaciones, bytes_calificaciones = bytes_asignados(calificar)
+    # La matriz se reserva al inscribir y crear evaluaciones: se atribuye a las calificaciones
+    bytes_matrices = sum(curso._matriz.nbytes for curso in cursos)
+    bytes_cursos -= bytes_matrices
+    bytes_calificaciones += bytes_matrices
+
+    # Ahorro de slots por objeto de dominio (sin contar los valores, compartidos)
+    curso = cursos[0]
+    examen, tarea = (next(e for e in curso.evaluaciones if isinstance(e, clase)) for clase in (Examen, Tarea))
+    ahorro_usuario = ahorro_por_instancia(Estudiante, plataforma._usuarios[ids[0]])
+    ahorro_curso = (ahorro_por_instancia(Curso, curso)
+                    + _EVALUACIONES_POR_CURSO / 2 * (ahorro_por_instancia(Examen, examen)
+                                                     + ahorro_por_instancia(Tarea, tarea)))
+    tracemalloc.stop()
+
+    return [
+        ('usuario', bytes_usuarios / usuarios, ahorro_usuario),
+        ('curso', bytes_cursos / len(cursos), ahorro_curso),
+        ('calificación', bytes_calificaciones / calificaciones, 0.0)  # Celdas de la matriz, sin objetos
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--usuarios', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for usuarios in args.usuarios:
+        print(f"{usuarios:,} usuarios:")
+        print(f"  {'':16}{'sin __slots__':>16}{'con __slots__':>16}")
+        for nombre, medido, ahorro in medir(usuarios):
+            print(f"  {nombre:16}{medido + ahorro:>14.0f} B{medido:>14.0f} B")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""
+SUITE DE BENCHMARKS DE PlataformaCursos
+Genera plataformas sintéticas (benchmarks/generador.py) de varios tamaños y
+mide el tiempo por operación de los métodos principales: registros,
+inscripciones, calificaciones, promedios, reportes y listados. Los resultados
+se emiten como JSON; con --comparar se contrastan con una línea base guardada
+y el programa termina con código 1 si alguna operación empeoró más que la
+tolerancia.
+
+Uso:
+    python benchmarks/bench_plataforma.py --tamanos 1000 10000 100000 --salida base.json
+    python benchmarks/bench_plataforma.py --tamanos 1000 10000 100000 --comparar base.json [--tolerancia 0.25]
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime
+
+import numpy as np
+
+from generador import generar_plataforma
+
+from CacheReportes import CacheReportes
+
+def cronometrar(operacion, cantidad, repeticiones):
+    """
+    Para operaciones que modifican datos: ejecuta operacion(i) con un i
+    distinto cada vez, `cantidad` veces por repetición, y devuelve el mejor
+    tiempo por operación en microsegundos. Como timeit, el recolector de
+    ciclos se pausa mientras se mide.
+    """
+    mejor = float('inf')
+    recolector_activo = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for repeticion in range(repeticiones):
+            desplazamiento = repeticion * cantidad
+            inicio = time.perf_counter()
+            for indice in range(desplazamiento, desplazamiento + cantidad):
+                operacion(indice)
+            mejor = min(mejor, time.perf_counter() - inicio)
+    finally:
+        if recolector_activo:
+            gc.enable()
+    return mejor / cantidad * 1e6
+
+def cronometrar_consulta(consulta, repeticiones):
+    """
+    Para consultas: timeit elige cuántas llamadas hacen falta para medir al
+    menos 0,2 s y se toma la mejor de `repeticiones` mediciones (us por llamada).
+    """
+    cronometro = timeit.Timer(consulta)
+    llamadas, _ = cronometro.autorange()
+    return min(cronometro.repeat(repeticiones, llamadas)) / llamadas * 1e6
+
+def calibrar(repeticiones):
+    """
+    Tiempo (us) de una carga fija de Python y NumPy, medido en la misma
+    corrida. Las comparaciones dividen por este valor para descontar que la
+    máquina esté más lenta o más rápida que cuando se tomó la línea base.
+    """
+    registro = {numero: str(numero) for numero in range(2000)}
+    valores = np.arange(2000, dtype=np.float64)
+    return cronometrar_consulta(lambda: (sorted(registro.values()), np.flatnonzero(valores < 1000).tolist()),
+                                repeticiones)
+
+def medir_tamano(usuarios, args):
+    """Genera una plataforma de `usuarios` usuarios y mide cada operación"""
+    cursos = args.cursos or max(5, usuarios // 500)
+    # Sin caché: los reportes se miden calculándose en cada llamada
+    plataforma, datos = generar_plataforma(usuarios, cursos, args.inscripciones, args.evaluaciones,
+                                           args.densidad, semilla=args.semilla,
+                                           cache_reportes=CacheReportes(tamano_maximo=0))
+    aleatorio = np.random.default_rng(args.semilla + 1)
+    estudiantes = datos['estudiantes']
+    ids_cursos = datos['cursos']
+    n = args.operaciones
+    r = args.repeticiones
+
+    # Pares (estudiante, curso) para consultas: inscritos reales elegidos al azar
+    pares = []
+    for curso_id in aleatorio.choice(ids_cursos, min(len(ids_cursos), 64)).tolist():
+        inscritos = plataforma.obtener_ids_estudiantes_curso(curso_id)
+        pares.extend((int(estudiante_id), curso_id) for estudiante_id in aleatorio.choice(inscritos, 16))
+    evaluaciones = {curso_id: plataforma.obtener_evaluaciones_curso(curso_id)[0].id for curso_id in ids_cursos}
+
+    resultados = {}
+    resultados['registrar_usuario'] = cronometrar(
+        lambda i: plataforma.registrar_usuario("estudiante", f"Nuevo {i}", f"nuevo{i}@bench.test"), n, r)
+
+    # Inscripciones nuevas: los estudiantes recién registrados en cursos al azar
+    nuevos = plataforma.obtener_ids_ordenados("estudiante")[-n * r:]
+    cursos_destino = aleatorio.choice(ids_cursos, n * r).tolist()
+    resultados['inscribir_estudiante_curso'] = cronometrar(
+        lambda i: plataforma.inscribir_estudiante_curso(nuevos[i], cursos_destino[i]), n, r)
+
+    resultados['registrar_calificacion'] = cronometrar(
+        lambda i: plataforma.registrar_calificacion(evaluaciones[pares[i % len(pares)][1]],
+                                                    pares[i % len(pares)][0], i % 101), n, r)
+
+    # Consultas: cada llamada toma el siguiente par, curso o cursor de la lista
+    siguiente_par = itertools.cycle(pares).__next__
+    siguiente_curso = itertools.cycle(ids_cursos).__next__
+    siguiente_cursor = itertools.cycle(aleatorio.choice(estudiantes, 1024).tolist()).__next__
+    consultas = {
+        'obtener_promedio_estudiante': lambda: plataforma.obtener_promedio_estudiante(*siguiente_par()),
+        'generar_reporte_promedios_bajos': lambda: plataforma.generar_reporte_promedios_bajos(siguiente_curso(), 60),
+        'obtener_estudiantes_curso': lambda: plataforma.obtener_estudiantes_curso(siguiente_curso()),
+        'obtener_todos_cursos': plataforma.obtener_todos_cursos,
+        'obtener_usuarios_por_tipo': lambda: plataforma.obtener_usuarios_por_tipo("estudiante"),
+        'paginar_usuarios_por_tipo': lambda: plataforma.paginar_usuarios_por_tipo("estudiante", siguiente_cursor(), 50),
+        'paginar_estudiantes_curso': lambda: plataforma.paginar_estudiantes_curso(siguiente_curso(), None, 50)
+    }
+    for nombre, consulta in consultas.items():
+        resultados[nombre] = cronometrar_consulta(consulta, r)
+
+    return {
+        'parametros': {'usuarios': usuarios, 'cursos': cursos, 'inscripciones_por_curso': args.inscripciones,
+                       'evaluaciones_por_curso': args.evaluaciones, 'densidad': args.densidad},
+        'us_por_operacion': {operacion: round(tiempo, 3) for operacion, tiempo in resultados.items()}
+    }
+
+def comparar(actual, base, tolerancia):
+    """
+    Imprime la comparación con la línea base y devuelve las operaciones que
+    empeoraron. El cambio se calcula sobre tiempos normalizados por la
+    calibración de cada corrida.
+    """
+    escala = base['metadatos']['calibracion_us'] / actual['metadatos']['calibracion_us']
+    print(f"calibración: {actual['metadatos']['calibracion_us']:.1f} us "
+          f"(línea base {base['metadatos']['calibracion_us']:.1f} us)")
+    regresiones = []
+    for tamano, medicion in actual['resultados'].items():
+        anteriores = base['resultados'].get(tamano)
+        if anteriores is None:
+            print(f"{tamano} usuarios: sin línea base")
+            continue
+        print(f"{tamano} usuarios:")
+        for operacion, tiempo in medicion['us_por_operacion'].items():
+            anterior = anteriores['us_por_operacion'].get(operacion)
+            if anterior is None:
+                print(f"  {operacion:34}{tiempo:>12.2f} us   (nueva)")
+                continue
+            cambio = tiempo * escala / anterior - 1 if anterior else 0.0
+            empeoro = cambio > tolerancia
+            if empeoro:
+                regresiones.append((tamano, operacion, cambio))
+            print(f"  {operacion:34}{tiempo:>12.2f} us {anterior:>12.2f} us {cambio:>+8.1%}"
+                  f"{'  REGRESIÓN' if empeoro else ''}")
+    return regresiones
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1000, 10000, 100000], help="usuarios")
+    parser.add_argument('--cursos', type=int, help="por defecto, uno cada 500 usuarios (mínimo 5)")
+    parser.add_argument('--inscripciones', type=int, default=200, help="inscritos por curso")
+    parser.add_argument('--evaluaciones', type=int, default=5, help="evaluaciones por curso")
+    parser.add_argument('--densidad', type=float, default=0.8, help="fracción de inscritos con nota")
+    parser.add_argument('--operaciones', type=int, default=5000, help="operaciones de escritura por medición")
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', help="archivo JSON donde guardar los resultados")
+    parser.add_argument('--comparar', help="línea base JSON contra la que comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.25, help="empeoramiento permitido (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    resultado = {
+        'metadatos': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'maquina': platform.platform(),
+            'nucleos': os.cpu_count(),
+            'semilla': args.semilla,
+            'operaciones': args.operaciones,
+            'repeticiones': args.repeticiones,
+            'calibracion_us': round(calibrar(args.repeticiones), 3)
+        },
+        'resultados': {str(usuarios): medir_tamano(usuarios, args) for usuarios in args.tamanos}
+    }
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+    if not args.comparar:
+        if not args.salida:
+            json.dump(resultado, sys.stdout, indent=2, ensure_ascii=False)
+            print()
+        return
+
+    with open(args.comparar, encoding='utf-8') as archivo:
+        base = json.load(archivo)
+    regresiones = comparar(resultado, base, args.tolerancia)
+    if regresiones:
+        print(f"{len(regresiones)} operaciones empeoraron más de {args.tolerancia:.0%}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
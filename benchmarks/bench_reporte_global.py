@@ -0,0 +1,74 @@
+"""
+BENCHMARK DEL REPORTE GLOBAL DE ESTUDIANTES EN RIESGO
+Compara recorrer todos los cursos con generar_reporte_promedios_bajos contra
+generar_reporte_riesgo_global con 1, 2, 4... trabajadores (hasta la cantidad
+de núcleos), con pool de hilos y de procesos, y muestra la aceleración.
+
+Uso: python benchmarks/bench_reporte_global.py [--cursos 400] [--por-curso 5000] [--umbral 15]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Plataforma import PlataformaCursos
+
+def preparar_plataforma(cursos, por_curso, evaluaciones):
+    """Plataforma con `cursos` cursos de `por_curso` estudiantes calificados"""
+    plataforma = PlataformaCursos()
+    instructor = plataforma.registrar_usuario("instructor", "Instructor", "instructor@bench")
+    ids = [estudiante.id for estudiante in plataforma.registrar_usuarios_lote(
+        [("estudiante", f"Estudiante {i}", f"estudiante{i}@bench") for i in range(por_curso * 4)])['registrados']]
+    for numero in range(cursos):
+        curso = plataforma.crear_curso(f"Curso {numero}", instructor.id)
+        inicio = (numero * por_curso // 2) % (len(ids) - por_curso)
+        inscritos = ids[inicio:inicio + por_curso]
+        plataforma.inscribir_estudiantes_lote(curso.id, inscritos)
+        for indice in range(evaluaciones):
+            evaluacion = plataforma.crear_evaluacion("tarea", f"Tarea {indice}", curso.id, 100)
+            plataforma.registrar_calificaciones_lote(
+                evaluacion.id, [(estudiante_id, (estudiante_id * 7 + indice * 13 + numero) % 101)
+                                for estudiante_id in inscritos])
+    return plataforma
+
+def cronometrar(funcion, repeticiones):
+    """Mejor tiempo de varias ejecuciones"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cursos', type=int, default=400)
+    parser.add_argument('--por-curso', type=int, default=5000)
+    parser.add_argument('--evaluaciones', type=int, default=3)
+    parser.add_argument('--umbral', type=float, default=15)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    plataforma = preparar_plataforma(args.cursos, args.por_curso, args.evaluaciones)
+    nucleos = os.cpu_count() or 1
+    print(f"{args.cursos} cursos x {args.por_curso} estudiantes, {nucleos} núcleos")
+
+    def recorrer_cursos():
+        return [plataforma.generar_reporte_promedios_bajos(curso.id, args.umbral)
+                for curso in plataforma.obtener_todos_cursos()]
+
+    base = cronometrar(recorrer_cursos, args.repeticiones)
+    print(f"  {'bucle por curso':24}{base:>9.3f} s")
+
+    trabajadores = sorted({2 ** potencia for potencia in range(nucleos.bit_length())} | {nucleos})
+    for ejecutor in ("hilos", "procesos"):
+        for cantidad in trabajadores:
+            tiempo = cronometrar(lambda: plataforma.generar_reporte_riesgo_global(args.umbral, cantidad, ejecutor),
+                                 args.repeticiones)
+            print(f"  {f'{ejecutor}, {cantidad} trabajadores':24}{tiempo:>9.3f} s  x{base / tiempo:.2f}")
+
+if __name__ == '__main__':
+    main()
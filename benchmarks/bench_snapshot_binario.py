@@ -0,0 +1,147 @@
+"""
+BENCHMARK DE ARRANQUE CON SNAPSHOT BINARIO
+Escribe un snapshot binario de una plataforma con N usuarios y mide el arranque
+en frío (abrir el snapshot), el costo de las primeras consultas y la memoria
+residente, comparado con reconstruir la plataforma desde el snapshot pickle.
+Antes de medir verifica que las consultas por curso sobre el snapshot recién
+abierto (sin materializar cursos) coincidan con la plataforma original, y
+termina con código 1 si no es así.
+
+Uso: python benchmarks/bench_snapshot_binario.py [--usuarios 2000000] [--cursos 200]
+"""
+
+import argparse
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from Plataforma import PlataformaCursos
+from SnapshotBinario import abrir_snapshot_binario, escribir_snapshot_binario
+
+# Cada medición de arranque corre en un proceso nuevo para medir memoria en frío.
+# Se usa VmHWM porque en Linux ru_maxrss conserva el máximo del proceso padre.
+_MEMORIA_MAXIMA = """
+def memoria_maxima_kb():
+    with open('/proc/self/status') as estado:
+        for linea in estado:
+            if linea.startswith('VmHWM:'):
+                return int(linea.split()[1])
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+_MEDIR_BINARIO = """
+import resource, sys, time
+sys.path.insert(0, {raiz!r})
+inicio = time.perf_counter()
+from SnapshotBinario import abrir_snapshot_binario
+plataforma = abrir_snapshot_binario({ruta!r})
+apertura = time.perf_counter() - inicio
+inicio = time.perf_counter()
+for i in range(1, 1001):
+    plataforma.obtener_usuario_por_email(f"estudiante{{i * 997 % {usuarios}}}@bench")
+plataforma.generar_reporte_promedios_bajos(1 + {cursos} // 2)
+consultas = time.perf_counter() - inicio
+print(apertura, consultas, memoria_maxima_kb())
+"""
+_MEDIR_PICKLE = """
+import pickle, resource, sys, time
+sys.path.insert(0, {raiz!r})
+inicio = time.perf_counter()
+from Plataforma import PlataformaCursos
+with open({ruta!r}, 'rb') as archivo:
+    datos = pickle.load(archivo)
+plataforma = PlataformaCursos()
+plataforma._cargar_datos(datos)
+print(time.perf_counter() - inicio, 0.0, memoria_maxima_kb())
+"""
+
+def preparar_plataforma(usuarios, cursos, evaluaciones):
+    """Plataforma con N estudiantes repartidos en cursos con calificaciones"""
+    plataforma = PlataformaCursos()
+    instructor = plataforma.registrar_usuario("instructor", "Instructor", "instructor@bench")
+    ids = [estudiante.id for estudiante in plataforma.registrar_usuarios_lote(
+        [("estudiante", f"Estudiante {i}", f"estudiante{i}@bench") for i in range(usuarios)])['registrados']]
+    por_curso = max(1, len(ids) // cursos)
+    for numero in range(cursos):
+        curso = plataforma.crear_curso(f"Curso {numero}", instructor.id)
+        inscritos = ids[numero * por_curso:(numero + 1) * por_curso]
+        plataforma.inscribir_estudiantes_lote(curso.id, inscritos)
+        for indice in range(evaluaciones):
+            evaluacion = plataforma.crear_evaluacion("tarea", f"Tarea {indice}", curso.id, 100)
+            plataforma.registrar_calificaciones_lote(
+                evaluacion.id, [(estudiante_id, (estudiante_id * 7 + indice) % 101) for estudiante_id in inscritos])
+    return plataforma
+
+def verificar_snapshot(original, ruta):
+    """
+    Compara las inscripciones que ve un snapshot recién abierto con las de la
+    plataforma original. Paginar y pedir los IDs va primero, antes de que nada
+    materialice el curso. Devuelve la lista de diferencias.
+    """
+    abierta = abrir_snapshot_binario(ruta)
+    ids_cursos = [curso.id for curso in original.obtener_todos_cursos()]
+    diferencias = []
+    for curso_id in ids_cursos:
+        pagina = [estudiante.id for estudiante in abierta.paginar_estudiantes_curso(curso_id)['elementos']]
+        if pagina != [estudiante.id for estudiante in original.paginar_estudiantes_curso(curso_id)['elementos']]:
+            diferencias.append(f"paginar_estudiantes_curso({curso_id})")
+        if (abierta.obtener_ids_estudiantes_curso(curso_id).tolist()
+                != original.obtener_ids_estudiantes_curso(curso_id).tolist()):
+            diferencias.append(f"obtener_ids_estudiantes_curso({curso_id})")
+    for curso_a, curso_b in zip(ids_cursos, ids_cursos[1:]):
+        if ([estudiante.id for estudiante in abierta.comparar_inscripciones(curso_a, curso_b, "union")]
+                != [estudiante.id for estudiante in original.comparar_inscripciones(curso_a, curso_b, "union")]):
+            diferencias.append(f"comparar_inscripciones({curso_a}, {curso_b})")
+    return diferencias
+
+def medir(codigo, **valores):
+    salida = subprocess.run([sys.executable, '-c', _MEMORIA_MAXIMA + codigo.format(raiz=RAIZ, **valores)],
+                            capture_output=True, text=True, check=True).stdout
+    apertura, consultas, memoria_kb = salida.split()
+    return float(apertura), float(consultas), int(memoria_kb) / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--usuarios', type=int, default=2_000_000)
+    parser.add_argument('--cursos', type=int, default=200)
+    parser.add_argument('--evaluaciones', type=int, default=5)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    plataforma = preparar_plataforma(args.usuarios, args.cursos, args.evaluaciones)
+    print(f"plataforma generada en {time.perf_counter() - inicio:.1f} s "
+          f"(memoria máxima {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB)")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_binario = os.path.join(directorio, 'snapshot.bin')
+        ruta_pickle = os.path.join(directorio, 'snapshot.pkl')
+        inicio = time.perf_counter()
+        escribir_snapshot_binario(plataforma, ruta_binario)
+        print(f"snapshot binario escrito en {time.perf_counter() - inicio:.2f} s "
+              f"({os.path.getsize(ruta_binario) / 1e6:.1f} MB)")
+        diferencias = verificar_snapshot(plataforma, ruta_binario)
+        if diferencias:
+            print(f"el snapshot no coincide con la plataforma en: {', '.join(diferencias[:10])}")
+            sys.exit(1)
+        print("consultas por curso sobre el snapshot: coinciden con la plataforma")
+        with open(ruta_pickle, 'wb') as archivo:
+            pickle.dump(plataforma.exportar_datos(), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        del plataforma
+
+        for nombre, codigo, ruta in (("binario (mmap)", _MEDIR_BINARIO, ruta_binario),
+                                     ("pickle", _MEDIR_PICKLE, ruta_pickle)):
+            apertura, consultas, memoria = medir(codigo, ruta=ruta, usuarios=args.usuarios, cursos=args.cursos)
+            print(f"{nombre}:")
+            print(f"  arranque:  {apertura:.3f} s")
+            if consultas:
+                print(f"  1000 búsquedas por email + 1 reporte: {consultas:.3f} s")
+            print(f"  memoria máxima: {memoria:.0f} MB")
+
+if __name__ == '__main__':
+    main()
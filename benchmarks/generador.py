@@ -0,0 +1,81 @@
+"""
+GENERADOR DE PLATAFORMAS SINTÉTICAS
+Crea una PlataformaCursos reproducible (misma semilla, mismos datos) con N
+usuarios, M cursos, una cantidad de inscripciones y evaluaciones por curso y
+una densidad de calificaciones. Usa las operaciones por lote de la plataforma
+para que generar millones de filas tome segundos.
+
+Uso como módulo:
+    from generador import generar_plataforma
+    plataforma, datos = generar_plataforma(usuarios=100000, cursos=200, semilla=1)
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Plataforma import PlataformaCursos
+
+_NOMBRES = ("Ana", "Bruno", "Carla", "Diego", "Elena", "Fabián", "Gabriela", "Héctor", "Isabel", "Julián",
+            "Karina", "Luis", "María", "Nicolás", "Olga", "Pablo", "Rosa", "Santiago", "Tania", "Valentina")
+_APELLIDOS = ("Álvarez", "Benítez", "Castro", "Díaz", "Espinoza", "Fernández", "García", "Herrera", "Ibáñez",
+              "Jiménez", "López", "Martínez", "Núñez", "Ortiz", "Pérez", "Quiroga", "Rojas", "Suárez", "Torres")
+_TEMAS = ("Python", "Bases de datos", "Redes", "Álgebra", "Estadística", "Diseño web", "Machine learning",
+          "Seguridad", "Sistemas operativos", "Compiladores")
+
+def generar_plataforma(usuarios=10000, cursos=50, inscripciones_por_curso=200, evaluaciones_por_curso=5,
+                       densidad_calificaciones=0.8, proporcion_instructores=0.01, semilla=0, **opciones):
+    """
+    Genera una plataforma y devuelve (plataforma, datos) con
+    datos = {'estudiantes': [ids], 'instructores': [ids], 'cursos': [ids],
+             'evaluaciones': [ids]}.
+    Los inscritos de cada curso se eligen al azar entre los estudiantes y cada
+    evaluación califica a una fracción `densidad_calificaciones` de ellos con
+    notas ~ Normal(70, 15) recortadas a [0, 100]. Las opciones restantes se
+    pasan al constructor de PlataformaCursos (almacenamiento, cache_reportes).
+    """
+    if not 0 <= densidad_calificaciones <= 1:
+        raise ValueError("La densidad de calificaciones debe estar entre 0 y 1")
+    aleatorio = np.random.default_rng(semilla)
+    plataforma = PlataformaCursos(**opciones)
+
+    cantidad_instructores = max(1, int(usuarios * proporcion_instructores))
+    filas = [("instructor" if numero < cantidad_instructores else "estudiante",
+              f"{_NOMBRES[numero % len(_NOMBRES)]} {_APELLIDOS[numero // len(_NOMBRES) % len(_APELLIDOS)]} {numero}",
+              f"usuario{numero}@generado.test")
+             for numero in range(usuarios)]
+    registrados = plataforma.registrar_usuarios_lote(filas)['registrados']
+    instructores = [usuario.id for usuario in registrados[:cantidad_instructores]]
+    estudiantes = np.array([usuario.id for usuario in registrados[cantidad_instructores:]], dtype=np.int64)
+
+    ids_cursos, ids_evaluaciones = [], []
+    por_curso = min(inscripciones_por_curso, len(estudiantes))
+    for numero in range(cursos):
+        curso = plataforma.crear_curso(f"{_TEMAS[numero % len(_TEMAS)]} {numero}",
+                                       instructores[numero % len(instructores)])
+        ids_cursos.append(curso.id)
+        inscritos = aleatorio.choice(estudiantes, por_curso, replace=False) if por_curso else estudiantes[:0]
+        plataforma.inscribir_estudiantes_lote(curso.id, inscritos.tolist())
+
+        for indice in range(evaluaciones_por_curso):
+            if indice % 2:
+                evaluacion = plataforma.crear_evaluacion("examen", f"Examen {indice}", curso.id, 100,
+                                                         tiempo_limite=90)
+            else:
+                evaluacion = plataforma.crear_evaluacion("tarea", f"Tarea {indice}", curso.id, 100,
+                                                         fecha_entrega=datetime(2025, 1, 1 + indice % 28))
+            ids_evaluaciones.append(evaluacion.id)
+            calificados = inscritos[aleatorio.random(len(inscritos)) < densidad_calificaciones]
+            notas = np.clip(aleatorio.normal(70, 15, len(calificados)), 0, 100).round(1)
+            plataforma.registrar_calificaciones_lote(evaluacion.id, list(zip(calificados.tolist(), notas.tolist())))
+
+    return plataforma, {
+        'estudiantes': estudiantes.tolist(),
+        'instructores': instructores,
+        'cursos': ids_cursos,
+        'evaluaciones': ids_evaluaciones
+    }
@@ -0,0 +1,53 @@
+"""
+GESTIÓN DE CURSOS ONLINE
+Punto de entrada importable de la plataforma. Cada nombre se carga la primera
+vez que se usa (PEP 562): `import gestion_cursos` no importa NumPy, y
+`from gestion_cursos import PlataformaCursos` carga solo el modelo, sin los
+motores de almacenamiento, los snapshots ni el menú.
+"""
+
+import importlib
+
+# Nombre exportado -> módulo que lo define
+_EXPORTADOS = {
+    # Modelo y excepciones
+    'PlataformaCursos': 'Plataforma',
+    'PlataformaError': 'Plataforma',
+    'UsuarioYaRegistradoError': 'Plataforma',
+    'CursoInexistenteError': 'Plataforma',
+    'Usuario': 'Plataforma',
+    'Estudiante': 'Plataforma',
+    'Instructor': 'Plataforma',
+    'Curso': 'Plataforma',
+    'Evaluacion': 'Plataforma',
+    'Examen': 'Plataforma',
+    'Tarea': 'Plataforma',
+    'leer_filas_archivo': 'Plataforma',
+    # Estructuras auxiliares
+    'ConjuntoEnteros': 'ConjuntoEnteros',
+    'CacheReportes': 'CacheReportes',
+    'Instrumentacion': 'Instrumentacion',
+    'PerfiladorLento': 'Perfilado',
+    # Motores de almacenamiento y snapshots
+    'Almacenamiento': 'Almacenamiento',
+    'AlmacenamientoSQLite': 'Almacenamiento',
+    'AlmacenamientoBitacora': 'Bitacora',
+    'escribir_snapshot_binario': 'SnapshotBinario',
+    'abrir_snapshot_binario': 'SnapshotBinario',
+    # Menú interactivo
+    'ejecutar_sistema_con_menu': 'Menu',
+    'crear_plataforma': 'Menu'
+}
+
+__all__ = list(_EXPORTADOS)
+
+def __getattr__(nombre):
+    modulo = _EXPORTADOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo), nombre)
+    globals()[nombre] = valor  # Las siguientes consultas no pasan por aquí
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTADOS))
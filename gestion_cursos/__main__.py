@@ -0,0 +1,6 @@
+"""Inicia el menú interactivo: python -m gestion_cursos [--db archivo.sqlite | --bitacora directorio]"""
+
+from Menu import main
+
+if __name__ == "__main__":
+    main()
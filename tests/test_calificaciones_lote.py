@@ -0,0 +1,55 @@
+"""Carga de calificaciones por lotes con filas mal formadas o fuera de rango"""
+
+import math
+
+from Plataforma import PlataformaCursos
+
+def armar_curso(cantidad=4):
+    """Plataforma con un curso de `cantidad` inscritos y un examen de 100 puntos"""
+    plataforma = PlataformaCursos()
+    instructor = plataforma.registrar_usuario("instructor", "Profesor", "profesor@ejemplo.com")
+    estudiantes = [plataforma.registrar_usuario("estudiante", f"Estudiante {i}", f"e{i}@ejemplo.com").id
+                   for i in range(cantidad)]
+    curso = plataforma.crear_curso("Curso", instructor.id)
+    plataforma.inscribir_estudiantes_lote(curso.id, estudiantes)
+    evaluacion = plataforma.crear_evaluacion("examen", "Parcial", curso.id, 100, tiempo_limite=60)
+    return plataforma, evaluacion, estudiantes
+
+def test_filas_no_numericas_no_descartan_el_lote():
+    plataforma, evaluacion, (e1, e2, e3, e4) = armar_curso()
+    resultado = plataforma.registrar_calificaciones_lote(evaluacion.id, [
+        (e1, 80), (e2, 'abc'), {'estudiante_id': e3, 'calificacion': ''}, (e4, '65.5'), ('x', 10)])
+    assert resultado['aceptadas'] == 2
+    assert resultado['rechazadas'] == 3
+    assert [error['fila'] for error in resultado['errores']] == [2, 3, 5]
+    assert evaluacion.obtener_calificacion(e1) == 80
+    assert evaluacion.obtener_calificacion(e4) == 65.5
+    assert evaluacion.obtener_calificacion(e2) is None
+
+def test_csv_con_celdas_vacias(tmp_path):
+    plataforma, evaluacion, (e1, e2, e3, e4) = armar_curso()
+    ruta = tmp_path / "notas.csv"
+    ruta.write_text(f"estudiante_id,calificacion\n{e1},90\n{e2},\n{e3},no rindió\n{e4},40\n", encoding='utf-8')
+    resultado = plataforma.cargar_calificaciones_desde_archivo(evaluacion.id, str(ruta), tamano_lote=3)
+    assert resultado['aceptadas'] == 2
+    assert resultado['rechazadas'] == 2
+    assert [error['fila'] for error in resultado['errores']] == [2, 3]
+    assert evaluacion.obtener_calificacion(e4) == 40
+
+def test_calificaciones_no_finitas_se_rechazan():
+    plataforma, evaluacion, (e1, e2, e3, _) = armar_curso()
+    resultado = plataforma.registrar_calificaciones_lote(evaluacion.id, [
+        (e1, math.nan), (e2, math.inf), (e3, 100)])
+    assert resultado['aceptadas'] == 1
+    assert resultado['rechazadas'] == 2
+
+def test_repetidos_vale_la_ultima_fila_valida():
+    plataforma, evaluacion, (e1, e2, e3, _) = armar_curso()
+    resultado = plataforma.registrar_calificaciones_lote(evaluacion.id, [
+        (e3, math.nan), (e3, 50), (e1, 10), (e2, 30), (e1, 20), (e1, 500)])
+    # Rechazadas: el NaN, la primera de e1 (reemplazada) y la fuera de rango
+    assert resultado['aceptadas'] == 3
+    assert [error['fila'] for error in resultado['errores']] == [1, 3, 6]
+    assert evaluacion.obtener_calificacion(e3) == 50
+    assert evaluacion.obtener_calificacion(e1) == 20
+    assert evaluacion.obtener_calificacion(e2) == 30
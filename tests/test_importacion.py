@@ -0,0 +1,28 @@
+"""
+Presupuesto de tiempo de importación (benchmarks/bench_importacion.py). En
+máquinas lentas PLATAFORMA_FACTOR_IMPORTACION multiplica los presupuestos;
+la verificación de módulos perezosos no depende de la velocidad.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+_RUTA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     'benchmarks', 'bench_importacion.py')
+
+@pytest.fixture(scope='module')
+def resultados():
+    especificacion = importlib.util.spec_from_file_location('bench_importacion', _RUTA)
+    modulo = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(modulo)
+    return modulo.verificar(repeticiones=3, factor=float(os.environ.get('PLATAFORMA_FACTOR_IMPORTACION', 1.0)))
+
+def test_modulos_perezosos_no_se_cargan(resultados):
+    for resultado in resultados:
+        assert resultado['cargados'] == [], resultado['sentencia']
+
+def test_tiempo_de_importacion_dentro_del_presupuesto(resultados):
+    for resultado in resultados:
+        assert resultado['tiempo_ms'] <= resultado['limite_ms'], resultado